@@ -71,6 +71,161 @@ class LinkedList:
         return count
 
 
+class ConsNode:
+    """Неизменяемый узел персистентного списка."""
+
+    __slots__ = ("data", "next")
+
+    def __init__(self, data, next_node=None):
+        """Инициализация узла (после создания поля менять нельзя)."""
+        object.__setattr__(self, "data", data)
+        object.__setattr__(self, "next", next_node)
+
+    def __setattr__(self, name, value):
+        """Запрет изменения узла: хвост могут разделять много версий."""
+        raise AttributeError("ConsNode неизменяем")
+
+    def __delattr__(self, name):
+        """Запрет удаления полей узла."""
+        raise AttributeError("ConsNode неизменяем")
+
+
+class PersistentList:
+    """
+    Персистентный (неизменяемый) односвязный список.
+
+    Каждая операция модификации возвращает новую версию, которая
+    разделяет хвост с исходной. Старые версии остаются корректными,
+    поэтому их можно безопасно читать из нескольких потоков без
+    блокировок и хранить как снимки без копирования.
+    """
+
+    __slots__ = ("_head", "_size")
+
+    def __init__(self, iterable=None):
+        """
+        Инициализация списка из итерируемого объекта.
+
+        Сложность: O(n), где n - длина iterable.
+        """
+        head = None
+        size = 0
+        if iterable is not None:
+            for data in reversed(list(iterable)):
+                head = ConsNode(data, head)
+                size += 1
+        object.__setattr__(self, "_head", head)
+        object.__setattr__(self, "_size", size)
+
+    @classmethod
+    def _from_node(cls, head, size):
+        """Создание версии по готовому узлу без копирования. O(1)."""
+        version = cls.__new__(cls)
+        object.__setattr__(version, "_head", head)
+        object.__setattr__(version, "_size", size)
+        return version
+
+    @classmethod
+    def from_linked_list(cls, linked):
+        """
+        Снимок изменяемого LinkedList в персистентный список.
+
+        Сложность: O(n).
+        """
+        return cls(linked.traversal())
+
+    def __setattr__(self, name, value):
+        """Запрет изменения версии списка."""
+        raise AttributeError("PersistentList неизменяем")
+
+    def prepend(self, data):
+        """
+        Новая версия с элементом в начале. Сложность O(1).
+
+        Хвост новой версии - это текущая версия, узлы не копируются.
+        """
+        return PersistentList._from_node(
+            ConsNode(data, self._head), self._size + 1
+        )
+
+    def first(self):
+        """Первый элемент. Сложность O(1)."""
+        if self._head is None:
+            raise IndexError("first из пустого списка")
+        return self._head.data
+
+    def rest(self):
+        """Версия без первого элемента (разделяет узлы). O(1)."""
+        if self._head is None:
+            raise IndexError("rest из пустого списка")
+        return PersistentList._from_node(self._head.next, self._size - 1)
+
+    def delete_from_start(self):
+        """
+        Удаление из начала. Сложность O(1).
+
+        Returns:
+            Пара (значение, новая версия списка). Для пустого списка
+            возвращается (None, self), как и в LinkedList.
+        """
+        if self._head is None:
+            return None, self
+        return self._head.data, self.rest()
+
+    def reverse(self):
+        """Развернутая копия списка. Сложность O(n)."""
+        head = None
+        current = self._head
+        while current is not None:
+            head = ConsNode(current.data, head)
+            current = current.next
+        return PersistentList._from_node(head, self._size)
+
+    def traversal(self) -> list:
+        """Обход списка. Сложность O(n)."""
+        return list(self)
+
+    def is_empty(self) -> bool:
+        """Проверка на пустоту. Сложность O(1)."""
+        return self._head is None
+
+    def size(self) -> int:
+        """Размер списка. Сложность O(1), размер хранится в версии."""
+        return self._size
+
+    def __len__(self):
+        """Размер списка. O(1)."""
+        return self._size
+
+    def __iter__(self):
+        """Итерация от головы к хвосту. O(n)."""
+        current = self._head
+        while current is not None:
+            yield current.data
+            current = current.next
+
+    def __eq__(self, other):
+        """Поэлементное сравнение. O(n), O(1) для общих хвостов."""
+        if not isinstance(other, PersistentList):
+            return NotImplemented
+        if self._size != other._size:
+            return False
+        a, b = self._head, other._head
+        while a is not b:
+            if a.data != b.data:
+                return False
+            a, b = a.next, b.next
+        return True
+
+    def __hash__(self):
+        """Хеш по содержимому (список неизменяем)."""
+        return hash(tuple(self))
+
+    def __repr__(self):
+        """Строковое представление."""
+        return f"PersistentList({self.traversal()})"
+
+
 if __name__ == "__main__":
     # Демонстрация работы связного списка
     ll = LinkedList()
@@ -81,3 +236,10 @@ if __name__ == "__main__":
     print("Размер:", ll.size())
     print("Удалено:", ll.delete_from_start())
     print("После удаления:", ll.traversal())
+
+    # Демонстрация персистентного списка
+    v1 = PersistentList([1, 2, 3])
+    v2 = v1.prepend(0)
+    print("Версия 1:", v1.traversal())
+    print("Версия 2:", v2.traversal())
+    print("Хвост версии 2 совпадает с версией 1:", v2.rest() == v1)
@@ -1,8 +1,14 @@
 """Сравнительный анализ производительности структур данных."""
+import gc
+import json
+import platform
+import statistics
 import timeit
+import tracemalloc
 from collections import deque
+from itertools import islice
 import matplotlib.pyplot as plt
-from linked_list import LinkedList
+from linked_list import LinkedList, PersistentList
 
 
 def compare_insert_start(sizes: list[int]) -> tuple[list[float], list[float]]:
@@ -57,6 +63,280 @@ def compare_queue(sizes: list[int]) -> tuple[list[float], list[float]]:
     return deque_times, list_pop_times
 
 
+def _build_linked_list(items) -> LinkedList:
+    """Построение LinkedList из итерируемого объекта."""
+    linked = LinkedList()
+    for item in items:
+        linked.insert_at_end(item)
+    return linked
+
+
+def _iterate_linked_list(linked: LinkedList) -> None:
+    """Проход по узлам LinkedList без создания списка."""
+    current = linked.head
+    while current:
+        current = current.next
+
+
+def _linked_list_get(linked: LinkedList, index: int):
+    """Доступ по индексу в LinkedList. Сложность O(index)."""
+    current = linked.head
+    for _ in range(index):
+        current = current.next
+    return current.data
+
+
+def _linked_list_extend(linked: LinkedList, items) -> None:
+    """Добавление элементов в конец LinkedList."""
+    for item in items:
+        linked.insert_at_end(item)
+
+
+# Блок элементов для операции extend
+EXTEND_BLOCK = list(range(100))
+
+# Конструкторы структур из итерируемого объекта
+SEQUENCE_STRUCTURES = {
+    "list": list,
+    "deque": deque,
+    "LinkedList": _build_linked_list,
+    "PersistentList": PersistentList,
+}
+
+# Матрица операция x структура. Операция - инструкция над структурой s
+# и индексом i < n; персистентные структуры присваивают s новую версию.
+# None - операция не поддерживается структурой.
+SEQUENCE_OPERATIONS = {
+    "push_front": {
+        "list": "s.insert(0, i)",
+        "deque": "s.appendleft(i)",
+        "LinkedList": "s.insert_at_start(i)",
+        "PersistentList": "s = s.prepend(i)",
+    },
+    "push_back": {
+        "list": "s.append(i)",
+        "deque": "s.append(i)",
+        "LinkedList": "s.insert_at_end(i)",
+        "PersistentList": None,
+    },
+    "pop_front": {
+        "list": "s.pop(0)",
+        "deque": "s.popleft()",
+        "LinkedList": "s.delete_from_start()",
+        "PersistentList": "s = s.rest()",
+    },
+    "pop_back": {
+        "list": "s.pop()",
+        "deque": "s.pop()",
+        "LinkedList": None,
+        "PersistentList": None,
+    },
+    "iterate": {
+        "list": "deque(s, maxlen=0)",
+        "deque": "deque(s, maxlen=0)",
+        "LinkedList": "_iterate_linked_list(s)",
+        "PersistentList": "deque(s, maxlen=0)",
+    },
+    "index": {
+        "list": "s[i]",
+        "deque": "s[i]",
+        "LinkedList": "_linked_list_get(s, i)",
+        "PersistentList": "next(islice(s, i, None))",
+    },
+    "extend": {
+        "list": "s.extend(EXTEND_BLOCK)",
+        "deque": "s.extend(EXTEND_BLOCK)",
+        "LinkedList": "_linked_list_extend(s, EXTEND_BLOCK)",
+        "PersistentList": None,
+    },
+}
+
+# Имена, доступные инструкциям операций
+_OPERATION_NAMESPACE = {
+    "deque": deque,
+    "islice": islice,
+    "EXTEND_BLOCK": EXTEND_BLOCK,
+    "_iterate_linked_list": _iterate_linked_list,
+    "_linked_list_get": _linked_list_get,
+    "_linked_list_extend": _linked_list_extend,
+}
+
+
+def _operation_loop(statement: str) -> str:
+    """
+    Цикл по индексам с операцией в теле.
+
+    Операция выполняется как инструкция, без вызова функции-обертки,
+    поэтому в замер не попадают накладные расходы на вызов.
+    """
+    return f"for i in arguments:\n    {statement}"
+
+
+def measure_structure_memory(name: str, n: int) -> dict:
+    """
+    Память, занимаемая структурой из n элементов (tracemalloc).
+
+    Структура заполняется малыми кешируемыми int, поэтому в замер
+    попадают только накладные расходы самой структуры.
+    """
+    build = SEQUENCE_STRUCTURES[name]
+    items = [i % 256 for i in range(n)]
+    gc.collect()
+    tracemalloc.start()
+    structure = build(items)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return {
+        "structure": name,
+        "size": n,
+        "bytes": current,
+        "peak_bytes": peak,
+        "bytes_per_element": current / n if n else 0.0,
+    }
+
+
+def measure_operation(name: str, operation_name: str, n: int,
+                      count: int = 100, repeats: int = 15) -> dict | None:
+    """
+    Замер одной ячейки матрицы: операция над структурой размера n.
+
+    Серия из count операций замеряется timeit как один цикл; время
+    пустого цикла по тем же индексам вычитается. Для каждого повтора
+    структура строится заново (в setup, вне замера), поэтому размер не
+    растет между замерами. Время приводится к одной операции.
+
+    Returns:
+        Словарь с минимумом, медианой и средним временем (мкс) и пиком
+        памяти операции или None, если операция не поддерживается или
+        структура пуста (n = 0).
+    """
+    statement = SEQUENCE_OPERATIONS[operation_name][name]
+    if statement is None or n < 1:
+        return None
+    build = SEQUENCE_STRUCTURES[name]
+    count = min(count, n)
+    # Индексы равномерно распределены по структуре
+    arguments = [k * n // count for k in range(count)]
+    namespace = dict(_OPERATION_NAMESPACE, build=build, n=n,
+                     arguments=arguments)
+
+    # timeit отключает сборщик мусора на время замера
+    timer = timeit.Timer(_operation_loop(statement),
+                         setup="s = build(range(n))", globals=namespace)
+    baseline = min(timeit.Timer(_operation_loop("pass"),
+                                globals=namespace).repeat(repeats, 1))
+    samples = sorted(
+        max(0.0, elapsed - baseline) / count * 1e6
+        for elapsed in timer.repeat(repeats, 1)
+    )
+
+    # Память замеряется отдельно: tracemalloc искажает время
+    code = compile(_operation_loop(statement), "<operation>", "exec")
+    namespace["s"] = build(range(n))
+    tracemalloc.start()
+    exec(code, namespace)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "structure": name,
+        "operation": operation_name,
+        "size": n,
+        "count": count,
+        "repeats": repeats,
+        "min_us": samples[0],
+        "median_us": statistics.median(samples),
+        "mean_us": statistics.fmean(samples),
+        "peak_bytes": peak,
+    }
+
+
+def run_benchmark_matrix(sizes: list[int], count: int = 100,
+                         repeats: int = 15) -> dict:
+    """
+    Полная матрица операция x структура для всех размеров.
+
+    Returns:
+        Словарь с описанием окружения, замерами операций и памяти.
+    """
+    operations = []
+    memory = []
+    for n in sizes:
+        for name in SEQUENCE_STRUCTURES:
+            memory.append(measure_structure_memory(name, n))
+            for operation_name in SEQUENCE_OPERATIONS:
+                record = measure_operation(name, operation_name, n,
+                                           count, repeats)
+                if record is not None:
+                    operations.append(record)
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "parameters": {"sizes": sizes, "count": count, "repeats": repeats},
+        "operations": operations,
+        "memory": memory,
+    }
+
+
+def save_matrix_json(results: dict,
+                     filename: str = "benchmark_matrix.json") -> None:
+    """Сохранение результатов матрицы в JSON."""
+    with open(filename, "w", encoding="utf-8") as file:
+        json.dump(results, file, ensure_ascii=False, indent=2)
+
+
+def compare_matrix_json(old_filename: str,
+                        new_filename: str) -> dict[tuple, float]:
+    """
+    Сравнение двух запусков матрицы (например, разных версий).
+
+    Returns:
+        Отношение медиан new / old для каждой пары
+        (структура, операция, размер), присутствующей в обоих файлах.
+    """
+    with open(old_filename, encoding="utf-8") as file:
+        old = json.load(file)
+    with open(new_filename, encoding="utf-8") as file:
+        new = json.load(file)
+
+    def index(results):
+        return {(r["structure"], r["operation"], r["size"]): r["median_us"]
+                for r in results["operations"]}
+
+    old_index = index(old)
+    ratios = {}
+    for key, median in index(new).items():
+        if key in old_index and old_index[key] > 0:
+            ratios[key] = median / old_index[key]
+    return ratios
+
+
+def print_matrix(results: dict) -> None:
+    """Вывод медиан матрицы в виде таблицы."""
+    structures = list(SEQUENCE_STRUCTURES)
+    for n in results["parameters"]["sizes"]:
+        print(f"\nN = {n}, медиана на операцию (мкс):")
+        print(f"{'операция':12}" +
+              "".join(f"{name:>16}" for name in structures))
+        cells = {(r["operation"], r["structure"]): r["median_us"]
+                 for r in results["operations"] if r["size"] == n}
+        for operation_name in SEQUENCE_OPERATIONS:
+            row = ""
+            for name in structures:
+                value = cells.get((operation_name, name))
+                row += f"{'-':>16}" if value is None else f"{value:16.3f}"
+            print(f"{operation_name:12}{row}")
+        print(f"{'байт/элем.':12}" + "".join(
+            f"{r['bytes_per_element']:16.1f}"
+            for r in results["memory"] if r["size"] == n
+        ))
+
+
 def plot_insert_graph(sizes: list[int], list_times: list[float],
                       linked_times: list[float]) -> None:
     """График сравнения вставки в начало."""
@@ -100,6 +380,11 @@ def main() -> None:
     plot_insert_graph(sizes, list_times, linked_times)
     plot_queue_graph(sizes, deque_times, list_pop_times)
 
+    print("Запуск матрицы операций по структурам...")
+    matrix = run_benchmark_matrix([1000, 10000, 100000])
+    print_matrix(matrix)
+    save_matrix_json(matrix)
+
     pc_info = """
 Характеристики ПК для тестирования:
 - Процессор: Intel(R) Xeon(R) CPU E3-1270 v3 @ 3.50GHz
@@ -111,6 +396,7 @@ def main() -> None:
     print("Графики сохранены:")
     print("- insert_comparison.png")
     print("- queue_comparison.png")
+    print("Матрица замеров сохранена: benchmark_matrix.json")
 
 
 if __name__ == "__main__":
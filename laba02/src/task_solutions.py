@@ -1,5 +1,9 @@
 """Решение практических задач с использованием структур данных."""
+import math
+import operator
+import re
 from collections import deque
+from functools import lru_cache
 from linked_list import LinkedList
 
 
@@ -23,6 +27,334 @@ def is_balanced_brackets(expression: str) -> bool:
     return len(stack) == 0
 
 
+# Токены выражения: число, идентификатор или оператор/скобка
+_TOKEN_RE = re.compile(
+    r"\s*(?:(?P<num>(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?)"
+    r"|(?P<name>[A-Za-z_]\w*)"
+    r"|(?P<op><=|>=|==|!=|[-+*/%^<>(),\[\]{}]))"
+)
+
+# Бинарные операторы: приоритет и правая ассоциативность
+_BINARY_OPERATORS = {
+    '<': (1, False), '<=': (1, False), '>': (1, False),
+    '>=': (1, False), '==': (1, False), '!=': (1, False),
+    '+': (2, False), '-': (2, False),
+    '*': (3, False), '/': (3, False), '%': (3, False),
+    '^': (5, True),
+}
+# Унарный минус связывает слабее степени: -2^2 == -4
+_UNARY_PRECEDENCE = 4
+
+_SCALAR_BINARY = {
+    '<': operator.lt, '<=': operator.le, '>': operator.gt,
+    '>=': operator.ge, '==': operator.eq, '!=': operator.ne,
+    '+': operator.add, '-': operator.sub, '*': operator.mul,
+    '/': operator.truediv, '%': operator.mod, '^': operator.pow,
+}
+
+# Функции: арность и реализация для скалярных значений
+_FUNCTION_ARITY = {'abs': 1, 'sqrt': 1, 'min': 2, 'max': 2}
+_SCALAR_FUNCTIONS = {
+    'abs': abs, 'sqrt': math.sqrt, 'min': min, 'max': max,
+}
+
+# Коды инструкций RPN-программы
+OP_CONST = 0
+OP_LOAD = 1
+OP_BINARY = 2
+OP_NEGATE = 3
+OP_CALL = 4
+
+
+def tokenize_expression(expression: str) -> list[tuple[str, object]]:
+    """
+    Разбиение инфиксного выражения на токены.
+
+    Returns:
+        Список пар (тип, значение), где тип - 'num', 'name' или 'op'.
+
+    Сложность: O(n), где n - длина выражения.
+    """
+    tokens = []
+    pos = 0
+    length = len(expression)
+    while pos < length:
+        match = _TOKEN_RE.match(expression, pos)
+        if match is None:
+            rest = expression[pos:]
+            if rest.strip() == "":
+                break
+            pos += len(rest) - len(rest.lstrip())
+            raise ValueError(
+                f"Недопустимый символ в позиции {pos}: "
+                f"'{expression[pos]}'"
+            )
+        pos = match.end()
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == 'num':
+            value = float(text) if any(c in text for c in '.eE') \
+                else int(text)
+            tokens.append(('num', value))
+        else:
+            tokens.append((kind, text))
+    return tokens
+
+
+def _to_rpn(tokens: list[tuple[str, object]]) -> list[tuple[int, object]]:
+    """
+    Перевод токенов в обратную польскую запись (сортировочная станция).
+
+    Стек операторов хранит и открывающие скобки, как в
+    is_balanced_brackets: закрывающая скобка должна совпасть по типу
+    с вершиной стека.
+
+    Сложность: O(n), где n - количество токенов.
+    """
+    brackets = {')': '(', '}': '{', ']': '['}
+    output = []
+    # Элементы стека: ('op', символ), ('neg', None), ('call', имя),
+    # ('(', открывающая скобка)
+    stack = []
+    expect_operand = True
+
+    def pop_operator():
+        kind, value = stack.pop()
+        if kind == 'op':
+            output.append((OP_BINARY, value))
+        elif kind == 'neg':
+            output.append((OP_NEGATE, None))
+        else:
+            output.append((OP_CALL, value))
+
+    if not tokens:
+        raise ValueError("Пустое выражение")
+    for index, (kind, value) in enumerate(tokens):
+        if kind == 'num':
+            if not expect_operand:
+                raise ValueError(f"Ожидался оператор перед {value}")
+            output.append((OP_CONST, value))
+            expect_operand = False
+        elif kind == 'name':
+            if not expect_operand:
+                raise ValueError(f"Ожидался оператор перед '{value}'")
+            following = tokens[index + 1] if index + 1 < len(tokens) \
+                else None
+            if following is not None and following[0] == 'op' \
+                    and following[1] in '({[':
+                if value not in _FUNCTION_ARITY:
+                    raise ValueError(f"Неизвестная функция '{value}'")
+                stack.append(('call', value))
+            else:
+                output.append((OP_LOAD, value))
+                expect_operand = False
+        elif value in '({[':
+            if not expect_operand:
+                raise ValueError(f"Ожидался оператор перед '{value}'")
+            stack.append(('(', value))
+        elif value in ')}]':
+            while stack and stack[-1][0] != '(':
+                pop_operator()
+            if not stack or stack[-1][1] != brackets[value]:
+                raise ValueError(f"Несбалансированная скобка '{value}'")
+            stack.pop()
+            if stack and stack[-1][0] == 'call':
+                pop_operator()
+            expect_operand = False
+        elif value == ',':
+            while stack and stack[-1][0] != '(':
+                pop_operator()
+            if len(stack) < 2 or stack[-2][0] != 'call':
+                raise ValueError("Запятая вне вызова функции")
+            expect_operand = True
+        elif expect_operand:
+            if value == '-':
+                stack.append(('neg', None))
+            elif value != '+':
+                raise ValueError(f"Ожидался операнд перед '{value}'")
+        else:
+            precedence, right_assoc = _BINARY_OPERATORS[value]
+            while stack:
+                top_kind, top_value = stack[-1]
+                if top_kind == 'neg':
+                    top_precedence = _UNARY_PRECEDENCE
+                elif top_kind == 'op':
+                    top_precedence = _BINARY_OPERATORS[top_value][0]
+                else:
+                    break
+                if (top_precedence > precedence or
+                        (top_precedence == precedence and not right_assoc)):
+                    pop_operator()
+                else:
+                    break
+            stack.append(('op', value))
+            expect_operand = True
+
+    if expect_operand:
+        raise ValueError("Выражение обрывается на операторе")
+    while stack:
+        if stack[-1][0] == '(':
+            raise ValueError(f"Несбалансированная скобка '{stack[-1][1]}'")
+        pop_operator()
+    return output
+
+
+def _check_stack_depth(program) -> None:
+    """Проверка, что программа оставляет на стеке ровно одно значение."""
+    depth = 0
+    for opcode, operand in program:
+        if opcode in (OP_CONST, OP_LOAD):
+            depth += 1
+        elif opcode == OP_BINARY:
+            depth -= 1
+        elif opcode == OP_CALL:
+            depth -= _FUNCTION_ARITY[operand] - 1
+        if depth < 1:
+            raise ValueError("Недостаточно аргументов в выражении")
+    if depth != 1:
+        raise ValueError("Неверное число аргументов в выражении")
+
+
+class CompiledExpression:
+    """
+    Скомпилированное выражение: RPN-программа для стековой машины.
+
+    Разбор выполняется один раз, после чего программа вычисляется
+    для любых наборов значений переменных.
+    """
+
+    __slots__ = ("source", "program", "variables", "_code")
+
+    def __init__(self, source: str, program):
+        """Инициализация по исходной строке и RPN-программе."""
+        self.source = source
+        self.program = tuple(program)
+        self.variables = frozenset(
+            operand for opcode, operand in self.program
+            if opcode == OP_LOAD
+        )
+        # Операторы заранее заменены функциями: без поиска при вычислении
+        self._code = tuple(
+            (opcode, _SCALAR_BINARY[operand]) if opcode == OP_BINARY
+            else (opcode, (_SCALAR_FUNCTIONS[operand],
+                           _FUNCTION_ARITY[operand]))
+            if opcode == OP_CALL
+            else (opcode, operand)
+            for opcode, operand in self.program
+        )
+
+    def evaluate(self, variables=None, **kwargs):
+        """
+        Вычисление выражения для одного набора переменных.
+
+        Сложность: O(m), где m - длина программы.
+        """
+        if variables is None:
+            variables = kwargs
+        elif kwargs:
+            variables = {**variables, **kwargs}
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        for opcode, operand in self._code:
+            if opcode == OP_CONST:
+                push(operand)
+            elif opcode == OP_LOAD:
+                try:
+                    push(variables[operand])
+                except KeyError:
+                    raise ValueError(
+                        f"Не задано значение переменной '{operand}'"
+                    ) from None
+            elif opcode == OP_BINARY:
+                right = pop()
+                stack[-1] = operand(stack[-1], right)
+            elif opcode == OP_NEGATE:
+                stack[-1] = -stack[-1]
+            else:
+                func, arity = operand
+                args = stack[-arity:]
+                del stack[-arity:]
+                push(func(*args))
+        return stack[0]
+
+    def evaluate_many(self, bindings) -> list:
+        """Вычисление для последовательности наборов переменных."""
+        evaluate = self.evaluate
+        return [evaluate(variables) for variables in bindings]
+
+    def evaluate_batch(self, columns):
+        """
+        Векторизованное вычисление над массивами NumPy.
+
+        Args:
+            columns: Словарь имя переменной -> массив значений.
+
+        Returns:
+            numpy.ndarray с результатом для каждой позиции.
+
+        Программа выполняется один раз, каждая инструкция обрабатывает
+        весь массив.
+        """
+        import numpy as np
+
+        numpy_functions = {
+            'abs': np.abs, 'sqrt': np.sqrt,
+            'min': np.minimum, 'max': np.maximum,
+        }
+        arrays = {name: np.asarray(values) for name, values in columns.items()}
+        missing = self.variables - arrays.keys()
+        if missing:
+            raise ValueError(
+                f"Не заданы значения переменных: {sorted(missing)}"
+            )
+        stack = []
+        for opcode, operand in self.program:
+            if opcode == OP_CONST:
+                stack.append(operand)
+            elif opcode == OP_LOAD:
+                stack.append(arrays[operand])
+            elif opcode == OP_BINARY:
+                right = stack.pop()
+                stack[-1] = _SCALAR_BINARY[operand](stack[-1], right)
+            elif opcode == OP_NEGATE:
+                stack[-1] = np.negative(stack[-1])
+            else:
+                arity = _FUNCTION_ARITY[operand]
+                args = stack[-arity:]
+                del stack[-arity:]
+                stack.append(numpy_functions[operand](*args))
+        result = np.asarray(stack[0])
+        if arrays:
+            shape = np.broadcast_shapes(*(a.shape for a in arrays.values()))
+            result = np.broadcast_to(result, shape)
+        return result
+
+    def __repr__(self):
+        """Строковое представление."""
+        return f"CompiledExpression({self.source!r})"
+
+
+@lru_cache(maxsize=4096)
+def compile_expression(expression: str) -> CompiledExpression:
+    """
+    Компиляция инфиксного выражения в RPN-программу.
+
+    Результат кешируется по исходной строке, поэтому повторная
+    компиляция того же выражения стоит O(1).
+
+    Сложность: O(n), где n - длина выражения.
+    """
+    program = _to_rpn(tokenize_expression(expression))
+    _check_stack_depth(program)
+    return CompiledExpression(expression, program)
+
+
+def evaluate_expression(expression: str, **variables):
+    """Вычисление выражения с использованием кеша компиляции."""
+    return compile_expression(expression).evaluate(variables)
+
+
 def is_palindrome_deque(sequence: str) -> bool:
     """
     Проверка палиндрома с использованием дека.
@@ -38,6 +370,134 @@ def is_palindrome_deque(sequence: str) -> bool:
     return True
 
 
+def _window_stream(stream, size, duration):
+    """
+    Общий разбор аргументов окна.
+
+    Возвращает итератор пар (позиция, значение) и функцию, которая по
+    текущей позиции дает границу: элементы с позицией <= границы
+    выходят из окна. Для окна по количеству позиция - номер элемента,
+    для окна по времени - метка времени.
+    """
+    if (size is None) == (duration is None):
+        raise ValueError("Нужно задать ровно одно из size и duration")
+    if size is not None:
+        if size <= 0:
+            raise ValueError("Размер окна должен быть положительным")
+        return enumerate(stream), lambda position: position - size
+    if duration <= 0:
+        raise ValueError("Длительность окна должна быть положительной")
+    return iter(stream), lambda position: position - duration
+
+
+def _checked_positions(pairs, time_based):
+    """Проверка неубывания меток времени во входном потоке."""
+    if not time_based:
+        yield from pairs
+        return
+    previous = None
+    for timestamp, value in pairs:
+        if previous is not None and timestamp < previous:
+            raise ValueError("Метки времени должны не убывать")
+        previous = timestamp
+        yield timestamp, value
+
+
+def _sliding_extremum(pairs, boundary, size, dominates):
+    """
+    Скользящий экстремум на монотонном деке.
+
+    В деке хранятся пары (позиция, значение) с монотонными значениями:
+    новый элемент вытесняет с конца все, над которыми он доминирует,
+    а с начала уходят элементы, вышедшие из окна. Каждый элемент
+    добавляется и удаляется не более одного раза.
+
+    Сложность: O(1) амортизированно на элемент, память O(размер окна).
+    """
+    time_based = size is None
+    window = deque()
+    for position, value in _checked_positions(pairs, time_based):
+        while window and dominates(value, window[-1][1]):
+            window.pop()
+        window.append((position, value))
+        limit = boundary(position)
+        while window[0][0] <= limit:
+            window.popleft()
+        if time_based:
+            yield position, window[0][1]
+        elif position >= size - 1:
+            yield window[0][1]
+
+
+def sliding_window_max(stream, size=None, duration=None):
+    """
+    Потоковый максимум в скользящем окне.
+
+    Args:
+        stream: Итератор чисел (окно по количеству) или пар
+            (метка времени, число) с неубывающими метками
+            (окно по времени).
+        size: Размер окна в элементах. Значения выдаются, начиная с
+            момента заполнения окна.
+        duration: Длительность окна. Для каждого элемента с меткой t
+            выдается пара (t, максимум) по элементам из (t - duration, t].
+
+    Сложность: O(1) амортизированно на элемент.
+    """
+    pairs, boundary = _window_stream(stream, size, duration)
+    return _sliding_extremum(pairs, boundary, size,
+                             lambda new, old: new >= old)
+
+
+def sliding_window_min(stream, size=None, duration=None):
+    """
+    Потоковый минимум в скользящем окне.
+
+    Аргументы и формат результата такие же, как у sliding_window_max.
+
+    Сложность: O(1) амортизированно на элемент.
+    """
+    pairs, boundary = _window_stream(stream, size, duration)
+    return _sliding_extremum(pairs, boundary, size,
+                             lambda new, old: new <= old)
+
+
+def sliding_window_min_max(stream, size=None, duration=None):
+    """
+    Потоковые минимум и максимум в скользящем окне за один проход.
+
+    Выдает пары (минимум, максимум) для окна по количеству и тройки
+    (метка времени, минимум, максимум) для окна по времени.
+
+    Сложность: O(1) амортизированно на элемент.
+    """
+    pairs, boundary = _window_stream(stream, size, duration)
+    return _sliding_min_max(pairs, boundary, size)
+
+
+def _sliding_min_max(pairs, boundary, size):
+    """Проход с двумя монотонными деками для минимума и максимума."""
+    time_based = size is None
+    lows = deque()
+    highs = deque()
+    for position, value in _checked_positions(pairs, time_based):
+        while lows and value <= lows[-1][1]:
+            lows.pop()
+        lows.append((position, value))
+        while highs and value >= highs[-1][1]:
+            highs.pop()
+        highs.append((position, value))
+        limit = boundary(position)
+        while lows[0][0] <= limit:
+            lows.popleft()
+        while highs[0][0] <= limit:
+            highs.popleft()
+        if time_based:
+            yield position, lows[0][1], highs[0][1]
+        elif position >= size - 1:
+            yield lows[0][1], highs[0][1]
+
+
 def print_queue_simulation(tasks: list[str]) -> None:
     """
     Симуляция обработки задач в очереди печати.
@@ -101,6 +561,12 @@ def main() -> None:
         status = "Сбалансировано" if result else "Не сбалансировано"
         print(f"   '{expr}' -> {status}")
 
+    # Вычисление выражений через RPN-программу
+    print("\n   Вычисление выражений:")
+    for expr in ["2 + 3 * (4 - 1)", "-2 ^ 2", "max(x, y) / 2"]:
+        program = compile_expression(expr)
+        print(f"   '{expr}' -> {program.evaluate(x=3, y=8)}")
+
     # Задача 2: Проверка палиндрома
     test_sequences = [
         "А роза упала на лапу Азора",
@@ -116,6 +582,13 @@ def main() -> None:
         status = "Палиндром" if result else "Не палиндром"
         print(f"   '{seq}' -> {status}")
 
+    # Скользящие экстремумы на монотонном деке
+    metrics = [4, 2, 12, 3, 8, 7, 1, 9]
+    print("\n   Скользящий максимум (окно 3):",
+          list(sliding_window_max(metrics, size=3)))
+    print("   Скользящий минимум (окно 3):",
+          list(sliding_window_min(metrics, size=3)))
+
     # Задача 3: Симуляция очереди печати
     tasks = ["Документ1", "Отчет", "Презентация", "Фото", "Чертеж"]
     print_queue_simulation(tasks)
@@ -0,0 +1,235 @@
+"""
+Unit-тесты для структур данных и практических задач ЛР-02.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from linked_list import LinkedList, PersistentList
+from performance_analysis import (
+    SEQUENCE_OPERATIONS,
+    compare_matrix_json,
+    measure_operation,
+    run_benchmark_matrix,
+    save_matrix_json,
+)
+from task_solutions import (
+    compile_expression,
+    evaluate_expression,
+    sliding_window_max,
+    sliding_window_min,
+    sliding_window_min_max,
+)
+
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для пакетного вычисления
+    np = None
+
+
+class TestPersistentList(unittest.TestCase):
+    """Тесты персистентного списка."""
+
+    def test_prepend_keeps_old_version(self):
+        """Старая версия не меняется после prepend."""
+        v1 = PersistentList([1, 2, 3])
+        v2 = v1.prepend(0)
+        self.assertEqual(v1.traversal(), [1, 2, 3])
+        self.assertEqual(v2.traversal(), [0, 1, 2, 3])
+        self.assertEqual(len(v1), 3)
+        self.assertEqual(v2.size(), 4)
+
+    def test_structural_sharing(self):
+        """Новая версия разделяет узлы хвоста со старой."""
+        v1 = PersistentList([1, 2, 3])
+        v2 = v1.prepend(0)
+        self.assertIs(v2.rest()._head, v1._head)
+
+    def test_delete_from_start(self):
+        """Удаление из начала возвращает значение и новую версию."""
+        v1 = PersistentList(["a", "b"])
+        value, v2 = v1.delete_from_start()
+        self.assertEqual(value, "a")
+        self.assertEqual(v2.traversal(), ["b"])
+        self.assertEqual(v1.traversal(), ["a", "b"])
+        empty = PersistentList()
+        self.assertEqual(empty.delete_from_start(), (None, empty))
+
+    def test_immutable(self):
+        """Версии и узлы нельзя изменить."""
+        v = PersistentList([1])
+        with self.assertRaises(AttributeError):
+            v._head = None
+        with self.assertRaises(AttributeError):
+            v._head.data = 2
+
+    def test_empty_access(self):
+        """first/rest на пустом списке."""
+        with self.assertRaises(IndexError):
+            PersistentList().first()
+        with self.assertRaises(IndexError):
+            PersistentList().rest()
+
+    def test_snapshot_linked_list(self):
+        """Снимок изменяемого списка не зависит от оригинала."""
+        ll = LinkedList()
+        ll.insert_at_end(1)
+        ll.insert_at_end(2)
+        snapshot = PersistentList.from_linked_list(ll)
+        ll.insert_at_start(0)
+        self.assertEqual(snapshot.traversal(), [1, 2])
+
+    def test_reverse_and_eq(self):
+        """Разворот и сравнение версий."""
+        v = PersistentList([1, 2, 3])
+        self.assertEqual(v.reverse(), PersistentList([3, 2, 1]))
+        self.assertNotEqual(v, v.rest())
+        self.assertEqual(hash(v), hash(PersistentList([1, 2, 3])))
+
+
+class TestExpressionCompiler(unittest.TestCase):
+    """Тесты компилятора выражений в RPN."""
+
+    def test_precedence_and_associativity(self):
+        """Приоритеты и ассоциативность операторов."""
+        self.assertEqual(evaluate_expression("2 + 3 * 4"), 14)
+        self.assertEqual(evaluate_expression("(2 + 3) * 4"), 20)
+        self.assertEqual(evaluate_expression("2 ^ 3 ^ 2"), 512)
+        self.assertEqual(evaluate_expression("10 - 4 - 3"), 3)
+        self.assertEqual(evaluate_expression("-2 ^ 2"), -4)
+        self.assertEqual(evaluate_expression("2 * -[1 + {2}]"), -6)
+
+    def test_variables_and_functions(self):
+        """Переменные, функции и сравнения."""
+        program = compile_expression("max(a, b) - abs(c) >= 1.5")
+        self.assertEqual(program.variables, frozenset({"a", "b", "c"}))
+        self.assertTrue(program.evaluate(a=1, b=4, c=-2))
+        self.assertFalse(program.evaluate({"a": 1, "b": 2, "c": 1}))
+        self.assertEqual(
+            program.evaluate_many([{"a": 3, "b": 0, "c": 0},
+                                   {"a": 0, "b": 0, "c": 0}]),
+            [True, False]
+        )
+
+    def test_cache_by_source(self):
+        """Повторная компиляция возвращает тот же объект."""
+        self.assertIs(compile_expression("x * 2"),
+                      compile_expression("x * 2"))
+
+    def test_errors(self):
+        """Синтаксические ошибки и отсутствующие переменные."""
+        for expr in ["", "1 +", "(1", "[1)", "min(1)", "1, 2", "x y",
+                     "foo(1)", "2 $ 3"]:
+            with self.assertRaises(ValueError, msg=expr):
+                compile_expression(expr)
+        with self.assertRaises(ValueError):
+            compile_expression("x + 1").evaluate()
+
+    @unittest.skipIf(np is None, "numpy не установлен")
+    def test_evaluate_batch(self):
+        """Пакетное вычисление над массивами NumPy."""
+        program = compile_expression("sqrt(x) + min(x, y) * 2")
+        x = np.array([1.0, 4.0, 9.0])
+        y = np.array([0.0, 10.0, 1.0])
+        expected = [program.evaluate(x=a, y=b) for a, b in zip(x, y)]
+        np.testing.assert_allclose(
+            program.evaluate_batch({"x": x, "y": y}), expected
+        )
+        constant = compile_expression("3").evaluate_batch({"x": x})
+        self.assertEqual(constant.tolist(), [3, 3, 3])
+
+
+class TestSlidingWindow(unittest.TestCase):
+    """Тесты скользящих экстремумов на монотонном деке."""
+
+    data = [4, 2, 12, 3, 8, 7, 1, 9, 9, 0]
+
+    def naive(self, func, k):
+        """Наивный пересчет каждого окна за O(k)."""
+        return [func(self.data[i - k + 1:i + 1])
+                for i in range(k - 1, len(self.data))]
+
+    def test_count_window(self):
+        """Окно по количеству элементов совпадает с наивным."""
+        for k in range(1, len(self.data) + 1):
+            self.assertEqual(list(sliding_window_max(iter(self.data), k)),
+                             self.naive(max, k))
+            self.assertEqual(list(sliding_window_min(self.data, size=k)),
+                             self.naive(min, k))
+            self.assertEqual(
+                list(sliding_window_min_max(self.data, size=k)),
+                list(zip(self.naive(min, k), self.naive(max, k)))
+            )
+
+    def test_window_larger_than_stream(self):
+        """Окно больше потока - результатов нет."""
+        self.assertEqual(list(sliding_window_max([1, 2], size=5)), [])
+
+    def test_time_window(self):
+        """Окно по времени (t - duration, t]."""
+        stream = [(0, 5), (1, 1), (2, 3), (2, 0), (5, 2), (6, 4)]
+        self.assertEqual(
+            list(sliding_window_max(stream, duration=2)),
+            [(0, 5), (1, 5), (2, 3), (2, 3), (5, 2), (6, 4)]
+        )
+        self.assertEqual(
+            list(sliding_window_min_max(stream, duration=3)),
+            [(0, 5, 5), (1, 1, 5), (2, 1, 5), (2, 0, 5), (5, 2, 2),
+             (6, 2, 4)]
+        )
+
+    def test_invalid_arguments(self):
+        """Ошибки аргументов проверяются сразу."""
+        with self.assertRaises(ValueError):
+            sliding_window_max([1], size=2, duration=1)
+        with self.assertRaises(ValueError):
+            sliding_window_min([1])
+        with self.assertRaises(ValueError):
+            sliding_window_min_max([1], size=0)
+        with self.assertRaises(ValueError):
+            list(sliding_window_max([(2, 1), (1, 1)], duration=1))
+
+
+class TestBenchmarkMatrix(unittest.TestCase):
+    """Тесты матрицы замеров операция x структура."""
+
+    def setUp(self):
+        """Небольшая матрица с пустым размером."""
+        self.results = run_benchmark_matrix([0, 50], count=10, repeats=3)
+
+    def test_cells(self):
+        """Пустой размер пропускается, поддерживаемые ячейки есть."""
+        operations = self.results["operations"]
+        self.assertTrue(all(r["size"] == 50 for r in operations))
+        expected = {(name, operation)
+                    for operation, cells in SEQUENCE_OPERATIONS.items()
+                    for name, statement in cells.items()
+                    if statement is not None}
+        self.assertEqual({(r["structure"], r["operation"])
+                          for r in operations}, expected)
+        for record in operations:
+            self.assertEqual(record["count"], 10)
+            self.assertLessEqual(record["min_us"], record["median_us"])
+            self.assertGreaterEqual(record["min_us"], 0)
+        self.assertEqual(len(self.results["memory"]), 8)
+        self.assertIsNone(measure_operation("list", "pop_front", 0))
+        self.assertIsNone(measure_operation("LinkedList", "pop_back", 50))
+
+    def test_json(self):
+        """Сохранение в JSON и сравнение двух запусков."""
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "matrix.json")
+            save_matrix_json(self.results, filename)
+            with open(filename, encoding="utf-8") as file:
+                loaded = json.load(file)
+            ratios = compare_matrix_json(filename, filename)
+        self.assertEqual(loaded["parameters"]["sizes"], [0, 50])
+        self.assertEqual(len(loaded["operations"]),
+                         len(self.results["operations"]))
+        self.assertTrue(all(ratio == 1.0 for ratio in ratios.values()))
+        self.assertTrue(all(size == 50 for _, _, size in ratios))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,302 @@
+"""
+Модуль для профилирования рекурсивных функций.
+
+Обобщение FibonacciCounter: декоратор считает вызовы для каждого набора
+аргументов, максимальную глубину рекурсии, полное (inclusive) и
+собственное (exclusive) время, долю попаданий в кеш мемоизации и строит
+дерево вызовов. Результат выгружается в формате folded stacks (для
+flamegraph.pl, speedscope) и в JSON.
+
+Пример:
+
+    profiler = CallProfiler()
+
+    @profiler.profile
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    fib(20)
+    print(profiler.folded())
+"""
+
+from collections import Counter
+from functools import wraps
+import json
+import threading
+import time
+
+from memoization import make_key
+
+
+class _CallNode:
+    """Узел дерева вызовов: путь от корня - стек вызовов."""
+
+    __slots__ = ("children", "calls", "self_time")
+
+    def __init__(self):
+        """Инициализация пустого узла."""
+        self.children = {}
+        self.calls = 0
+        self.self_time = 0
+
+
+class FunctionStats:
+    """Статистика одной профилируемой функции."""
+
+    def __init__(self, name, cache_info=None):
+        """
+        Инициализация статистики.
+
+        Args:
+            name (str): Имя функции.
+            cache_info: Метод cache_info() мемоизированной функции,
+                если он есть.
+        """
+        self.name = name
+        self.calls = 0
+        self.arg_counts = Counter()
+        self.max_depth = 0
+        self.inclusive_time = 0
+        self.exclusive_time = 0
+        self.active = 0
+        self._cache_info = cache_info
+        self._cache_base = cache_info() if cache_info else None
+
+    @property
+    def redundant_calls(self):
+        """Повторные вызовы с уже встречавшимися аргументами."""
+        return self.calls - len(self.arg_counts)
+
+    @property
+    def memo_hit_ratio(self):
+        """
+        Доля попаданий в кеш мемоизации.
+
+        Для функций с cache_info() (memoize_lru) берется реальная
+        статистика кеша с момента начала профилирования. Для остальных
+        - доля повторных вызовов, то есть доля попаданий, которую дал
+        бы неограниченный memoize.
+        """
+        if self._cache_info is not None:
+            info = self._cache_info()
+            hits = info.hits - self._cache_base.hits
+            misses = info.misses - self._cache_base.misses
+            total = hits + misses
+            return hits / total if total else 0.0
+        return self.redundant_calls / self.calls if self.calls else 0.0
+
+    def reset(self):
+        """Сброс статистики."""
+        self.calls = 0
+        self.arg_counts.clear()
+        self.max_depth = 0
+        self.inclusive_time = 0
+        self.exclusive_time = 0
+        if self._cache_info is not None:
+            self._cache_base = self._cache_info()
+
+    def to_dict(self, top=10):
+        """Сводка в виде словаря для JSON (время в миллисекундах)."""
+        return {
+            "calls": self.calls,
+            "unique_args": len(self.arg_counts),
+            "redundant_calls": self.redundant_calls,
+            "max_depth": self.max_depth,
+            "inclusive_ms": self.inclusive_time / 1e6,
+            "exclusive_ms": self.exclusive_time / 1e6,
+            "memo_hit_ratio": self.memo_hit_ratio,
+            "top_args": [[repr(key), count] for key, count
+                         in self.arg_counts.most_common(top)],
+        }
+
+
+class CallProfiler:
+    """
+    Профилировщик дерева вызовов для одной или нескольких функций.
+
+    Все функции, обернутые одним профилировщиком, попадают в общее
+    дерево вызовов, поэтому видна и взаимная рекурсия. Стек вызовов
+    хранится отдельно для каждого потока, счетчики - общие (для
+    точных результатов профилируйте один поток).
+    """
+
+    def __init__(self, enabled=True, clock=time.perf_counter_ns):
+        """
+        Инициализация профилировщика.
+
+        Args:
+            enabled (bool): Включен ли сбор статистики.
+            clock: Источник времени в наносекундах.
+        """
+        self.enabled = enabled
+        self.clock = clock
+        self.functions = {}
+        self.max_stack_depth = 0
+        self._root = _CallNode()
+        self._local = threading.local()
+
+    def _stack(self):
+        """Стек кадров текущего потока: [узел, начало, время детей]."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def profile(self, func):
+        """
+        Декоратор: профилирование функции.
+
+        При выключенном профилировщике обертка только проверяет флаг
+        и вызывает функцию.
+        """
+        name = getattr(func, "__qualname__", repr(func))
+        stats = FunctionStats(name, getattr(func, "cache_info", None))
+        self.functions[name] = stats
+        clock = self.clock
+        root = self._root
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            try:
+                key = make_key(args, kwargs)
+                stats.arg_counts[key] += 1
+            except TypeError:
+                # Нехешируемые аргументы считаются по repr
+                stats.arg_counts[repr((args, kwargs))] += 1
+            stats.calls += 1
+            stack = self._stack()
+            parent = stack[-1][0] if stack else root
+            node = parent.children.get(name)
+            if node is None:
+                node = parent.children[name] = _CallNode()
+            frame = [node, 0, 0]
+            stack.append(frame)
+            if len(stack) > self.max_stack_depth:
+                self.max_stack_depth = len(stack)
+            stats.active += 1
+            if stats.active > stats.max_depth:
+                stats.max_depth = stats.active
+            frame[1] = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = clock() - frame[1]
+                stack.pop()
+                stats.active -= 1
+                self_time = elapsed - frame[2]
+                stats.exclusive_time += self_time
+                node.self_time += self_time
+                node.calls += 1
+                # Полное время учитывается только для внешнего кадра,
+                # иначе рекурсивные кадры считались бы многократно
+                if stats.active == 0:
+                    stats.inclusive_time += elapsed
+                if stack:
+                    stack[-1][2] += elapsed
+
+        wrapper.profiler = self
+        wrapper.stats = stats
+        return wrapper
+
+    def enable(self):
+        """Включение сбора статистики."""
+        self.enabled = True
+
+    def disable(self):
+        """Выключение сбора статистики."""
+        self.enabled = False
+
+    def reset(self):
+        """Сброс статистики и дерева вызовов."""
+        for stats in self.functions.values():
+            stats.reset()
+        self.max_stack_depth = 0
+        self._root = _CallNode()
+
+    def folded(self, metric="time"):
+        """
+        Дерево вызовов в формате folded stacks.
+
+        Каждая строка - путь "f;g;h" и значение: собственное время в
+        микросекундах (metric="time") или число вызовов
+        (metric="calls"). Обход выполняется без рекурсии.
+        """
+        if metric not in ("time", "calls"):
+            raise ValueError(f"Неизвестная метрика: {metric}")
+        lines = []
+        stack = [(child, name) for name, child
+                 in reversed(self._root.children.items())]
+        while stack:
+            node, path = stack.pop()
+            value = (node.self_time // 1000 if metric == "time"
+                     else node.calls)
+            if value:
+                lines.append(f"{path} {value}")
+            for name, child in reversed(node.children.items()):
+                stack.append((child, f"{path};{name}"))
+        return "\n".join(lines)
+
+    def summary(self, top=10):
+        """Сводка по всем функциям в виде словаря."""
+        return {
+            "max_stack_depth": self.max_stack_depth,
+            "functions": {name: stats.to_dict(top)
+                          for name, stats in self.functions.items()},
+        }
+
+    def to_json(self, filename=None, top=10):
+        """
+        Сводка в JSON.
+
+        Args:
+            filename (str | None): Файл для записи; если не задан,
+                возвращается строка.
+        """
+        text = json.dumps(self.summary(top), ensure_ascii=False, indent=2)
+        if filename is not None:
+            with open(filename, "w", encoding="utf-8") as file:
+                file.write(text)
+        return text
+
+
+def profile_calls(func=None, *, enabled=True, profiler=None):
+    """
+    Декоратор профилирования с отдельным профилировщиком.
+
+    Args:
+        enabled (bool): При False функция возвращается без обертки,
+            накладные расходы отсутствуют полностью.
+        profiler (CallProfiler | None): Общий профилировщик; по
+            умолчанию создается новый.
+
+    Профилировщик доступен как атрибут profiler обернутой функции.
+    """
+    if func is None:
+        return lambda f: profile_calls(f, enabled=enabled,
+                                       profiler=profiler)
+    if not enabled:
+        return func
+    if profiler is None:
+        profiler = CallProfiler()
+    return profiler.profile(func)
+
+
+if __name__ == "__main__":
+    @profile_calls
+    def fibonacci_profiled(n):
+        """Наивные числа Фибоначчи под профилировщиком."""
+        if n < 2:
+            return n
+        return fibonacci_profiled(n - 1) + fibonacci_profiled(n - 2)
+
+    fibonacci_profiled(20)
+    stats = fibonacci_profiled.stats
+    print(f"Вызовов: {stats.calls}, уникальных аргументов: "
+          f"{len(stats.arg_counts)}")
+    print(f"Повторных вызовов: {stats.redundant_calls} "
+          f"(доля попаданий memoize: {stats.memo_hit_ratio:.3f})")
+    print(f"Максимальная глубина: {stats.max_depth}")
+    print("Самые частые аргументы:", stats.arg_counts.most_common(3))
+    print(fibonacci_profiled.profiler.folded("calls"))
@@ -0,0 +1,226 @@
+"""
+Модуль с постоянным (дисковым) кешем для мемоизации.
+
+Результаты хранятся в файле SQLite и переживают перезапуск программы.
+Одним файлом могут одновременно пользоваться несколько процессов.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from memoization import MISSING, CacheInfo, memoize_lru
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memo (
+    namespace TEXT NOT NULL,
+    key BLOB NOT NULL,
+    value BLOB NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID
+"""
+
+
+def function_identity(func, version=None):
+    """
+    Идентификатор функции для пространства имен кеша.
+
+    Args:
+        func: Функция.
+        version: Версия кода; при изменении алгоритма ее нужно
+            увеличить, чтобы не использовать старые результаты.
+    """
+    module = func.__module__
+    if module == "__mp_main__":
+        # Так multiprocessing (spawn) называет главный модуль в рабочих
+        module = "__main__"
+    name = f"{module}.{func.__qualname__}"
+    return name if version is None else f"{name}@{version}"
+
+
+def _normalize_key(key):
+    """
+    Приведение ключа к виду, в котором равные для dict ключи
+    сериализуются одинаково.
+
+    В локальном кеше True, 1 и 1.0 - один ключ, а pickle дает для них
+    разные байты; без приведения уровни кеша расходились бы. Ключи с
+    typed=True уже содержат типы аргументов и остаются различными.
+    """
+    cls = key.__class__
+    if cls is tuple:
+        return tuple(_normalize_key(item) for item in key)
+    if cls is bool or (cls is float and key.is_integer()):
+        return int(key)
+    return key
+
+
+def key_digest(key):
+    """
+    Стабильный между процессами хеш ключа: SHA-256 от pickle.
+
+    Встроенный hash() для строк рандомизируется при каждом запуске,
+    поэтому для диска не подходит.
+    """
+    data = pickle.dumps(_normalize_key(key),
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    return hashlib.sha256(data).digest()
+
+
+class SQLiteCache:
+    """
+    Кеш в файле SQLite.
+
+    Используется журнал WAL: читатели не блокируют писателя, а
+    писатели из разных процессов ждут друг друга до busy_timeout.
+    Соединение открывается отдельно для каждого потока и процесса
+    (после fork старое соединение использовать нельзя).
+
+    Значения сериализуются pickle, поэтому файл кеша должен быть
+    доверенным.
+    """
+
+    def __init__(self, path, namespace="default", ttl=None,
+                 timeout=30.0):
+        """
+        Инициализация кеша.
+
+        Args:
+            path (str): Путь к файлу базы данных.
+            namespace (str): Пространство имен (обычно - функция).
+            ttl (float | None): Время жизни записи в секундах.
+            timeout (float): Время ожидания блокировки базы.
+        """
+        self.path = os.fspath(path)
+        self.namespace = namespace
+        self.ttl = ttl
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._connection()
+
+    def _connection(self):
+        """Соединение текущего потока и процесса."""
+        local = self._local
+        pid = os.getpid()
+        if getattr(local, "pid", None) != pid:
+            connection = sqlite3.connect(self.path, timeout=self.timeout,
+                                         isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(_SCHEMA)
+            local.connection = connection
+            local.pid = pid
+        return local.connection
+
+    def _count(self, hit):
+        """Обновление статистики."""
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def __len__(self):
+        """Количество записей в пространстве имен."""
+        row = self._connection().execute(
+            "SELECT COUNT(*) FROM memo WHERE namespace = ?",
+            (self.namespace,)
+        ).fetchone()
+        return row[0]
+
+    def __contains__(self, key):
+        """Проверка наличия ключа без учета статистики."""
+        return self._load(key) is not MISSING
+
+    def _load(self, key):
+        """Чтение значения из базы."""
+        row = self._connection().execute(
+            "SELECT value, created FROM memo "
+            "WHERE namespace = ? AND key = ?",
+            (self.namespace, key_digest(key))
+        ).fetchone()
+        if row is None:
+            return MISSING
+        if self.ttl is not None and row[1] + self.ttl <= time.time():
+            return MISSING
+        return pickle.loads(row[0])
+
+    def get(self, key, default=MISSING):
+        """Получение значения. Сложность O(log N) по индексу."""
+        value = self._load(key)
+        self._count(value is not MISSING)
+        return default if value is MISSING else value
+
+    def set(self, key, value):
+        """Сохранение значения (перезаписывает существующее)."""
+        self._connection().execute(
+            "INSERT OR REPLACE INTO memo (namespace, key, value, created) "
+            "VALUES (?, ?, ?, ?)",
+            (self.namespace, key_digest(key),
+             pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+             time.time())
+        )
+
+    def delete(self, key):
+        """Удаление записи. Возвращает True, если запись была."""
+        cursor = self._connection().execute(
+            "DELETE FROM memo WHERE namespace = ? AND key = ?",
+            (self.namespace, key_digest(key))
+        )
+        return cursor.rowcount > 0
+
+    def clear(self):
+        """Удаление всех записей пространства имен и статистики."""
+        self._connection().execute(
+            "DELETE FROM memo WHERE namespace = ?", (self.namespace,)
+        )
+        with self._stats_lock:
+            self.hits = self.misses = 0
+
+    def purge_expired(self):
+        """Удаление устаревших записей. Возвращает их количество."""
+        if self.ttl is None:
+            return 0
+        cursor = self._connection().execute(
+            "DELETE FROM memo WHERE namespace = ? AND created <= ?",
+            (self.namespace, time.time() - self.ttl)
+        )
+        return cursor.rowcount
+
+    def info(self):
+        """Статистика кеша."""
+        return CacheInfo(self.hits, self.misses, 0, None, len(self))
+
+    def close(self):
+        """Закрытие соединения текущего потока."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.pid = None
+            self._local.connection = None
+
+
+def memoize_disk(path, *, maxsize=128, ttl=None, typed=False,
+                 thread_safe=False, version=None):
+    """
+    Декоратор мемоизации с сохранением результатов в файле SQLite.
+
+    Перед диском работает локальный LRU-кеш на maxsize записей, поэтому
+    повторные вызовы в одном процессе не обращаются к базе. Записи
+    разделены по идентификатору функции (модуль, имя и version).
+
+    Аргументы и результаты функции должны сериализоваться pickle.
+    """
+    def decorator(func):
+        backend = SQLiteCache(path, function_identity(func, version), ttl)
+        return memoize_lru(maxsize=maxsize, ttl=ttl, typed=typed,
+                           thread_safe=thread_safe, backend=backend)(func)
+
+    return decorator
@@ -2,9 +2,15 @@
 Модуль с оптимизированными рекурсивными алгоритмами с мемоизацией.
 """
 
+from array import array
+import asyncio
+from collections import namedtuple
 from functools import wraps
+import threading
 import time
+import weakref
 import matplotlib.pyplot as plt  # Добавляем импорт для графика
+from recursion import fibonacci_fast, fibonacci_matrix
 
 
 def memoize(func):
@@ -22,6 +28,553 @@ def memoize(func):
     return wrapper
 
 
+# Маркер отсутствия значения в кеше (None - допустимый результат)
+MISSING = object()
+# Разделитель позиционных и именованных аргументов в ключе
+_KWARGS_MARK = object()
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+
+def make_key(args, kwargs, typed=False):
+    """
+    Построение ключа кеша из позиционных и именованных аргументов.
+
+    Именованные аргументы сортируются, поэтому f(a=1, b=2) и
+    f(b=2, a=1) дают один ключ. При typed=True 1 и 1.0 различаются.
+    """
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    if typed:
+        key += tuple(type(arg) for arg in args)
+        if kwargs:
+            key += tuple(type(value) for _, value in sorted(kwargs.items()))
+    elif len(key) == 1 and type(key[0]) in (int, str):
+        # Частый случай одного аргумента: без лишнего кортежа
+        return key[0]
+    return key
+
+
+class _LRUNode:
+    """Узел двусвязного списка LRU-кеша."""
+
+    __slots__ = ("key", "value", "expires", "prev", "next")
+
+    def __init__(self, key=None, value=None, expires=None):
+        """Инициализация узла."""
+        self.key = key
+        self.value = value
+        self.expires = expires
+        self.prev = None
+        self.next = None
+
+
+class LRUCache:
+    """
+    Ограниченный кеш с вытеснением давно неиспользуемых записей.
+
+    Связная хеш-таблица: словарь ключ -> узел и двусвязный список
+    узлов в порядке использования. Поиск, вставка, перенос в начало и
+    вытеснение с конца выполняются за O(1).
+    """
+
+    def __init__(self, maxsize=128, ttl=None, timer=time.monotonic):
+        """
+        Инициализация кеша.
+
+        Args:
+            maxsize (int | None): Максимальное число записей
+                (None - без ограничения).
+            ttl (float | None): Время жизни записи в секундах.
+            timer: Источник времени для TTL.
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("Размер кеша должен быть неотрицательным")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Время жизни записи должно быть положительным")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._map = {}
+        # Сторожевой узел: root.next - самый свежий, root.prev - самый старый
+        self._root = _LRUNode()
+        self._root.prev = self._root.next = self._root
+
+    def __len__(self):
+        """Количество записей. O(1)"""
+        return len(self._map)
+
+    def __contains__(self, key):
+        """Проверка наличия ключа без учета статистики и порядка."""
+        node = self._map.get(key)
+        return node is not None and not self._expired(node)
+
+    def _expired(self, node):
+        """Проверка истечения времени жизни записи."""
+        return node.expires is not None and node.expires <= self.timer()
+
+    def _unlink(self, node):
+        """Удаление узла из списка. O(1)"""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+
+    def _push_front(self, node):
+        """Вставка узла в начало списка. O(1)"""
+        root = self._root
+        node.prev = root
+        node.next = root.next
+        root.next.prev = node
+        root.next = node
+
+    def get(self, key, default=MISSING):
+        """
+        Получение значения с переносом записи в начало.
+
+        Returns:
+            Значение или default, если ключа нет или запись устарела.
+
+        Сложность: O(1)
+        """
+        node = self._map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        if self._expired(node):
+            self._unlink(node)
+            del self._map[key]
+            self.misses += 1
+            return default
+        if self._root.next is not node:
+            self._unlink(node)
+            self._push_front(node)
+        self.hits += 1
+        return node.value
+
+    def set(self, key, value):
+        """
+        Сохранение значения с вытеснением самой старой записи.
+
+        Сложность: O(1)
+        """
+        if self.maxsize == 0:
+            return
+        expires = None if self.ttl is None else self.timer() + self.ttl
+        node = self._map.get(key)
+        if node is not None:
+            node.value = value
+            node.expires = expires
+            self._unlink(node)
+            self._push_front(node)
+            return
+        if self.maxsize is not None and len(self._map) >= self.maxsize:
+            oldest = self._root.prev
+            self._unlink(oldest)
+            del self._map[oldest.key]
+            self.evictions += 1
+        node = _LRUNode(key, value, expires)
+        self._map[key] = node
+        self._push_front(node)
+
+    def delete(self, key):
+        """Удаление записи. Возвращает True, если запись была. O(1)"""
+        node = self._map.pop(key, None)
+        if node is None:
+            return False
+        self._unlink(node)
+        return True
+
+    def clear(self):
+        """Очистка кеша и статистики."""
+        self._map.clear()
+        self._root.prev = self._root.next = self._root
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """Статистика кеша."""
+        return CacheInfo(self.hits, self.misses, self.evictions,
+                         self.maxsize, len(self._map))
+
+
+class StripedLRUCache:
+    """
+    Потокобезопасный LRU-кеш с разбиением блокировок.
+
+    Ключи распределяются по сегментам по хешу, у каждого сегмента
+    своя блокировка и свой LRU-кеш. Потоки, работающие с разными
+    сегментами, не мешают друг другу. Вытеснение LRU выполняется в
+    пределах сегмента.
+    """
+
+    def __init__(self, maxsize=128, ttl=None, stripes=16,
+                 timer=time.monotonic):
+        """
+        Инициализация кеша.
+
+        Args:
+            maxsize (int | None): Общий лимит записей, делится
+                между сегментами.
+            ttl (float | None): Время жизни записи в секундах.
+            stripes (int): Количество сегментов (блокировок).
+            timer: Источник времени для TTL.
+        """
+        if stripes <= 0:
+            raise ValueError("Количество сегментов должно быть положительным")
+        if maxsize is not None:
+            stripes = max(1, min(stripes, maxsize))
+            # Остаток делится между первыми сегментами: сумма лимитов
+            # сегментов равна maxsize
+            base, extra = divmod(maxsize, stripes)
+            sizes = [base + (i < extra) for i in range(stripes)]
+        else:
+            sizes = [None] * stripes
+        self.maxsize = maxsize
+        self._segments = [LRUCache(size, ttl, timer) for size in sizes]
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def _index(self, key):
+        """Номер сегмента для ключа."""
+        return hash(key) % len(self._segments)
+
+    def __len__(self):
+        """Количество записей во всех сегментах."""
+        return sum(len(segment) for segment in self._segments)
+
+    def __contains__(self, key):
+        """Проверка наличия ключа."""
+        index = self._index(key)
+        with self._locks[index]:
+            return key in self._segments[index]
+
+    def get(self, key, default=MISSING):
+        """Получение значения под блокировкой сегмента. O(1)"""
+        index = self._index(key)
+        with self._locks[index]:
+            return self._segments[index].get(key, default)
+
+    def set(self, key, value):
+        """Сохранение значения под блокировкой сегмента. O(1)"""
+        index = self._index(key)
+        with self._locks[index]:
+            self._segments[index].set(key, value)
+
+    def delete(self, key):
+        """Удаление записи под блокировкой сегмента. O(1)"""
+        index = self._index(key)
+        with self._locks[index]:
+            return self._segments[index].delete(key)
+
+    def clear(self):
+        """Очистка всех сегментов."""
+        for lock, segment in zip(self._locks, self._segments):
+            with lock:
+                segment.clear()
+
+    def info(self):
+        """Суммарная статистика по сегментам."""
+        hits = misses = evictions = size = 0
+        for lock, segment in zip(self._locks, self._segments):
+            with lock:
+                hits += segment.hits
+                misses += segment.misses
+                evictions += segment.evictions
+                size += len(segment)
+        return CacheInfo(hits, misses, evictions, self.maxsize, size)
+
+
+class TieredCache:
+    """
+    Двухуровневый кеш: быстрый локальный L1 перед внешним хранилищем.
+
+    При промахе L1 значение ищется в L2 и копируется в L1. Запись
+    выполняется в оба уровня. L2 может быть любым объектом с методами
+    get/set/delete/clear/info (диск, общая память процессов и т.п.).
+    """
+
+    def __init__(self, local, backend):
+        """
+        Инициализация кеша.
+
+        Args:
+            local: Локальный кеш (LRUCache или StripedLRUCache).
+            backend: Внешнее хранилище.
+        """
+        self.local = local
+        self.backend = backend
+
+    def __len__(self):
+        """Количество записей в локальном кеше."""
+        return len(self.local)
+
+    def __contains__(self, key):
+        """Проверка наличия ключа на любом уровне."""
+        return key in self.local or key in self.backend
+
+    def get(self, key, default=MISSING):
+        """Поиск в L1, затем в L2 с заполнением L1."""
+        value = self.local.get(key)
+        if value is not MISSING:
+            return value
+        value = self.backend.get(key)
+        if value is MISSING:
+            return default
+        self.local.set(key, value)
+        return value
+
+    def set(self, key, value):
+        """Запись в оба уровня."""
+        self.local.set(key, value)
+        self.backend.set(key, value)
+
+    def delete(self, key):
+        """Удаление с обоих уровней."""
+        removed_local = self.local.delete(key)
+        return self.backend.delete(key) or removed_local
+
+    def clear(self):
+        """Очистка обоих уровней."""
+        self.local.clear()
+        self.backend.clear()
+
+    def info(self):
+        """
+        Статистика: попадания в L1 и L2, промахи - только полные
+        (значения не было ни на одном уровне).
+        """
+        local = self.local.info()
+        backend = self.backend.info()
+        return CacheInfo(local.hits + backend.hits, backend.misses,
+                         local.evictions, local.maxsize, local.currsize)
+
+
+def memoize_lru(func=None, *, maxsize=128, ttl=None, typed=False,
+                thread_safe=False, stripes=16, backend=None):
+    """
+    Настраиваемый декоратор мемоизации с ограничением размера.
+
+    Можно использовать как @memoize_lru и как @memoize_lru(maxsize=...).
+
+    Args:
+        maxsize (int | None): Максимальное число записей (None -
+            без ограничения).
+        ttl (float | None): Время жизни записи в секундах.
+        typed (bool): Различать аргументы разных типов (1 и 1.0).
+        thread_safe (bool): Использовать кеш с разбиением блокировок.
+        stripes (int): Количество блокировок в потокобезопасном режиме.
+        backend: Внешнее хранилище (второй уровень); локальный LRU
+            с параметрами maxsize/ttl работает перед ним.
+
+    У обернутой функции есть cache_info() и cache_clear().
+    Вычисление выполняется вне блокировки, поэтому рекурсивные вызовы
+    не блокируют друг друга; при гонке значение может быть вычислено
+    дважды, но результат одинаков.
+    """
+    if func is not None:
+        return memoize_lru(maxsize=maxsize, ttl=ttl, typed=typed,
+                           thread_safe=thread_safe, stripes=stripes,
+                           backend=backend)(func)
+
+    def make_cache():
+        if thread_safe:
+            local = StripedLRUCache(maxsize, ttl, stripes)
+        else:
+            local = LRUCache(maxsize, ttl)
+        if backend is None:
+            return local
+        return TieredCache(local, backend)
+
+    def decorator(function):
+        cache = make_cache()
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs, typed)
+            result = cache.get(key)
+            if result is not MISSING:
+                return result
+            result = function(*args, **kwargs)
+            cache.set(key, result)
+            return result
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def memoize_dense(func=None, *, tabulate=False, typecode=None):
+    """
+    Мемоизация функций одного неотрицательного целого аргумента.
+
+    Результаты хранятся в растущем списке (или array при заданном
+    typecode), индексом служит сам аргумент: нет хеширования и
+    кортежа аргументов на каждый вызов. Прочие аргументы (отрицательные,
+    не int) передаются функции без кеширования.
+
+    Args:
+        tabulate (bool): При промахе заполнить таблицу снизу вверх от
+            последнего вычисленного значения до n. Рекурсивные вызовы
+            f(n - 1), f(n - 2), ... тогда попадают в таблицу, и глубина
+            рекурсии не растет с n. Подходит, если f(n) зависит только
+            от меньших аргументов.
+        typecode (str | None): Код типа array ('q', 'd', ...) для
+            компактного хранения чисел фиксированного размера.
+
+    У обернутой функции есть cache_info() и cache_clear(). Декоратор не
+    потокобезопасен.
+    """
+    if func is not None:
+        return memoize_dense(tabulate=tabulate, typecode=typecode)(func)
+
+    def decorator(function):
+        if typecode is None:
+            # В списке отсутствующее значение - MISSING
+            values = []
+            known = None
+        else:
+            values = array(typecode)
+            # Признаки заполненных ячеек (в array нет маркера MISSING)
+            known = bytearray()
+        stats = [0, 0]  # попадания, промахи
+        # Граница непрерывно заполненного префикса в режиме tabulate
+        filled = [0]
+
+        def lookup(n):
+            if n >= len(values):
+                return MISSING
+            if known is None:
+                return values[n]
+            return values[n] if known[n] else MISSING
+
+        def compute(n):
+            if n >= len(values):
+                extra = max(n + 1, 2 * len(values)) - len(values)
+                if known is None:
+                    values.extend([MISSING] * extra)
+                else:
+                    values.extend(array(typecode,
+                                        bytes(extra * values.itemsize)))
+                    known.extend(bytes(extra))
+            result = function(n)
+            values[n] = result
+            if known is not None:
+                known[n] = 1
+            return result
+
+        @wraps(function)
+        def wrapper(n):
+            if n.__class__ is not int or n < 0:
+                return function(n)
+            if n < len(values) and (known is None or known[n]):
+                result = values[n]
+                if result is not MISSING:
+                    stats[0] += 1
+                    return result
+            stats[1] += 1
+            if tabulate:
+                start = filled[0]
+                while start < n:
+                    if lookup(start) is MISSING:
+                        compute(start)
+                    start += 1
+                    filled[0] = start
+            return compute(n)
+
+        def cache_info():
+            if known is None:
+                size = len(values) - values.count(MISSING)
+            else:
+                size = sum(known)
+            return CacheInfo(stats[0], stats[1], 0, None, size)
+
+        def cache_clear():
+            del values[:]
+            if known is not None:
+                known.clear()
+            stats[0] = stats[1] = 0
+            filled[0] = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def memoize_async(func=None, *, maxsize=128, ttl=None, typed=False):
+    """
+    Мемоизация асинхронных функций (корутин) с объединением вызовов.
+
+    Одновременные вызовы с одинаковыми аргументами ждут одну задачу
+    (single flight), поэтому функция выполняется один раз. Готовые
+    результаты хранятся в LRUCache с ограничением maxsize и временем
+    жизни ttl. Исключения передаются всем ожидающим, но не кешируются:
+    следующий вызов выполнит функцию заново.
+
+    Отмена одного ожидающего не отменяет общую задачу - ее результат
+    нужен остальным и попадет в кеш.
+
+    Задача принадлежит циклу событий, в котором создана, поэтому
+    вызовы объединяются только в пределах одного цикла: у каждого
+    цикла свой словарь выполняющихся задач. Кеш готовых результатов
+    общий.
+
+    У обернутой функции есть cache_info(), cache_clear() и словарь
+    in_flight: цикл событий -> {ключ: задача}.
+    """
+    if func is not None:
+        return memoize_async(maxsize=maxsize, ttl=ttl, typed=typed)(func)
+
+    def decorator(function):
+        cache = LRUCache(maxsize, ttl)
+        # Закрытые циклы событий удаляются из словаря сборщиком мусора
+        in_flight = weakref.WeakKeyDictionary()
+
+        def finish(pending, key, task):
+            if pending.get(key) is task:
+                del pending[key]
+            if not task.cancelled() and task.exception() is None:
+                cache.set(key, task.result())
+
+        @wraps(function)
+        async def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs, typed)
+            result = cache.get(key)
+            if result is not MISSING:
+                return result
+            loop = asyncio.get_running_loop()
+            pending = in_flight.get(loop)
+            if pending is None:
+                pending = in_flight[loop] = {}
+            task = pending.get(key)
+            if task is None:
+                task = loop.create_task(function(*args, **kwargs))
+                pending[key] = task
+                task.add_done_callback(
+                    lambda done: finish(pending, key, done)
+                )
+            return await asyncio.shield(task)
+
+        def cache_clear():
+            cache.clear()
+            in_flight.clear()
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache_clear
+        wrapper.in_flight = in_flight
+        return wrapper
+
+    return decorator
+
+
 @memoize
 def fibonacci_memoized(n):
     """
@@ -48,6 +601,26 @@ def fibonacci_memoized(n):
             fibonacci_memoized(n - 2))
 
 
+@memoize_dense(tabulate=True)
+def fibonacci_tabulated(n):
+    """
+    Числа Фибоначчи с табличной мемоизацией по индексу n.
+
+    При первом запросе таблица заполняется снизу вверх, поэтому
+    большие n не упираются в предел глубины рекурсии.
+
+    Временная сложность: O(n) сложений
+    Глубина рекурсии: O(1)
+    """
+    if n < 0:
+        raise ValueError(
+            "Номер числа Фибоначчи должен быть неотрицательным"
+        )
+    if n < 2:
+        return n
+    return fibonacci_tabulated(n - 1) + fibonacci_tabulated(n - 2)
+
+
 class FibonacciCounter:
     """Класс для подсчета вызовов рекурсивных функций."""
 
@@ -82,12 +655,18 @@ class FibonacciCounter:
         self.calls = 0
 
 
-def compare_fibonacci_performance(n=35):
+def compare_fibonacci_performance(n=35, large_n=1_000_000,
+                                  tabulated_n=20_000):
     """
-    Сравнение производительности наивной и мемоизированной версий.
+    Сравнение производительности наивной, мемоизированной версий и
+    версий с O(log n) умножений (быстрое удвоение, матрица).
 
     Args:
         n (int): Номер числа Фибоначчи для теста.
+        large_n (int): Номер для сравнения O(log n) версий на больших n,
+            недоступных рекурсивным версиям.
+        tabulated_n (int): Номер для табличной мемоизации (таблица
+            хранит все F(0..n), поэтому n умеренное).
     """
     counter = FibonacciCounter()
 
@@ -106,18 +685,62 @@ def compare_fibonacci_performance(n=35):
     result_memo = fibonacci_memoized(n)
     time_memo = time.time() - start_time
 
+    # Табличная мемоизация по индексу
+    fibonacci_tabulated.cache_clear()
+    start_time = time.perf_counter()
+    result_tabulated = fibonacci_tabulated(n)
+    time_tabulated = time.perf_counter() - start_time
+
+    # Быстрое удвоение и матричная версия
+    start_time = time.perf_counter()
+    result_fast = fibonacci_fast(n)
+    time_fast = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    result_matrix = fibonacci_matrix(n)
+    time_matrix = time.perf_counter() - start_time
+
     print(f"Результат: {result_naive}")
     print(f"Наивная версия: {time_naive:.6f} сек")
     print(f"Количество вызовов: {calls_naive}")
     print(f"Мемоизированная: {time_memo:.6f} сек")
-    print(f"Ускорение: {time_naive / time_memo:.2f}x")
+    print(f"Ускорение: {time_naive / max(time_memo, 1e-9):.2f}x")
+    print(f"Табличная: {time_tabulated:.6f} сек")
+    print(f"Быстрое удвоение: {time_fast:.6f} сек")
+    print(f"Матричная: {time_matrix:.6f} сек")
 
     # Проверяем, что результаты совпадают
-    if result_naive == result_memo:
+    if (result_naive == result_memo == result_tabulated == result_fast
+            == result_matrix):
         print("Результаты совпадают ✓")
     else:
         print("Ошибка: результаты не совпадают ✗")
 
+    if large_n:
+        print(f"\nБольшое n = {large_n} (рекурсивные версии "
+              f"упираются в предел глубины рекурсии)")
+        start_time = time.perf_counter()
+        big_fast = fibonacci_fast(large_n)
+        time_fast = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        big_matrix = fibonacci_matrix(large_n)
+        time_matrix = time.perf_counter() - start_time
+        print(f"Длина F(n): {big_fast.bit_length()} бит")
+        print(f"Быстрое удвоение: {time_fast:.6f} сек")
+        print(f"Матричная: {time_matrix:.6f} сек")
+        status = "✓" if big_fast == big_matrix else "✗"
+        print(f"Результаты совпадают {status}")
+
+    if tabulated_n:
+        print(f"\nТабличная мемоизация для n = {tabulated_n} "
+              f"(без рекурсии в глубину)")
+        fibonacci_tabulated.cache_clear()
+        start_time = time.perf_counter()
+        big_tabulated = fibonacci_tabulated(tabulated_n)
+        time_tabulated = time.perf_counter() - start_time
+        print(f"Табличная: {time_tabulated:.6f} сек")
+        status = "✓" if big_tabulated == fibonacci_fast(tabulated_n) else "✗"
+        print(f"Совпадает с быстрым удвоением {status}")
+
 
 def plot_comparison():
     """
@@ -0,0 +1,301 @@
+"""
+Модуль с параллельным выполнением рекурсии «разделяй и властвуй».
+
+Рекурсивный алгоритм задается тремя функциями: divide (разбиение на
+подзадачи), solve (решение базовой задачи) и combine (объединение
+результатов). Крупные задачи разбиваются в главном процессе, задачи
+не больше порога решаются последовательно в пуле процессов, затем
+результаты объединяются вверх по дереву разбиения.
+
+Все функции и задачи должны сериализоваться pickle (функции - на
+уровне модуля), а запуск на Windows - находиться под
+if __name__ == "__main__".
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import os
+import time
+
+from recursion import fibonacci
+from recursion_tasks import binary_search_recursive
+
+
+def _solve_sequential(spec, problem):
+    """Последовательная рекурсия через divide/solve/combine."""
+    if spec.is_base(problem):
+        return spec.solve(problem)
+    results = [_solve_sequential(spec, sub) for sub in spec.divide(problem)]
+    return spec.combine(problem, results)
+
+
+def _solve_leaf(spec, problem):
+    """Решение задачи ниже порога (выполняется в рабочем процессе)."""
+    if spec.leaf_solver is not None:
+        return spec.leaf_solver(problem)
+    return _solve_sequential(spec, problem)
+
+
+class DivideAndConquer:
+    """
+    Исполнитель рекурсии «разделяй и властвуй» с порогом
+    последовательного выполнения.
+    """
+
+    def __init__(self, divide, combine, solve, is_base, size=len,
+                 threshold=1000, max_workers=None, dedupe=False,
+                 leaf_solver=None, initializer=None, initargs=(),
+                 chunksize=None):
+        """
+        Инициализация исполнителя.
+
+        Args:
+            divide: problem -> список подзадач.
+            combine: (problem, список результатов) -> результат.
+            solve: Решение базовой задачи.
+            is_base: problem -> True, если задача базовая.
+            size: Размер задачи для сравнения с порогом.
+            threshold: Задачи размера не больше порога решаются
+                последовательно одним рабочим процессом.
+            max_workers: Количество процессов (по умолчанию - число
+                ядер).
+            dedupe (bool): Решать одинаковые листовые задачи один раз
+                (задачи должны быть хешируемыми, а solve - без
+                побочных эффектов).
+            leaf_solver: Готовая последовательная функция для задач
+                ниже порога (например, исходная рекурсивная функция);
+                по умолчанию - рекурсия через divide/solve/combine.
+            initializer: Функция, выполняемая в каждом рабочем
+                процессе при запуске пула; через нее общие для всех
+                задач данные передаются один раз, а не с каждой
+                задачей.
+            initargs (tuple): Аргументы initializer.
+            chunksize (int | None): Количество задач в одной передаче
+                рабочему процессу; по умолчанию - около четырех
+                передач на процесс.
+        """
+        self.divide = divide
+        self.combine = combine
+        self.solve = solve
+        self.is_base = is_base
+        self.size = size
+        self.threshold = threshold
+        self.max_workers = max_workers
+        self.dedupe = dedupe
+        self.leaf_solver = leaf_solver
+        self.initializer = initializer
+        self.initargs = initargs
+        self.chunksize = chunksize
+
+    def __getstate__(self):
+        """
+        Состояние для передачи рабочим процессам вместе с задачами:
+        без initializer и initargs, которые пул передает процессам
+        один раз при запуске.
+        """
+        state = self.__dict__.copy()
+        state["initializer"] = None
+        state["initargs"] = ()
+        return state
+
+    def sequential(self, problem):
+        """Обычное последовательное выполнение без пула процессов."""
+        return _solve_leaf(self, problem)
+
+    def _expand(self, problem, leaves):
+        """
+        Разбиение задачи до порога.
+
+        Returns:
+            Номер листа в leaves или пара (задача, список поддеревьев).
+        """
+        if self.is_base(problem) or self.size(problem) <= self.threshold:
+            leaves.append(problem)
+            return len(leaves) - 1
+        return (problem,
+                [self._expand(sub, leaves) for sub in self.divide(problem)])
+
+    def _assemble(self, node, results):
+        """Объединение результатов вверх по дереву разбиения."""
+        if isinstance(node, int):
+            return results[node]
+        problem, children = node
+        return self.combine(problem,
+                            [self._assemble(child, results)
+                             for child in children])
+
+    def __call__(self, problem, executor=None):
+        """
+        Параллельное выполнение.
+
+        Args:
+            problem: Исходная задача.
+            executor: Готовый пул процессов для повторного
+                использования; по умолчанию создается временный (с
+                initializer). Готовый пул должен быть создан с нужным
+                initializer заранее.
+        """
+        if self.is_base(problem) or self.size(problem) <= self.threshold:
+            return self.sequential(problem)
+        leaves = []
+        tree = self._expand(problem, leaves)
+        if self.dedupe:
+            unique = list(dict.fromkeys(leaves))
+        else:
+            unique = leaves
+        task = partial(_solve_leaf, self)
+        workers = self.max_workers or os.cpu_count() or 1
+        chunksize = self.chunksize or max(1, len(unique) // (4 * workers))
+        if executor is None:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=self.initializer,
+                                     initargs=self.initargs) as pool:
+                solved = list(pool.map(task, unique, chunksize=chunksize))
+        else:
+            solved = list(executor.map(task, unique, chunksize=chunksize))
+        if self.dedupe:
+            by_problem = dict(zip(unique, solved))
+            solved = [by_problem[leaf] for leaf in leaves]
+        return self._assemble(tree, solved)
+
+
+def _fibonacci_is_base(n):
+    """Базовый случай древовидной рекурсии Фибоначчи."""
+    return n < 2
+
+
+def _fibonacci_divide(n):
+    """F(n) = F(n - 1) + F(n - 2)."""
+    return [n - 1, n - 2]
+
+
+def _fibonacci_combine(n, results):
+    """Сумма результатов подзадач."""
+    return results[0] + results[1]
+
+
+def _identity(n):
+    """Размер задачи и решение базовой: F(0) = 0, F(1) = 1."""
+    return n
+
+
+def parallel_fibonacci(n, threshold=25, max_workers=None, executor=None):
+    """
+    Наивная древовидная рекурсия Фибоначчи на нескольких ядрах.
+
+    Поддеревья с n <= threshold считаются последовательно
+    рекурсивной функцией fibonacci из recursion.py.
+    """
+    if n < 0:
+        raise ValueError(
+            "Номер числа Фибоначчи должен быть неотрицательным"
+        )
+    runner = DivideAndConquer(_fibonacci_divide, _fibonacci_combine,
+                              _identity, _fibonacci_is_base,
+                              size=_identity, threshold=threshold,
+                              max_workers=max_workers,
+                              leaf_solver=fibonacci)
+    return runner(n, executor)
+
+
+# Отсортированный массив для поиска в рабочем процессе
+# (передается один раз через initializer пула)
+_search_array = None
+
+
+def _init_search_worker(arr):
+    """Initializer пула: сохранение массива для поиска."""
+    global _search_array
+    _search_array = arr
+
+
+def search_executor(arr, max_workers=None):
+    """
+    Пул процессов для повторных вызовов parallel_binary_search с
+    одним массивом arr (массив передается процессам один раз).
+    """
+    return ProcessPoolExecutor(max_workers=max_workers,
+                               initializer=_init_search_worker,
+                               initargs=(arr,))
+
+
+def _search_is_base(targets):
+    """Один искомый элемент - базовая задача."""
+    return len(targets) <= 1
+
+
+def _search_divide(targets):
+    """Разбиение списка искомых элементов пополам."""
+    mid = len(targets) // 2
+    return [targets[:mid], targets[mid:]]
+
+
+def _search_solve(targets):
+    """
+    Рекурсивный бинарный поиск каждого элемента в массиве рабочего
+    процесса.
+    """
+    arr = _search_array
+    return [binary_search_recursive(arr, target) for target in targets]
+
+
+def _search_combine(targets, results):
+    """Склейка индексов в исходном порядке."""
+    return results[0] + results[1]
+
+
+def parallel_binary_search(arr, targets, threshold=10000,
+                           max_workers=None, executor=None):
+    """
+    Поиск многих элементов binary_search_recursive на нескольких ядрах.
+
+    Массив передается каждому рабочему процессу один раз через
+    initializer пула, задачи содержат только части списка targets.
+
+    Args:
+        executor: Готовый пул из search_executor(arr) для повторных
+            вызовов с тем же массивом.
+
+    Returns:
+        list: Индекс каждого элемента targets в arr или -1.
+    """
+    targets = list(targets)
+    # Поиск в главном процессе не использует массив рабочих процессов
+    if len(targets) <= max(threshold, 1):
+        return [binary_search_recursive(arr, target) for target in targets]
+    runner = DivideAndConquer(_search_divide, _search_combine,
+                              _search_solve, _search_is_base,
+                              threshold=threshold,
+                              max_workers=max_workers,
+                              leaf_solver=_search_solve,
+                              initializer=_init_search_worker,
+                              initargs=(arr,))
+    return runner(targets, executor)
+
+
+if __name__ == "__main__":
+    workers = os.cpu_count() or 1
+    print(f"Ядер: {workers}")
+    n = 30
+    start = time.perf_counter()
+    sequential = fibonacci(n)
+    time_sequential = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel = parallel_fibonacci(n)
+    time_parallel = time.perf_counter() - start
+    print(f"F({n}) = {parallel}, совпадает: {sequential == parallel}")
+    print(f"Последовательно: {time_sequential:.3f} сек, "
+          f"параллельно: {time_parallel:.3f} сек")
+
+    arr = list(range(0, 2_000_000, 2))
+    targets = list(range(0, 400_000, 3))
+    start = time.perf_counter()
+    expected = [binary_search_recursive(arr, t) for t in targets]
+    time_sequential = time.perf_counter() - start
+    start = time.perf_counter()
+    found = parallel_binary_search(arr, targets, threshold=20_000)
+    time_parallel = time.perf_counter() - start
+    print(f"Найдено {sum(i >= 0 for i in found)} из {len(targets)}, "
+          f"совпадает: {found == expected}")
+    print(f"Последовательно: {time_sequential:.3f} сек, "
+          f"параллельно: {time_parallel:.3f} сек")
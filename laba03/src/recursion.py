@@ -2,6 +2,10 @@
 Модуль с классическими рекурсивными алгоритмами.
 """
 
+import operator
+from functools import lru_cache
+from math import lcm
+
 
 def factorial(n):
     """
@@ -28,6 +32,223 @@ def factorial(n):
     return n * factorial(n - 1)
 
 
+# Порог, ниже которого произведение считается простым циклом
+_PRODUCT_CUTOFF = 16
+# Таблица факториалов малых чисел (вычисляется при импорте)
+_SMALL_FACTORIALS = [1]
+for _i in range(1, 128):
+    _SMALL_FACTORIALS.append(_SMALL_FACTORIALS[-1] * _i)
+del _i
+# binomial считает C(n, k) произведением, если k * ratio <= n
+_BINOMIAL_PRODUCT_RATIO = 64
+
+
+def _product_range(lo, hi):
+    """
+    Произведение lo * (lo + 1) * ... * (hi - 1) бинарным разбиением.
+
+    Перемножаются числа близкой длины, что позволяет длинной
+    арифметике применять быстрые алгоритмы умножения вместо
+    умножения большого числа на малое на каждом шаге.
+
+    Глубина рекурсии: O(log(hi - lo))
+    """
+    if hi - lo <= _PRODUCT_CUTOFF:
+        result = 1
+        for value in range(lo, hi):
+            result *= value
+        return result
+    mid = (lo + hi) // 2
+    return _product_range(lo, mid) * _product_range(mid, hi)
+
+
+def _product_list(values, lo=0, hi=None):
+    """Произведение элементов списка деревом произведений."""
+    if hi is None:
+        hi = len(values)
+    if hi - lo <= _PRODUCT_CUTOFF:
+        result = 1
+        for i in range(lo, hi):
+            result *= values[i]
+        return result
+    mid = (lo + hi) // 2
+    return _product_list(values, lo, mid) * _product_list(values, mid, hi)
+
+
+def _primes_up_to(n):
+    """Список простых чисел <= n (решето Эратосфена)."""
+    if n < 2:
+        return []
+    sieve = bytearray([1]) * (n + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, int(n ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, n + 1, p)))
+    return [p for p in range(2, n + 1) if sieve[p]]
+
+
+def _prime_power_exponent(n, p):
+    """Показатель p в разложении n! (формула Лежандра)."""
+    exponent = 0
+    while n:
+        n //= p
+        exponent += n
+    return exponent
+
+
+def _swing(n, primes):
+    """
+    Простой «свинг» n≀ = n! / ((n // 2)!)^2.
+
+    Показатель простого p в n≀ равен числу нечетных слагаемых
+    floor(n / p^i); для p > sqrt(n) он равен 0 или 1.
+    """
+    factors = []
+    for p in primes:
+        if p > n:
+            break
+        q, power = n, 1
+        while q >= p:
+            q //= p
+            if q & 1:
+                power *= p
+        if power > 1:
+            factors.append(power)
+    return _product_list(factors)
+
+
+def factorial_fast(n, method="swing"):
+    """
+    Вычисление факториала без глубокой рекурсии.
+
+    Args:
+        n (int): Неотрицательное целое число.
+        method (str): "swing" - алгоритм простого свинга
+            n! = ((n // 2)!)^2 * n≀; "product" - бинарное разбиение
+            произведения 1 * 2 * ... * n.
+
+    Returns:
+        int: Факториал числа n.
+
+    Raises:
+        ValueError: Если n < 0 или метод неизвестен.
+
+    Временная сложность: O(M(n log n) log n), где M - стоимость
+    умножения длинных чисел
+    Глубина рекурсии: O(log n)
+    """
+    if method not in ("swing", "product"):
+        raise ValueError(f"Неизвестный метод: {method}")
+    if n < 0:
+        raise ValueError(
+            "Факториал определен только для неотрицательных чисел"
+        )
+    if n < len(_SMALL_FACTORIALS):
+        return _SMALL_FACTORIALS[n]
+    if method == "product":
+        return _product_range(2, n + 1)
+
+    primes = _primes_up_to(n)
+    # Цепочка n, n // 2, n // 4, ... до табличного значения
+    chain = []
+    m = n
+    while m >= len(_SMALL_FACTORIALS):
+        chain.append(m)
+        m //= 2
+    result = _SMALL_FACTORIALS[m]
+    for m in reversed(chain):
+        result = result * result * _swing(m, primes)
+    return result
+
+
+def _is_prime(n):
+    """Проверка простоты пробным делением. O(sqrt(n))"""
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    d = 3
+    while d * d <= n:
+        if n % d == 0:
+            return False
+        d += 2
+    return True
+
+
+def factorial_mod(n, p):
+    """
+    Вычисление n! mod p.
+
+    Если n >= p, результат 0 (p делит n!). Для простого p и n,
+    близкого к p, используется теорема Вильсона
+    (p - 1)! = -1 (mod p): перемножается p - 1 - n множителей вместо n.
+
+    Временная сложность: O(min(n, p - n)) умножений по модулю
+    """
+    if n < 0:
+        raise ValueError(
+            "Факториал определен только для неотрицательных чисел"
+        )
+    if p < 1:
+        raise ValueError("Модуль должен быть положительным")
+    if n >= p:
+        return 0
+    if n < len(_SMALL_FACTORIALS):
+        return _SMALL_FACTORIALS[n] % p
+    if p - 1 - n < n and _is_prime(p):
+        # n! = -1 / ((n + 1) * ... * (p - 1)) (mod p)
+        tail = 1
+        for value in range(n + 1, p):
+            tail = tail * value % p
+        return (-pow(tail, -1, p)) % p
+    result = 1
+    for value in range(2, n + 1):
+        result = result * value % p
+    return result
+
+
+def binomial(n, k):
+    """
+    Биномиальный коэффициент C(n, k) через разложение на простые.
+
+    Показатель простого p в C(n, k) равен v_p(n!) - v_p(k!) -
+    v_p((n - k)!) по формуле Лежандра, степени простых
+    перемножаются деревом произведений. Деления длинных чисел нет.
+    При малом min(k, n - k) решето до n не окупается, и C(n, k)
+    считается как (n - k + 1) * ... * n / k!.
+
+    Returns:
+        int: C(n, k); 0, если k < 0 или k > n.
+
+    Временная сложность: O(n / log n) простых и O(M(log C) log n)
+    на перемножение; O(M(k log n) log k) при малом k
+    """
+    if n < 0:
+        raise ValueError("n должно быть неотрицательным")
+    if k < 0 or k > n:
+        return 0
+    k = min(k, n - k)
+    if k == 0:
+        return 1
+    if n < len(_SMALL_FACTORIALS):
+        return (_SMALL_FACTORIALS[n] //
+                (_SMALL_FACTORIALS[k] * _SMALL_FACTORIALS[n - k]))
+    if k * _BINOMIAL_PRODUCT_RATIO <= n:
+        return _product_range(n - k + 1, n + 1) // factorial_fast(k)
+    factors = []
+    for p in _primes_up_to(n):
+        if p > n - k:
+            # Простые из (n - k, n] входят ровно в первой степени
+            factors.append(p)
+            continue
+        exponent = (_prime_power_exponent(n, p) -
+                    _prime_power_exponent(k, p) -
+                    _prime_power_exponent(n - k, p))
+        if exponent:
+            factors.append(p ** exponent)
+    return _product_list(factors)
+
+
 def fibonacci(n):
     """
     Вычисление n-го числа Фибоначчи наивным рекурсивным способом.
@@ -55,6 +276,210 @@ def fibonacci(n):
     return fibonacci(n - 1) + fibonacci(n - 2)
 
 
+def _fibonacci_pair(n, m=None):
+    """
+    Пара (F(n), F(n + 1)) методом быстрого удвоения.
+
+    Биты n просматриваются от старшего к младшему, на каждом шаге
+    применяются тождества:
+        F(2k) = F(k) * (2F(k + 1) - F(k))
+        F(2k + 1) = F(k)^2 + F(k + 1)^2
+
+    Сложность: O(log n) умножений, глубина рекурсии O(1).
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if m is not None:
+            c %= m
+            d %= m
+        if bit == "1":
+            a, b = d, c + d
+            if m is not None:
+                b %= m
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fibonacci_fast(n):
+    """
+    Вычисление n-го числа Фибоначчи быстрым удвоением.
+
+    Args:
+        n (int): Номер числа Фибоначчи (n >= 0).
+
+    Returns:
+        int: n-е число Фибоначчи.
+
+    Raises:
+        ValueError: Если n < 0.
+
+    Временная сложность: O(log n) умножений длинных чисел
+    Глубина рекурсии: O(1)
+    """
+    if n < 0:
+        raise ValueError(
+            "Номер числа Фибоначчи должен быть неотрицательным"
+        )
+    return _fibonacci_pair(n)[0]
+
+
+def fibonacci_matrix(n):
+    """
+    Вычисление n-го числа Фибоначчи возведением матрицы в степень.
+
+    [[1, 1], [1, 0]]^n = [[F(n + 1), F(n)], [F(n), F(n - 1)]]
+
+    Временная сложность: O(log n) умножений матриц 2x2
+    Глубина рекурсии: O(1)
+    """
+    if n < 0:
+        raise ValueError(
+            "Номер числа Фибоначчи должен быть неотрицательным"
+        )
+    # Матрица симметрична, поэтому хранится тремя элементами
+    r11, r12, r22 = 1, 0, 1
+    b11, b12, b22 = 1, 1, 0
+    while n:
+        if n & 1:
+            r11, r12, r22 = (r11 * b11 + r12 * b12,
+                             r11 * b12 + r12 * b22,
+                             r12 * b12 + r22 * b22)
+        b11, b12, b22 = (b11 * b11 + b12 * b12,
+                         b12 * (b11 + b22),
+                         b12 * b12 + b22 * b22)
+        n >>= 1
+    return r12
+
+
+# Наибольший модуль, для которого fibonacci_mod по умолчанию
+# сокращает n по периоду Пизано (разложение - до 2^10 делений)
+_PISANO_MAX_MODULUS = 1 << 20
+
+
+def _prime_factors(n):
+    """Разложение на простые множители пробным делением: {p: k}."""
+    factors = {}
+    d = 2
+    while d * d <= n:
+        while n % d == 0:
+            factors[d] = factors.get(d, 0) + 1
+            n //= d
+        d += 1 if d == 2 else 2
+    if n > 1:
+        factors[n] = factors.get(n, 0) + 1
+    return factors
+
+
+def _is_fibonacci_period(length, m):
+    """Проверка, что length - период последовательности F mod m."""
+    return _fibonacci_pair(length, m) == (0, 1 % m)
+
+
+@lru_cache(maxsize=1024)
+def pisano_period(m):
+    """
+    Период Пизано: период последовательности F(n) mod m.
+
+    Сначала строится заведомо кратное периоду число: для простого p
+    период делит p - 1 (p = ±1 mod 5) или 2(p + 1) (p = ±2 mod 5),
+    период p^k делит p^(k-1) * period(p), а период m - НОК периодов
+    степеней простых. Затем кандидат уменьшается делением на простые
+    множители, пока остается периодом.
+
+    Сложность: O(sqrt(m) + log^2 m) при разложении пробным делением.
+    """
+    if m < 1:
+        raise ValueError("Модуль должен быть положительным")
+    if m == 1:
+        return 1
+    candidate = 1
+    for p, k in _prime_factors(m).items():
+        if p == 2:
+            base = 3
+        elif p == 5:
+            base = 20
+        elif p % 5 in (1, 4):
+            base = p - 1
+        else:
+            base = 2 * (p + 1)
+        candidate = lcm(candidate, base * p ** (k - 1))
+    for q in _prime_factors(candidate):
+        while (candidate % q == 0 and
+               _is_fibonacci_period(candidate // q, m)):
+            candidate //= q
+    return candidate
+
+
+def fibonacci_mod(n, m, use_pisano=None):
+    """
+    Вычисление F(n) mod m.
+
+    Args:
+        n (int): Номер числа Фибоначчи (n >= 0).
+        m (int): Модуль (m >= 1).
+        use_pisano (bool | None): Сократить n по периоду Пизано.
+            Период кешируется, но первый расчет для m стоит
+            O(sqrt(m)) на разложение m, что намного дороже самого
+            удвоения. По умолчанию (None) сокращение выполняется,
+            только если n много больше m, а m не больше
+            _PISANO_MAX_MODULUS; True - всегда, False - никогда.
+
+    Временная сложность: O(log n) умножений чисел меньше m^2
+    """
+    if n < 0:
+        raise ValueError(
+            "Номер числа Фибоначчи должен быть неотрицательным"
+        )
+    if m < 1:
+        raise ValueError("Модуль должен быть положительным")
+    if use_pisano is None:
+        # Период не больше 6m: сокращение окупается при n порядка m^2
+        use_pisano = (m <= _PISANO_MAX_MODULUS and
+                      n.bit_length() > 2 * m.bit_length())
+    if use_pisano:
+        n %= pisano_period(m)
+    return _fibonacci_pair(n, m)[0]
+
+
+def fibonacci_range(a, b, m=None):
+    """
+    Числа Фибоначчи F(a), F(a + 1), ..., F(b) включительно.
+
+    F(a) и F(a + 1) вычисляются быстрым удвоением, остальные -
+    сложением соседних, без пересчета каждого числа с нуля.
+
+    Args:
+        a (int): Первый номер (a >= 0).
+        b (int): Последний номер (b >= a - 1; при b < a список пуст).
+        m (int | None): Модуль для вычислений по модулю.
+
+    Временная сложность: O(log a + (b - a)) операций над числами
+    """
+    if a < 0:
+        raise ValueError(
+            "Номер числа Фибоначчи должен быть неотрицательным"
+        )
+    if m is not None and m < 1:
+        raise ValueError("Модуль должен быть положительным")
+    if b < a:
+        return []
+    x, y = _fibonacci_pair(a, m)
+    result = [x]
+    append = result.append
+    if m is None:
+        for _ in range(b - a):
+            x, y = y, x + y
+            append(x)
+    else:
+        for _ in range(b - a):
+            x, y = y, (x + y) % m
+            append(x)
+    return result
+
+
 def fast_power(a, n):
     """
     Быстрое возведение числа a в степень n через степень двойки.
@@ -81,17 +506,262 @@ def fast_power(a, n):
     if n == 1:
         return a
 
+    half_power = fast_power(a, n // 2)
     # Если степень четная
     if n % 2 == 0:
-        half_power = fast_power(a, n // 2)
         return half_power * half_power
-    # Если степень нечетная
+    # Если степень нечетная: a^n = a * (a^(n // 2))^2
+    else:
+        return a * half_power * half_power
+
+
+def power(base, n, multiply=operator.mul, identity=1):
+    """
+    Итеративное возведение в степень в произвольном моноиде.
+
+    Args:
+        base: Основание - элемент моноида.
+        n (int): Показатель степени (неотрицательное целое).
+        multiply: Ассоциативная операция умножения двух элементов.
+        identity: Нейтральный элемент. Если None, результат строится
+            без него (тогда n должно быть положительным).
+
+    Returns:
+        base в степени n относительно multiply.
+
+    Временная сложность: O(log n) умножений
+    Глубина рекурсии: O(1)
+    """
+    if n < 0:
+        raise ValueError(
+            "Показатель степени должен быть неотрицательным"
+        )
+    if n == 0:
+        if identity is None:
+            raise ValueError("Для n = 0 нужен нейтральный элемент")
+        return identity
+    result = identity
+    while True:
+        if n & 1:
+            result = base if result is None else multiply(result, base)
+        n >>= 1
+        if not n:
+            return result
+        base = multiply(base, base)
+
+
+def power_mod(a, n, m):
+    """
+    Вычисление a^n mod m квадрированием и умножением.
+
+    Временная сложность: O(log n) умножений чисел меньше m
+    """
+    if m < 1:
+        raise ValueError("Модуль должен быть положительным")
+    return power(a % m, n, lambda x, y: x * y % m, 1 % m)
+
+
+def identity_matrix(size):
+    """Единичная матрица size x size в виде списка списков."""
+    return [[int(i == j) for j in range(size)] for i in range(size)]
+
+
+def matrix_multiply(a, b, m=None):
+    """
+    Произведение матриц в виде списков списков (по модулю m).
+
+    Временная сложность: O(n^3) для матриц n x n
+    """
+    columns = list(zip(*b))
+    if m is None:
+        return [[sum(x * y for x, y in zip(row, column))
+                 for column in columns] for row in a]
+    return [[sum(x * y for x, y in zip(row, column)) % m
+             for column in columns] for row in a]
+
+
+def _reduce_modulo(values, m, terms=1):
+    """
+    Остатки целочисленного массива NumPy по модулю m в типе, где сумма
+    terms произведений остатков не переполняется: int64, если
+    terms * (m - 1)^2 в него помещается, иначе object.
+    """
+    import numpy as np
+
+    if values.dtype.kind not in "iuO":
+        return values % m
+    if (values.dtype.kind == "O"
+            or terms * (m - 1) ** 2 > np.iinfo(np.int64).max):
+        return values.astype(object) % m
+    if values.dtype.kind == "u":
+        # uint64 больше int64: остаток берется до приведения
+        return (values % np.uint64(m)).astype(np.int64)
+    return values.astype(np.int64) % m
+
+
+def matrix_power(matrix, n, m=None):
+    """
+    Возведение квадратной матрицы в степень (по модулю m).
+
+    Поддерживаются списки списков и массивы NumPy. Без модуля
+    целочисленный массив считается в своем dtype (переполнение не
+    проверяется); для длинных чисел используйте dtype=object или
+    списки. С модулем целые приводятся к int64, если строка
+    произведения size * (m - 1)^2 в него помещается, иначе - к
+    dtype=object.
+
+    Временная сложность: O(n^3 log k) для матрицы n x n и степени k
+    """
+    if hasattr(matrix, "shape"):
+        import numpy as np
+
+        size = matrix.shape[0]
+        if m is None:
+            return power(matrix, n, np.matmul,
+                         np.eye(size, dtype=matrix.dtype))
+        matrix = _reduce_modulo(matrix, m, size)
+        return power(matrix, n, lambda x, y: (x @ y) % m,
+                     np.eye(size, dtype=matrix.dtype) % m)
+    size = len(matrix)
+    if m is not None:
+        matrix = [[x % m for x in row] for row in matrix]
+        identity = [[x % m for x in row] for row in identity_matrix(size)]
     else:
-        return a * fast_power(a, n - 1)
+        identity = identity_matrix(size)
+    return power(matrix, n, lambda x, y: matrix_multiply(x, y, m),
+                 identity)
+
+
+def polynomial_multiply(p, q, m=None, max_degree=None):
+    """
+    Произведение многочленов, заданных коэффициентами от младшего.
+
+    Args:
+        p, q (list): Коэффициенты многочленов.
+        m (int | None): Модуль для коэффициентов.
+        max_degree (int | None): Отбросить члены старше этой степени.
+
+    Временная сложность: O(len(p) * len(q))
+    """
+    if not p or not q:
+        return []
+    length = len(p) + len(q) - 1
+    if max_degree is not None:
+        length = min(length, max_degree + 1)
+    result = [0] * length
+    for i, x in enumerate(p):
+        if i >= length or not x:
+            continue
+        for j, y in enumerate(q[:length - i]):
+            result[i + j] += x * y
+    if m is not None:
+        result = [c % m for c in result]
+    return result
+
+
+def polynomial_power(p, n, m=None, max_degree=None):
+    """
+    Возведение многочлена в степень (по модулю m, с усечением).
+
+    Временная сложность: O(log n) умножений многочленов
+    """
+    identity = [1 % m if m is not None else 1]
+    return power(list(p), n,
+                 lambda x, y: polynomial_multiply(x, y, m, max_degree),
+                 identity)
+
+
+def power_vectorized(bases, exponents, m=None):
+    """
+    Поэлементное возведение в степень массивов NumPy.
+
+    Квадрирование и умножение выполняется сразу для всех элементов:
+    число итераций - O(log max(exponents)), каждая итерация -
+    векторные операции над массивом.
+
+    Args:
+        bases: Массив оснований (целые).
+        exponents: Массив неотрицательных показателей (целые),
+            приводимый к форме bases.
+        m (int | None): Модуль. Вычисления ведутся в int64 (или с
+            dtype=object, если (m - 1)^2 не помещается в int64)
+            независимо от dtype bases.
+
+    Returns:
+        numpy.ndarray со степенями.
+    """
+    import numpy as np
+
+    exponents = np.asarray(exponents)
+    bases = np.asarray(bases)
+    if exponents.size and exponents.min() < 0:
+        raise ValueError(
+            "Показатель степени должен быть неотрицательным"
+        )
+    bases, exponents = np.broadcast_arrays(bases, exponents)
+    exponents = exponents.astype(np.int64)
+    if m is not None:
+        if m < 1:
+            raise ValueError("Модуль должен быть положительным")
+        base = _reduce_modulo(bases, m)
+    else:
+        base = bases.copy()
+    result = np.ones(bases.shape, dtype=base.dtype)
+    if m is not None:
+        result %= m
+    while exponents.any():
+        odd = (exponents & 1).astype(bool)
+        product = result * base
+        if m is not None:
+            product %= m
+        result = np.where(odd, product, result)
+        exponents = exponents >> 1
+        base = base * base
+        if m is not None:
+            base %= m
+    return result
+
+
+def linear_recurrence(coefficients, initial, n, m=None):
+    """
+    n-й член линейной рекуррентности через степень матрицы.
+
+    a(k) = c[0] * a(k - 1) + c[1] * a(k - 2) + ... + c[d-1] * a(k - d)
+
+    Args:
+        coefficients (list): Коэффициенты c[0..d-1].
+        initial (list): Начальные значения a(0..d-1).
+        n (int): Номер члена.
+        m (int | None): Модуль.
+
+    Временная сложность: O(d^3 log n)
+    """
+    d = len(coefficients)
+    if d == 0 or len(initial) != d:
+        raise ValueError(
+            "Число коэффициентов и начальных значений должно совпадать"
+        )
+    if n < 0:
+        raise ValueError("Номер члена должен быть неотрицательным")
+    if n < d:
+        return initial[n] if m is None else initial[n] % m
+    # Матрица-компаньон: сдвигает вектор (a(k), ..., a(k - d + 1))
+    companion = [list(coefficients)] + [
+        [int(j == i) for j in range(d)] for i in range(d - 1)
+    ]
+    transition = matrix_power(companion, n - d + 1, m)
+    state = list(reversed(initial))
+    value = sum(x * y for x, y in zip(transition[0], state))
+    return value if m is None else value % m
 
 
 if __name__ == "__main__":
     # Тестирование функций
     print("Факториал 5:", factorial(5))
+    print("Длина 10^5! в битах:", factorial_fast(10 ** 5).bit_length())
+    print("C(100, 50):", binomial(100, 50))
     print("Число Фибоначчи F(6):", fibonacci(6))
     print("2^10:", fast_power(2, 10))
+    print("3^(10^18) mod 10^9+7:", power_mod(3, 10 ** 18, 10 ** 9 + 7))
+    print("F(100) быстрым удвоением:", fibonacci_fast(100))
+    print("F(10^18) mod 10^9+7:", fibonacci_mod(10 ** 18, 10 ** 9 + 7))
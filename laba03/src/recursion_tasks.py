@@ -2,6 +2,8 @@
 Модуль с практическими задачами на рекурсию.
 """
 
+from bisect import bisect_left, bisect_right
+
 
 def binary_search_recursive(arr, target, left=0, right=None):
     """
@@ -35,6 +37,101 @@ def binary_search_recursive(arr, target, left=0, right=None):
         return binary_search_recursive(arr, target, left, mid - 1)
 
 
+# Пороги перехода к итеративному поиску в binary_search_many
+_MANY_TARGETS_CUTOFF = 4
+_MANY_RANGE_CUTOFF = 16
+
+
+def _search_each(arr, targets, target_lo, target_hi, left, right, result):
+    """Итеративный бинарный поиск каждого элемента в arr[left..right]."""
+    for t in range(target_lo, target_hi):
+        target = targets[t]
+        lo, hi = left, right
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            if arr[mid] == target:
+                result[t] = mid
+                break
+            if arr[mid] < target:
+                lo = mid + 1
+            else:
+                hi = mid - 1
+
+
+def _scan_merge(arr, targets, target_lo, target_hi, left, right, result):
+    """Слияние малого отрезка arr[left..right] с отсортированными targets."""
+    i = left
+    for t in range(target_lo, target_hi):
+        target = targets[t]
+        while i <= right and arr[i] < target:
+            i += 1
+        if i > right:
+            return
+        if arr[i] == target:
+            result[t] = i
+
+
+def _binary_search_many(arr, targets, target_lo, target_hi, left, right,
+                        result):
+    """Рекурсивный шаг: одна середина делит и массив, и набор целей."""
+    if target_lo >= target_hi or left > right:
+        return
+    if right - left < _MANY_RANGE_CUTOFF:
+        _scan_merge(arr, targets, target_lo, target_hi, left, right, result)
+        return
+    if target_hi - target_lo <= _MANY_TARGETS_CUTOFF:
+        _search_each(arr, targets, target_lo, target_hi, left, right, result)
+        return
+    mid = (left + right) // 2
+    pivot = arr[mid]
+    # Разбиение целей на меньшие, равные и большие arr[mid]
+    equal_lo = bisect_left(targets, pivot, target_lo, target_hi)
+    equal_hi = bisect_right(targets, pivot, equal_lo, target_hi)
+    for t in range(equal_lo, equal_hi):
+        result[t] = mid
+    _binary_search_many(arr, targets, target_lo, equal_lo, left, mid - 1,
+                        result)
+    _binary_search_many(arr, targets, equal_hi, target_hi, mid + 1, right,
+                        result)
+
+
+def binary_search_many(arr, targets):
+    """
+    Рекурсивный бинарный поиск набора элементов за один проход.
+
+    Середина отрезка массива делит и отсортированный набор целей:
+    меньшие уходят в левую половину, большие - в правую. Общие
+    верхние уровни рекурсии выполняются один раз для всех целей, а
+    малые подзадачи решаются итеративно.
+
+    Args:
+        arr (list): Отсортированный массив.
+        targets: Искомые элементы (если они не отсортированы,
+            сортируются с сохранением исходного порядка ответа).
+
+    Returns:
+        list: Для каждого элемента targets - индекс в arr или -1.
+
+    Временная сложность: O(k log(n / k) + k) для k отсортированных целей
+    Глубина рекурсии: O(log n)
+    """
+    targets = list(targets)
+    k = len(targets)
+    if all(targets[i] <= targets[i + 1] for i in range(k - 1)):
+        result = [-1] * k
+        _binary_search_many(arr, targets, 0, k, 0, len(arr) - 1, result)
+        return result
+    order = sorted(range(k), key=targets.__getitem__)
+    sorted_targets = [targets[i] for i in order]
+    sorted_result = [-1] * k
+    _binary_search_many(arr, sorted_targets, 0, k, 0, len(arr) - 1,
+                        sorted_result)
+    result = [-1] * k
+    for position, index in enumerate(order):
+        result[index] = sorted_result[position]
+    return result
+
+
 def hanoi_towers(n, source="A", auxiliary="B", target="C"):
     """
     Решение задачи о Ханойских башнях.
@@ -71,15 +168,258 @@ def hanoi_towers(n, source="A", auxiliary="B", target="C"):
     return moves
 
 
+def _hanoi_pegs(n, source, auxiliary, target):
+    """
+    Порядок стержней для формул по номеру хода.
+
+    Формулы ниже переносят башню со стержня 0 на стержень 2 при
+    нечетном n и на стержень 1 при четном, поэтому для четного n
+    вспомогательный и целевой стержни меняются местами.
+    """
+    if n % 2:
+        return source, auxiliary, target
+    return source, target, auxiliary
+
+
+def hanoi_move(n, k, source="A", auxiliary="B", target="C"):
+    """
+    k-й ход решения Ханойских башен без построения предыдущих ходов.
+
+    Номер диска равен числу младших нулевых битов k плюс один,
+    стержни определяются битовыми операциями над k.
+
+    Args:
+        n (int): Количество дисков.
+        k (int): Номер хода, 1 <= k <= 2^n - 1.
+
+    Returns:
+        tuple: (диск, откуда, куда).
+
+    Временная сложность: O(n) (операции над n-битным числом)
+    """
+    if not 1 <= k < (1 << n):
+        raise ValueError("Номер хода должен быть от 1 до 2^n - 1")
+    pegs = _hanoi_pegs(n, source, auxiliary, target)
+    disk = (k & -k).bit_length()
+    src = (k & (k - 1)) % 3
+    dst = ((k | (k - 1)) + 1) % 3
+    return disk, pegs[src], pegs[dst]
+
+
+def hanoi_moves(n, source="A", auxiliary="B", target="C"):
+    """
+    Генератор ходов Ханойских башен в виде кортежей.
+
+    Ходы выдаются лениво, память O(1) независимо от n; рекурсия не
+    используется, поэтому глубина стека не зависит от n.
+
+    Yields:
+        tuple: (диск, откуда, куда) в порядке решения.
+
+    Временная сложность: O(2^n) на все ходы, O(1) амортизированно
+    на ход
+    """
+    if n < 0:
+        raise ValueError("Количество дисков должно быть неотрицательным")
+    pegs = _hanoi_pegs(n, source, auxiliary, target)
+    for k in range(1, 1 << n):
+        yield ((k & -k).bit_length(),
+               pegs[(k & (k - 1)) % 3],
+               pegs[((k | (k - 1)) + 1) % 3])
+
+
+def hanoi_state(n, k, source="A", auxiliary="B", target="C"):
+    """
+    Расположение дисков после первых k ходов.
+
+    Диски рассматриваются от самого большого: если k < 2^(i-1), диск i
+    еще на исходном стержне, и задача сводится к переносу i - 1 дисков
+    на вспомогательный стержень; иначе диск i уже на целевом, а
+    оставшиеся k - 2^(i-1) ходов переносят i - 1 дисков со
+    вспомогательного на целевой.
+
+    Args:
+        n (int): Количество дисков.
+        k (int): Число сделанных ходов, 0 <= k <= 2^n - 1.
+
+    Returns:
+        dict: Стержень -> список дисков снизу вверх.
+
+    Временная сложность: O(n)
+    """
+    if n < 0:
+        raise ValueError("Количество дисков должно быть неотрицательным")
+    if not 0 <= k < (1 << n):
+        raise ValueError("Число ходов должно быть от 0 до 2^n - 1")
+    state = {source: [], auxiliary: [], target: []}
+    src, aux, dst = source, auxiliary, target
+    for disk in range(n, 0, -1):
+        half = 1 << (disk - 1)
+        if k < half:
+            state[src].append(disk)
+            aux, dst = dst, aux
+        else:
+            state[dst].append(disk)
+            k -= half
+            src, aux = aux, src
+    return state
+
+
+class FrameStewartSolver:
+    """
+    Решение задачи о Ханойских башнях с k стержнями (Фрейм-Стюарт).
+
+    FS(n, 3) = 2^n - 1,
+    FS(n, p) = min по t из [1, n - 1] { 2 * FS(t, p) + FS(n - t, p - 1) }:
+    верхние t дисков переносятся на промежуточный стержень всеми p
+    стержнями, оставшиеся n - t - на целевой без промежуточного, затем
+    t дисков - на целевой.
+
+    Таблицы FS и оптимальных t хранятся в объекте и дополняются по
+    мере необходимости, поэтому повторные вызовы не пересчитывают их.
+    Функция t -> 2 * FS(t, p) + FS(n - t, p - 1) выпукла, а
+    оптимальное t не убывает с ростом n, поэтому поиск t продолжается
+    с предыдущего значения: таблица до n строится за O(n) для каждого
+    числа стержней.
+    """
+
+    def __init__(self):
+        """Инициализация пустых таблиц."""
+        # Для p стержней: _moves[p][n] = FS(n, p), _split[p][n] = t
+        self._moves = {}
+        self._split = {}
+
+    def _extend(self, n, pegs):
+        """Достраивание таблиц для pegs стержней до n дисков."""
+        moves = self._moves.setdefault(pegs, [0, 1])
+        split = self._split.setdefault(pegs, [0, 0])
+        if len(moves) > n:
+            return
+        lower = self._table(n, pegs - 1)
+        t = split[-1] if len(split) > 2 else 1
+        for m in range(len(moves), n + 1):
+            t = max(t, 1)
+            best = 2 * moves[t] + lower[m - t]
+            while t + 1 < m:
+                candidate = 2 * moves[t + 1] + lower[m - t - 1]
+                if candidate > best:
+                    break
+                t += 1
+                best = candidate
+            moves.append(best)
+            split.append(t)
+
+    def _table(self, n, pegs):
+        """Таблица FS(0..n, pegs)."""
+        if pegs == 3:
+            moves = self._moves.setdefault(3, [0])
+            while len(moves) <= n:
+                moves.append(2 * moves[-1] + 1)
+            return moves
+        self._extend(n, pegs)
+        return self._moves[pegs]
+
+    def move_count(self, n, pegs=4):
+        """
+        Число ходов решения Фрейма-Стюарта для n дисков.
+
+        Ходы не строятся, используется только таблица.
+
+        Временная сложность: O(n * pegs) при первом вызове, O(1) далее
+        """
+        if n < 0:
+            raise ValueError("Количество дисков должно быть неотрицательным")
+        if pegs < 3:
+            raise ValueError("Нужно не меньше трех стержней")
+        return self._table(n, pegs)[n]
+
+    def split(self, n, pegs=4):
+        """Оптимальное число верхних дисков t для первого переноса."""
+        if pegs == 3 or n <= 1:
+            return max(n - 1, 0)
+        self._extend(n, pegs)
+        return self._split[pegs][n]
+
+    def moves(self, n, pegs=4, labels=None):
+        """
+        Генератор ходов решения для n дисков и pegs стержней.
+
+        Args:
+            n (int): Количество дисков.
+            pegs (int): Количество стержней (не меньше трех).
+            labels: Имена стержней; первый - исходный, последний -
+                целевой. По умолчанию "A", "B", "C", ...
+
+        Yields:
+            tuple: (диск, откуда, куда).
+
+        Рекурсия заменена явным стеком задач, поэтому глубина стека
+        вызовов не зависит от n.
+        """
+        if labels is None:
+            labels = [chr(ord("A") + i) for i in range(pegs)]
+        labels = list(labels)
+        if len(labels) != pegs:
+            raise ValueError("Количество имен должно совпадать с pegs")
+        self.move_count(n, pegs)
+        # Задача: перенести диски lo..hi с src на dst через spares
+        stack = [(1, n, labels[0], labels[-1], tuple(labels[1:-1]))]
+        while stack:
+            lo, hi, src, dst, spares = stack.pop()
+            count = hi - lo + 1
+            if count <= 0:
+                continue
+            if count == 1:
+                yield lo, src, dst
+                continue
+            t = self.split(count, len(spares) + 2)
+            middle = spares[0]
+            # Задачи кладутся в стек в обратном порядке выполнения
+            stack.append((lo, lo + t - 1, middle, dst,
+                          spares[1:] + (src,)))
+            stack.append((lo + t, hi, src, dst, spares[1:]))
+            stack.append((lo, lo + t - 1, src, middle,
+                          spares[1:] + (dst,)))
+
+
+# Общий решатель: таблицы переиспользуются всеми вызовами модуля
+_FRAME_STEWART = FrameStewartSolver()
+
+
+def hanoi_multi_peg_count(n, pegs=4):
+    """Число ходов для n дисков и pegs стержней (Фрейм-Стюарт)."""
+    return _FRAME_STEWART.move_count(n, pegs)
+
+
+def hanoi_multi_peg_moves(n, pegs=4, labels=None):
+    """Генератор ходов для n дисков и pegs стержней (Фрейм-Стюарт)."""
+    return _FRAME_STEWART.moves(n, pegs, labels)
+
+
 if __name__ == "__main__":
     # Тестирование бинарного поиска
     arr = [1, 3, 5, 7, 9, 11, 13, 15]
     target = 7
     print(f"Бинарный поиск {target} в {arr}:")
     print(f"Индекс: {binary_search_recursive(arr, target)}")
+    print(f"Поиск [1, 4, 13, 15]: {binary_search_many(arr, [1, 4, 13, 15])}")
 
     # Тестирование Ханойских башен
     print("\nХанойские башни для 3 дисков:")
     moves = hanoi_towers(3)
     for i, move in enumerate(moves, 1):
         print(f"{i}. {move}")
+
+    # Ходы глубоко внутри решения для 64 дисков
+    k = 2 ** 63 + 12345
+    print(f"\nХод {k} для 64 дисков: {hanoi_move(64, k)}")
+    state = hanoi_state(64, k)
+    print("Дисков на стержнях:",
+          {peg: len(disks) for peg, disks in state.items()})
+
+    # Четыре стержня: алгоритм Фрейма-Стюарта
+    print("\nХанойские башни для 4 стержней и 5 дисков:")
+    for i, move in enumerate(hanoi_multi_peg_moves(5, 4), 1):
+        print(f"{i}. {move}")
+    print("Ходов для 1000 дисков и 4 стержней:",
+          hanoi_multi_peg_count(1000, 4))
@@ -0,0 +1,363 @@
+"""
+Модуль с общим для процессов кешем мемоизации.
+
+Результаты хранятся в multiprocessing.shared_memory - хеш-таблице с
+фиксированным числом ячеек по 24 байта: состояние, 64-битный хеш ключа
+и значение (int64 или float). Рабочие процессы пула используют
+результаты подзадач, вычисленные соседями. Перед общей памятью в
+каждом процессе работает локальный LRU (memoize_lru с backend).
+
+Пример:
+
+    @memoize_shared(slots=1 << 18)
+    def steps(n):
+        ...
+
+    with steps.shared_cache:
+        with ProcessPoolExecutor(initializer=attach_shared_caches,
+                                 initargs=(steps.shared_cache,)) as pool:
+            results = list(pool.map(steps, range(1, 100_000)))
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from multiprocessing import shared_memory
+import os
+import struct
+import time
+
+from disk_cache import function_identity, key_digest
+from memoization import MISSING, CacheInfo, memoize_lru
+
+# Ячейка: состояние, хеш ключа, значение
+_SLOT = struct.Struct("<B7xqq")
+_EMPTY, _INT, _FLOAT, _DELETED = 0, 1, 2, 3
+# Максимальная длина цепочки линейного пробирования
+_MAX_PROBES = 64
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+# Кеши текущего процесса по идентификатору функции
+_REGISTRY = {}
+
+
+def _key_hash(key):
+    """64-битный хеш ключа, одинаковый во всех процессах."""
+    return int.from_bytes(key_digest(key)[:8], "little", signed=True)
+
+
+class SharedMemoryCache:
+    """
+    Хеш-таблица в общей памяти для целых и вещественных результатов.
+
+    Ключ хранится только как 64-битный хеш (вероятность совпадения
+    хешей разных ключей около n^2 / 2^65). Число ячеек фиксировано,
+    вытеснения нет: если в цепочке пробирования нет свободной ячейки,
+    значение не сохраняется. Значения других типов и целые вне int64
+    тоже не сохраняются (счетчик rejected).
+
+    Запись выполняется под общей блокировкой, чтение - без нее:
+    байт состояния записывается последним, поэтому читатель не видит
+    незаполненную ячейку.
+
+    Сегмент создает главный процесс (create() или with), рабочие
+    подключаются через attach_shared_caches в initializer пула. До
+    подключения кеш пуст и ничего не сохраняет.
+    """
+
+    def __init__(self, slots=1 << 16, identity=None):
+        """
+        Инициализация кеша без выделения памяти.
+
+        Args:
+            slots (int): Количество ячеек.
+            identity (str | None): Идентификатор для attach_shared_caches.
+        """
+        if slots < 1:
+            raise ValueError("Количество ячеек должно быть положительным")
+        self.slots = slots
+        self.identity = identity
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        self._memory = None
+        self._lock = None
+        # Процесс-владелец сегмента (после fork дочерний не удаляет его)
+        self._owner_pid = None
+
+    @property
+    def name(self):
+        """Имя сегмента общей памяти (None, если не подключен)."""
+        return None if self._memory is None else self._memory.name
+
+    def create(self, context=None):
+        """
+        Выделение сегмента общей памяти (в главном процессе).
+
+        Args:
+            context: Контекст multiprocessing пула (для блокировки);
+                по умолчанию - контекст по умолчанию.
+        """
+        if self._memory is not None:
+            raise ValueError("Кеш уже подключен к общей памяти")
+        memory = shared_memory.SharedMemory(
+            create=True, size=self.slots * _SLOT.size
+        )
+        memory.buf[:] = bytes(len(memory.buf))
+        self._memory = memory
+        self._lock = (context or multiprocessing).Lock()
+        self._owner_pid = os.getpid()
+        return self
+
+    def attach(self, name, lock):
+        """Подключение к сегменту, созданному другим процессом."""
+        if self.name == name:
+            return self
+        self.close()
+        self._memory = shared_memory.SharedMemory(name=name)
+        self._lock = lock
+        return self
+
+    def close(self):
+        """Отключение от сегмента; владелец также удаляет его."""
+        memory, self._memory = self._memory, None
+        if memory is None:
+            return
+        memory.close()
+        if self._owner_pid == os.getpid():
+            memory.unlink()
+        self._owner_pid = None
+
+    def __enter__(self):
+        """
+        Сегмент на время блока with (создается, если еще не создан:
+        with cache или with cache.create(context)).
+        """
+        if self._memory is None:
+            self.create()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Удаление сегмента."""
+        self.close()
+
+    def __getstate__(self):
+        """
+        Передача в рабочий процесс: имя сегмента и блокировка.
+
+        Блокировку multiprocessing можно передать только при запуске
+        процесса (initargs пула).
+        """
+        return {"slots": self.slots, "identity": self.identity,
+                "name": self.name, "lock": self._lock}
+
+    def __setstate__(self, state):
+        """Восстановление с подключением к сегменту."""
+        self.__init__(state["slots"], state["identity"])
+        if state["name"] is not None:
+            self.attach(state["name"], state["lock"])
+
+    def _find(self, digest):
+        """
+        Поиск ячейки ключа.
+
+        Returns:
+            Пара (ячейка с ключом или -1, первая свободная ячейка или -1).
+        """
+        buf = self._memory.buf
+        free = -1
+        index = digest % self.slots
+        for _ in range(min(_MAX_PROBES, self.slots)):
+            state, slot_digest, _ = _SLOT.unpack_from(buf,
+                                                      index * _SLOT.size)
+            if state == _EMPTY:
+                return -1, index if free < 0 else free
+            if state == _DELETED:
+                if free < 0:
+                    free = index
+            elif slot_digest == digest:
+                return index, free
+            index = (index + 1) % self.slots
+        return -1, free
+
+    def _load(self, key):
+        """Чтение значения без учета статистики."""
+        if self._memory is None:
+            return MISSING
+        index, _ = self._find(_key_hash(key))
+        if index < 0:
+            return MISSING
+        state, _, raw = _SLOT.unpack_from(self._memory.buf,
+                                          index * _SLOT.size)
+        if state == _FLOAT:
+            return struct.unpack("<d", struct.pack("<q", raw))[0]
+        return raw
+
+    def __len__(self):
+        """Количество заполненных ячеек. Сложность O(slots)."""
+        if self._memory is None:
+            return 0
+        states = bytes(self._memory.buf[::_SLOT.size])
+        return (len(states) - states.count(_EMPTY)
+                - states.count(_DELETED))
+
+    def __contains__(self, key):
+        """Проверка наличия ключа без учета статистики."""
+        return self._load(key) is not MISSING
+
+    def get(self, key, default=MISSING):
+        """Получение значения. Сложность O(1) в среднем."""
+        value = self._load(key)
+        if value is MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """Сохранение значения, если оно помещается в ячейку."""
+        if self._memory is None:
+            return
+        if type(value) is int and _INT64_MIN <= value <= _INT64_MAX:
+            state, raw = _INT, value
+        elif type(value) is float:
+            state = _FLOAT
+            raw = struct.unpack("<q", struct.pack("<d", value))[0]
+        else:
+            self.rejected += 1
+            return
+        digest = _key_hash(key)
+        with self._lock:
+            index, free = self._find(digest)
+            if index < 0:
+                index = free
+            if index < 0:
+                self.rejected += 1
+                return
+            offset = index * _SLOT.size
+            buf = self._memory.buf
+            # Сначала хеш и значение, байт состояния - последним
+            buf[offset + 8:offset + _SLOT.size] = struct.pack(
+                "<qq", digest, raw
+            )
+            buf[offset] = state
+
+    def delete(self, key):
+        """Удаление записи. Возвращает True, если запись была."""
+        if self._memory is None:
+            return False
+        with self._lock:
+            index, _ = self._find(_key_hash(key))
+            if index < 0:
+                return False
+            self._memory.buf[index * _SLOT.size] = _DELETED
+            return True
+
+    def clear(self):
+        """Очистка всех ячеек и статистики."""
+        if self._memory is not None:
+            with self._lock:
+                buf = self._memory.buf
+                buf[:] = bytes(len(buf))
+        self.hits = self.misses = self.rejected = 0
+
+    def info(self):
+        """Статистика текущего процесса."""
+        return CacheInfo(self.hits, self.misses, 0, self.slots, len(self))
+
+
+def attach_shared_caches(*caches):
+    """
+    Initializer пула процессов: подключение кешей функций,
+    объявленных через memoize_shared, к сегментам главного процесса.
+    """
+    for cache in caches:
+        local = _REGISTRY.get(cache.identity)
+        if local is None:
+            raise ValueError(f"Неизвестный общий кеш: {cache.identity}")
+        if cache.name is not None:
+            local.attach(cache.name, cache._lock)
+
+
+def memoize_shared(func=None, *, slots=1 << 16, maxsize=128,
+                   typed=False):
+    """
+    Декоратор мемоизации с общим для процессов кешем.
+
+    Перед общей памятью работает локальный LRU на maxsize записей.
+    Общий кеш доступен как атрибут shared_cache обернутой функции; до
+    create() (или with) функция использует только локальный кеш.
+
+    Функция должна быть объявлена на уровне модуля, чтобы рабочие
+    процессы находили ее кеш по идентификатору.
+    """
+    if func is None:
+        return lambda f: memoize_shared(f, slots=slots, maxsize=maxsize,
+                                        typed=typed)
+    identity = function_identity(func)
+    cache = SharedMemoryCache(slots, identity)
+    _REGISTRY[identity] = cache
+    wrapper = memoize_lru(maxsize=maxsize, typed=typed, backend=cache)(func)
+    wrapper.shared_cache = cache
+    return wrapper
+
+
+@memoize_shared(slots=1 << 18, maxsize=4096)
+def collatz_steps(n):
+    """
+    Количество шагов гипотезы Коллатца до 1.
+
+    Траектории разных чисел быстро сливаются, поэтому результаты
+    подзадач полезны всем рабочим процессам.
+    """
+    if n < 1:
+        raise ValueError("Число должно быть натуральным")
+    if n == 1:
+        return 0
+    return 1 + collatz_steps(n // 2 if n % 2 == 0 else 3 * n + 1)
+
+
+def _collatz_range(bounds):
+    """Максимум шагов на отрезке [start, stop) (в рабочем процессе)."""
+    start, stop = bounds
+    return max(collatz_steps(n) for n in range(start, stop))
+
+
+def compare_shared_cache(limit=100_000, chunk=5_000, max_workers=None):
+    """
+    Сравнение пула процессов с общим кешем и без него.
+
+    Returns:
+        dict: Время и доля попаданий в общий кеш.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    chunks = [(start, min(start + chunk, limit))
+              for start in range(1, limit, chunk)]
+    results = {}
+    cache = collatz_steps.shared_cache
+
+    collatz_steps.cache_clear()
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        separate = max(pool.map(_collatz_range, chunks))
+    results["separate"] = time.perf_counter() - start_time
+
+    collatz_steps.cache_clear()
+    with cache:
+        start_time = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=attach_shared_caches,
+                                 initargs=(cache,)) as pool:
+            shared = max(pool.map(_collatz_range, chunks))
+        results["shared"] = time.perf_counter() - start_time
+        results["entries"] = len(cache)
+
+    print(f"Шаги Коллатца до {limit}, процессов: {workers}")
+    print(f"Максимум шагов: {shared} (совпадает: {separate == shared})")
+    print(f"Отдельные кеши: {results['separate']:.3f} сек")
+    print(f"Общий кеш:      {results['shared']:.3f} сек "
+          f"({results['entries']} записей)")
+    return results
+
+
+if __name__ == "__main__":
+    compare_shared_cache()
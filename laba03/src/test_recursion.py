@@ -0,0 +1,991 @@
+"""
+Unit-тесты для рекурсивных алгоритмов и мемоизации ЛР-03.
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import math
+import operator
+import os
+import pickle
+import tempfile
+import threading
+import unittest
+from call_profiler import CallProfiler, profile_calls
+from disk_cache import SQLiteCache, memoize_disk
+from memoization import (
+    LRUCache,
+    StripedLRUCache,
+    fibonacci_memoized,
+    fibonacci_tabulated,
+    memoize_async,
+    memoize_dense,
+    memoize_lru,
+)
+from parallel_recursion import (
+    DivideAndConquer,
+    parallel_binary_search,
+    parallel_fibonacci,
+    search_executor,
+)
+from recursion import (
+    binomial,
+    factorial,
+    factorial_fast,
+    factorial_mod,
+    fast_power,
+    fibonacci_fast,
+    fibonacci_matrix,
+    fibonacci_mod,
+    fibonacci_range,
+    linear_recurrence,
+    matrix_power,
+    pisano_period,
+    polynomial_power,
+    power,
+    power_mod,
+    power_vectorized,
+)
+from recursion_tasks import (
+    FrameStewartSolver,
+    binary_search_many,
+    binary_search_recursive,
+    hanoi_move,
+    hanoi_moves,
+    hanoi_multi_peg_count,
+    hanoi_multi_peg_moves,
+    hanoi_state,
+    hanoi_towers,
+)
+from shared_cache import (
+    SharedMemoryCache,
+    attach_shared_caches,
+    collatz_steps,
+)
+from trampoline import (
+    binary_search_deep,
+    factorial_deep,
+    fibonacci_deep,
+    trampoline,
+    tree_height,
+)
+
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для векторизованных версий
+    np = None
+
+
+class FakeTimer:
+    """Управляемый источник времени для проверки TTL."""
+
+    def __init__(self):
+        """Начальное время - ноль."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Текущее время."""
+        return self.now
+
+
+class TestLRUCache(unittest.TestCase):
+    """Тесты LRU-кеша."""
+
+    def test_eviction_order(self):
+        """Вытесняется давно неиспользуемая запись."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.set("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual(cache.info().evictions, 1)
+
+    def test_ttl(self):
+        """Устаревшие записи считаются промахом."""
+        timer = FakeTimer()
+        cache = LRUCache(maxsize=None, ttl=5, timer=timer)
+        cache.set("k", "v")
+        timer.now = 4.9
+        self.assertEqual(cache.get("k"), "v")
+        timer.now = 5.0
+        self.assertIsNone(cache.get("k", None))
+        self.assertEqual(len(cache), 0)
+
+    def test_striped_limit(self):
+        """Общий лимит соблюдается в сегментированном кеше."""
+        cache = StripedLRUCache(maxsize=8, stripes=4)
+        for i in range(100):
+            cache.set(i, i)
+        self.assertLessEqual(len(cache), 8)
+        self.assertEqual(cache.info().evictions, 100 - len(cache))
+
+    def test_striped_uneven_limit(self):
+        """Лимит, не кратный числу сегментов, не превышается."""
+        cache = StripedLRUCache(maxsize=100, stripes=16)
+        for i in range(1000):
+            cache.set(i, i)
+        info = cache.info()
+        self.assertLessEqual(info.currsize, 100)
+        # Целые ключи распределены по всем сегментам, все заполнены
+        self.assertEqual(info.currsize, 100)
+
+
+class TestMemoizeLRU(unittest.TestCase):
+    """Тесты настраиваемого декоратора мемоизации."""
+
+    def test_statistics_and_clear(self):
+        """Счетчики попаданий/промахов и очистка."""
+        @memoize_lru(maxsize=None)
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        self.assertEqual(fib(30), 832040)
+        info = fib.cache_info()
+        self.assertEqual(info.misses, 31)
+        self.assertEqual(info.currsize, 31)
+        fib.cache_clear()
+        self.assertEqual(fib.cache_info().currsize, 0)
+
+    def test_kwargs_key(self):
+        """Именованные аргументы входят в ключ, порядок не важен."""
+        calls = []
+
+        @memoize_lru
+        def add(a, b=0):
+            calls.append((a, b))
+            return a + b
+
+        self.assertEqual(add(1, b=2), 3)
+        self.assertEqual(add(1, b=5), 6)
+        self.assertEqual(add(b=2, a=1), 3)
+        self.assertEqual(add(a=1, b=2), 3)
+        self.assertEqual(len(calls), 3)
+
+    def test_bounded(self):
+        """Размер кеша не превышает maxsize."""
+        @memoize_lru(maxsize=10)
+        def square(x):
+            return x * x
+
+        for i in range(1000):
+            square(i)
+        self.assertEqual(square.cache_info().currsize, 10)
+        self.assertEqual(square.cache_info().evictions, 990)
+
+    def test_thread_safe(self):
+        """Параллельные вызовы в потокобезопасном режиме."""
+        @memoize_lru(maxsize=64, thread_safe=True, stripes=4)
+        def triple(x):
+            return 3 * x
+
+        errors = []
+
+        def worker():
+            for i in range(2000):
+                if triple(i % 100) != 3 * (i % 100):
+                    errors.append(i)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(triple.cache_info().currsize, 64)
+
+
+class TestMemoizeAsync(unittest.TestCase):
+    """Тесты мемоизации корутин."""
+
+    def test_single_flight(self):
+        """Одновременные вызовы выполняют функцию один раз."""
+        calls = []
+
+        @memoize_async
+        async def double(x):
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        async def run():
+            first = await asyncio.gather(*[double(3) for _ in range(20)])
+            return first, await double(3)
+
+        first, cached = asyncio.run(run())
+        self.assertEqual(first, [6] * 20)
+        self.assertEqual(cached, 6)
+        self.assertEqual(calls, [3])
+        self.assertEqual(double.cache_info().hits, 1)
+        self.assertFalse(any(double.in_flight.values()))
+
+    def test_separate_event_loops(self):
+        """Одновременные вызовы из циклов событий разных потоков."""
+        started = threading.Barrier(2)
+        calls = []
+
+        @memoize_async
+        async def double(x):
+            calls.append(x)
+            await asyncio.sleep(0.05)
+            return x * 2
+
+        async def call():
+            started.wait()
+            return await double(3)
+
+        results = []
+        threads = [threading.Thread(
+            target=lambda: results.append(asyncio.run(call()))
+        ) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [6, 6])
+        # Задача другого цикла не используется: вызов в каждом цикле
+        self.assertEqual(calls, [3, 3])
+
+    def test_errors_not_cached(self):
+        """Исключение получают все ожидающие, но оно не кешируется."""
+        calls = []
+
+        @memoize_async
+        async def fail(x):
+            calls.append(x)
+            await asyncio.sleep(0)
+            raise ValueError(x)
+
+        async def run():
+            results = await asyncio.gather(fail(1), fail(1),
+                                           return_exceptions=True)
+            with self.assertRaises(ValueError):
+                await fail(1)
+            return results
+
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(calls, [1, 1])
+
+    def test_recursive_ttl(self):
+        """Рекурсивная корутина и время жизни записей."""
+        @memoize_async(maxsize=None, ttl=10)
+        async def fib(n):
+            return n if n < 2 else await fib(n - 1) + await fib(n - 2)
+
+        timer = FakeTimer()
+        fib.cache.timer = timer
+        self.assertEqual(asyncio.run(fib(2000)), fibonacci_fast(2000))
+        misses = fib.cache_info().misses
+        timer.now += 11
+        asyncio.run(fib(10))
+        self.assertEqual(fib.cache_info().misses, misses + 11)
+
+
+class TestMemoizeDense(unittest.TestCase):
+    """Тесты мемоизации с таблицей по целому аргументу."""
+
+    def test_list_table(self):
+        """Каждое значение вычисляется один раз, None кешируется."""
+        calls = []
+
+        @memoize_dense
+        def square(n):
+            calls.append(n)
+            return None if n == 3 else n * n
+
+        self.assertEqual([square(i) for i in (5, 3, 5, 3)],
+                         [25, None, 25, None])
+        self.assertEqual(calls, [5, 3])
+        info = square.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 2, 2))
+
+    def test_tabulate_deep(self):
+        """Табличный режим не упирается в предел глубины рекурсии."""
+        fibonacci_tabulated.cache_clear()
+        self.assertEqual(fibonacci_tabulated(5000), fibonacci_fast(5000))
+        self.assertEqual(fibonacci_tabulated(30), fibonacci_memoized(30))
+        with self.assertRaises(ValueError):
+            fibonacci_tabulated(-1)
+
+    def test_array_table(self):
+        """Компактная таблица array и сброс кеша."""
+        @memoize_dense(tabulate=True, typecode="q")
+        def steps(n):
+            return 0 if n == 0 else steps(n - 1) + n
+
+        self.assertEqual(steps(10000), 10000 * 10001 // 2)
+        self.assertEqual(steps.cache_info().currsize, 10001)
+        steps.cache_clear()
+        self.assertEqual(steps.cache_info().currsize, 0)
+        self.assertEqual(steps(4), 10)
+
+
+def _disk_cache_worker(task):
+    """
+    Запись и чтение своих ключей в общем файле (в рабочем процессе).
+
+    Returns:
+        Количество прочитанных обратно правильных значений.
+    """
+    path, worker = task
+    cache = SQLiteCache(path, "shared")
+    for i in range(100):
+        cache.set((worker, i), worker * 1000 + i)
+    correct = sum(cache.get((worker, i)) == worker * 1000 + i
+                  for i in range(100))
+    cache.close()
+    return correct
+
+
+class TestDiskCache(unittest.TestCase):
+    """Тесты дискового кеша мемоизации."""
+
+    def setUp(self):
+        """Временный каталог для файла базы."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "memo.sqlite")
+
+    def tearDown(self):
+        """Удаление временного каталога."""
+        self.tmpdir.cleanup()
+
+    def test_results_survive_restart(self):
+        """Новый экземпляр декоратора читает результаты с диска."""
+        calls = []
+
+        def slow_square(x):
+            calls.append(x)
+            return x * x
+
+        first = memoize_disk(self.path)(slow_square)
+        self.assertEqual([first(i) for i in range(5)], [0, 1, 4, 9, 16])
+        first.cache.backend.close()
+
+        # Имитация перезапуска: новый локальный кеш и соединение
+        second = memoize_disk(self.path)(slow_square)
+        self.assertEqual(second(3), 9)
+        self.assertEqual(second(4), 16)
+        self.assertEqual(calls, [0, 1, 2, 3, 4])
+        self.assertEqual(second.cache_info().hits, 2)
+
+    def test_namespaces_and_none(self):
+        """Разные функции не пересекаются; None - допустимый результат."""
+        cache_a = SQLiteCache(self.path, "a")
+        cache_b = SQLiteCache(self.path, "b")
+        cache_a.set((1,), None)
+        self.assertIsNone(cache_a.get((1,)))
+        self.assertFalse((1,) in cache_b)
+        self.assertTrue(cache_a.delete((1,)))
+        self.assertEqual(len(cache_a), 0)
+
+    def test_processes_share_file(self):
+        """Несколько процессов одновременно пишут в один файл WAL."""
+        SQLiteCache(self.path, "shared").close()
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(_disk_cache_worker,
+                                    [(self.path, worker)
+                                     for worker in range(4)]))
+        self.assertEqual(results, [100] * 4)
+        cache = SQLiteCache(self.path, "shared")
+        self.assertEqual(len(cache), 400)
+        self.assertEqual(cache.get((3, 99)), 3099)
+        cache.close()
+
+    def test_equal_keys_match_local_cache(self):
+        """1, 1.0 и True - один ключ и в памяти, и на диске."""
+        calls = []
+
+        def add(x, y):
+            calls.append((x, y))
+            return x + y
+
+        first = memoize_disk(self.path)(add)
+        self.assertEqual(first(1, 2), 3)
+        self.assertEqual(first(1.0, 2), 3)
+        first.cache.backend.close()
+        # Новый локальный кеш: значения берутся с диска
+        second = memoize_disk(self.path)(add)
+        self.assertEqual(second(1.0, 2.0), 3)
+        self.assertEqual(second(True, 2), 3)
+        self.assertEqual(calls, [(1, 2)])
+        cache = SQLiteCache(self.path, "other")
+        cache.set((2.0, "a"), "value")
+        self.assertEqual(cache.get((2, "a")), "value")
+        self.assertIsNone(cache.get((2.5, "a"), None))
+
+    def test_version_invalidates(self):
+        """Смена версии функции отключает старые результаты."""
+        @memoize_disk(self.path, version=1)
+        def value():
+            return "old"
+
+        value()
+
+        @memoize_disk(self.path, version=2)
+        def value():  # noqa: F811
+            return "new"
+
+        self.assertEqual(value(), "new")
+
+
+class TestSharedCache(unittest.TestCase):
+    """Тесты кеша в общей памяти процессов."""
+
+    def test_slots(self):
+        """Целые и вещественные значения, отказ для прочих."""
+        cache = SharedMemoryCache(slots=4)
+        cache.set(1, 2)
+        self.assertEqual(len(cache), 0)
+        with cache:
+            cache.set(1, 5)
+            cache.set((2, "a"), 1.5)
+            cache.set(3, 10 ** 30)
+            cache.set(4, "text")
+            self.assertEqual(cache.get(1), 5)
+            self.assertEqual(cache.get((2, "a")), 1.5)
+            self.assertIsNone(cache.get(3, None))
+            self.assertEqual(cache.rejected, 2)
+            for key in range(10, 20):
+                cache.set(key, key)
+            self.assertEqual(len(cache), 4)
+            self.assertTrue(cache.delete(1))
+            self.assertNotIn(1, cache)
+            cache.set(30, 7)
+            self.assertEqual(cache.get(30), 7)
+        self.assertIsNone(cache.name)
+
+    def test_workers_share_results(self):
+        """Результаты рабочих процессов видны главному процессу."""
+        collatz_steps.cache_clear()
+        cache = collatz_steps.shared_cache
+        with cache:
+            with ProcessPoolExecutor(max_workers=2,
+                                     initializer=attach_shared_caches,
+                                     initargs=(cache,)) as pool:
+                steps = list(pool.map(collatz_steps, range(1, 200)))
+            self.assertGreater(len(cache), 0)
+            before = cache.info().hits
+            self.assertEqual(collatz_steps(27), steps[26])
+            self.assertEqual(cache.info().hits, before + 1)
+        self.assertEqual(steps[26], 111)
+
+
+class TestFastFibonacci(unittest.TestCase):
+    """Тесты O(log n) вычисления чисел Фибоначчи."""
+
+    def test_matches_memoized(self):
+        """Совпадение с мемоизированной версией."""
+        for n in range(200):
+            self.assertEqual(fibonacci_fast(n), fibonacci_memoized(n))
+            self.assertEqual(fibonacci_matrix(n), fibonacci_memoized(n))
+
+    def test_large_n(self):
+        """Большие n без ограничения глубины рекурсии."""
+        self.assertEqual(fibonacci_fast(100000),
+                         fibonacci_matrix(100000))
+        self.assertEqual(fibonacci_fast(100000) % 1000000007,
+                         fibonacci_mod(100000, 1000000007))
+
+    def test_pisano_period(self):
+        """Период Пизано совпадает с найденным перебором."""
+        for m in range(2, 300):
+            a, b, period = 0, 1, 0
+            while True:
+                a, b = b, (a + b) % m
+                period += 1
+                if (a, b) == (0, 1):
+                    break
+            self.assertEqual(pisano_period(m), period, msg=m)
+
+    def test_mod_with_and_without_pisano(self):
+        """Сокращение по периоду не меняет результат."""
+        for n, m in [(10 ** 18, 10 ** 9 + 7), (12345, 1), (999, 1024),
+                     (10 ** 30, 1000)]:
+            self.assertEqual(fibonacci_mod(n, m),
+                             fibonacci_mod(n, m, use_pisano=False))
+            self.assertEqual(fibonacci_mod(n, m, use_pisano=True),
+                             fibonacci_mod(n, m, use_pisano=False))
+
+    def test_range(self):
+        """Диапазон F(a..b) включительно."""
+        self.assertEqual(fibonacci_range(10, 15),
+                         [fibonacci_fast(i) for i in range(10, 16)])
+        self.assertEqual(fibonacci_range(90, 95, 13),
+                         [fibonacci_fast(i) % 13 for i in range(90, 96)])
+        self.assertEqual(fibonacci_range(5, 4), [])
+
+    def test_negative(self):
+        """Отрицательный номер - ошибка."""
+        with self.assertRaises(ValueError):
+            fibonacci_fast(-1)
+        with self.assertRaises(ValueError):
+            fibonacci_mod(5, 0)
+
+
+class TestFastFactorial(unittest.TestCase):
+    """Тесты факториала, биномиальных коэффициентов и n! mod p."""
+
+    def test_matches_recursive(self):
+        """Совпадение с рекурсивной версией и math.factorial."""
+        for n in range(300):
+            self.assertEqual(factorial_fast(n), factorial(n))
+            self.assertEqual(factorial_fast(n, "product"), factorial(n))
+        for n in (1000, 4097, 20000):
+            self.assertEqual(factorial_fast(n), math.factorial(n))
+            self.assertEqual(factorial_fast(n, "product"),
+                             math.factorial(n))
+
+    def test_invalid(self):
+        """Отрицательное n и неизвестный метод."""
+        with self.assertRaises(ValueError):
+            factorial_fast(-1)
+        with self.assertRaises(ValueError):
+            factorial_fast(500, "unknown")
+        with self.assertRaises(ValueError):
+            factorial_fast(5, method="bad")
+
+    def test_binomial(self):
+        """Совпадение с math.comb, включая границы."""
+        for n in (0, 1, 10, 127, 128, 1000, 2500):
+            for k in (-1, 0, 1, n // 3, n // 2, n - 1, n, n + 1):
+                expected = math.comb(n, k) if 0 <= k <= n else 0
+                self.assertEqual(binomial(n, k), expected, msg=(n, k))
+        # Малое k при большом n - формула произведения
+        for n, k in ((10 ** 6, 3), (10 ** 6, 999_990), (5000, 78)):
+            self.assertEqual(binomial(n, k), math.comb(n, k), msg=(n, k))
+
+    def test_factorial_mod(self):
+        """n! mod p, в том числе через теорему Вильсона."""
+        for p in (2, 13, 1009, 7919, 10000):
+            for n in (0, 1, 2, p // 2, p - 2, p - 1, p, p + 5):
+                self.assertEqual(factorial_mod(n, p),
+                                 math.factorial(n) % p, msg=(n, p))
+
+
+class TestPowerEngine(unittest.TestCase):
+    """Тесты обобщенного возведения в степень."""
+
+    def test_fast_power(self):
+        """Рекурсивная версия для четных и нечетных степеней."""
+        for n in range(40):
+            self.assertEqual(fast_power(3, n), 3 ** n)
+
+    def test_generic_monoid(self):
+        """Произвольная операция и нейтральный элемент."""
+        self.assertEqual(power("ab", 3, operator.add, ""), "ababab")
+        self.assertEqual(power(2, 10, identity=None), 1024)
+        with self.assertRaises(ValueError):
+            power(2, 0, identity=None)
+        with self.assertRaises(ValueError):
+            power(2, -1)
+
+    def test_power_mod(self):
+        """Совпадение со встроенной pow."""
+        for a, n, m in [(3, 10 ** 18, 10 ** 9 + 7), (10, 0, 1),
+                        (-7, 13, 100)]:
+            self.assertEqual(power_mod(a, n, m), pow(a, n, m))
+
+    def test_matrix_and_recurrence(self):
+        """Степень матрицы и линейная рекуррентность."""
+        fib = matrix_power([[1, 1], [1, 0]], 50)
+        self.assertEqual(fib[0][1], fibonacci_fast(50))
+        self.assertEqual(matrix_power([[1, 1], [1, 0]], 50, 1000)[0][1],
+                         fibonacci_fast(50) % 1000)
+        self.assertEqual(matrix_power([[5]], 0), [[1]])
+        # Трибоначчи: 0, 0, 1, 1, 2, 4, 7, 13, 24, 44
+        self.assertEqual(
+            [linear_recurrence([1, 1, 1], [0, 0, 1], n) for n in range(10)],
+            [0, 0, 1, 1, 2, 4, 7, 13, 24, 44]
+        )
+
+    def test_polynomial_power(self):
+        """Степень многочлена: биномиальные коэффициенты."""
+        self.assertEqual(polynomial_power([1, 1], 6),
+                         [1, 6, 15, 20, 15, 6, 1])
+        self.assertEqual(polynomial_power([1, 1], 6, m=5, max_degree=2),
+                         [1, 1, 0])
+
+    @unittest.skipIf(np is None, "numpy не установлен")
+    def test_numpy(self):
+        """Матрицы NumPy и поэлементное возведение в степень."""
+        matrix = np.array([[1, 1], [1, 0]], dtype=np.int64)
+        self.assertEqual(int(matrix_power(matrix, 40)[0, 1]),
+                         fibonacci_fast(40))
+        bases = [2, 3, 10 ** 6, 0]
+        exponents = [10, 0, 12345, 3]
+        m = 10 ** 9 + 7
+        self.assertEqual(
+            power_vectorized(bases, exponents, m).tolist(),
+            [pow(b, e, m) for b, e in zip(bases, exponents)]
+        )
+        self.assertEqual(power_vectorized([2, 3], 3).tolist(), [8, 27])
+
+    @unittest.skipIf(np is None, "numpy не установлен")
+    def test_numpy_modulo_dtype(self):
+        """Модульная арифметика не переполняет dtype входных данных."""
+        m = 10 ** 9 + 7
+        exponents = [10 ** 6, 77]
+        for dtype in (np.int32, np.uint8, np.uint64):
+            bases = np.array([3, 5], dtype=dtype)
+            self.assertEqual(power_vectorized(bases, exponents, m).tolist(),
+                             [pow(3, 10 ** 6, m), pow(5, 77, m)])
+        bases = np.array([200, 255], dtype=np.uint8)
+        self.assertEqual(power_vectorized(bases, [3, 2], 1000).tolist(),
+                         [200 ** 3 % 1000, 255 ** 2 % 1000])
+        large = np.array([2 ** 64 - 1], dtype=np.uint64)
+        self.assertEqual(power_vectorized(large, [5], m).tolist(),
+                         [pow(2 ** 64 - 1, 5, m)])
+        # Сумма двух произведений (m - 1)^2 не помещается в int64
+        big = 3 * 10 ** 9
+        matrix = [[big - 1, big - 1], [big - 1, big - 1]]
+        self.assertEqual(
+            matrix_power(np.array(matrix, dtype=np.int64), 3, big).tolist(),
+            matrix_power(matrix, 3, big)
+        )
+        fib = np.array([[1, 1], [1, 0]], dtype=np.int32)
+        self.assertEqual(int(matrix_power(fib, 300, m)[0, 1]),
+                         fibonacci_fast(300) % m)
+
+
+class TestBinarySearchMany(unittest.TestCase):
+    """Тесты бинарного поиска набора элементов."""
+
+    def test_matches_single_search(self):
+        """Ответы совпадают с поиском каждого элемента по отдельности."""
+        arr = list(range(0, 400, 3))
+        targets = list(range(-5, 410))
+        self.assertEqual(binary_search_many(arr, targets),
+                         [binary_search_recursive(arr, t) for t in targets])
+
+    def test_unsorted_targets_and_duplicates(self):
+        """Несортированные цели и повторы в массиве."""
+        arr = sorted([5, 1, 1, 7, 7, 7, 9] * 5)
+        targets = [9, 2, 7, 1, 10, 7, 0]
+        result = binary_search_many(arr, targets)
+        for target, index in zip(targets, result):
+            if target in arr:
+                self.assertEqual(arr[index], target)
+            else:
+                self.assertEqual(index, -1)
+
+    def test_empty(self):
+        """Пустой массив и пустой набор целей."""
+        self.assertEqual(binary_search_many([], [1, 2]), [-1, -1])
+        self.assertEqual(binary_search_many([1, 2, 3], []), [])
+
+
+class TestHanoiStreaming(unittest.TestCase):
+    """Тесты ленивых и прямых вычислений ходов Ханойских башен."""
+
+    def test_generator_matches_recursive(self):
+        """Генератор совпадает с рекурсивным решением."""
+        for n in range(8):
+            expected = [f"Переместить диск {d} с {a} на {b}"
+                        for d, a, b in hanoi_moves(n)]
+            self.assertEqual(expected, hanoi_towers(n))
+
+    def test_kth_move_and_state(self):
+        """k-й ход и состояние совпадают с пошаговой симуляцией."""
+        n = 6
+        state = {"A": list(range(n, 0, -1)), "B": [], "C": []}
+        self.assertEqual(hanoi_state(n, 0), state)
+        for k, move in enumerate(hanoi_moves(n), 1):
+            self.assertEqual(hanoi_move(n, k), move)
+            disk, src, dst = move
+            self.assertEqual(state[src].pop(), disk)
+            state[dst].append(disk)
+            self.assertEqual(hanoi_state(n, k), state)
+        self.assertEqual(state["C"], list(range(n, 0, -1)))
+
+    def test_deep_positions(self):
+        """Позиции внутри решения для 64 дисков."""
+        last = (1 << 64) - 1
+        self.assertEqual(hanoi_move(64, 1 << 63), (64, "A", "C"))
+        self.assertEqual(hanoi_state(64, last)["C"],
+                         list(range(64, 0, -1)))
+        with self.assertRaises(ValueError):
+            hanoi_move(64, 0)
+        with self.assertRaises(ValueError):
+            hanoi_state(3, 8)
+
+
+class TestFrameStewart(unittest.TestCase):
+    """Тесты решения Ханойских башен с k стержнями."""
+
+    def test_known_counts(self):
+        """Известные значения для четырех стержней (OEIS A007664)."""
+        self.assertEqual([hanoi_multi_peg_count(n, 4) for n in range(12)],
+                         [0, 1, 3, 5, 9, 13, 17, 25, 33, 41, 49, 65])
+        self.assertEqual(hanoi_multi_peg_count(20, 3), 2 ** 20 - 1)
+
+    def test_matches_quadratic_dp(self):
+        """Совпадение с прямым перебором всех разбиений."""
+        table = {}
+
+        def brute(n, p):
+            if n <= 1:
+                return n
+            if p == 3:
+                return 2 ** n - 1
+            if (n, p) not in table:
+                table[n, p] = min(2 * brute(t, p) + brute(n - t, p - 1)
+                                  for t in range(1, n))
+            return table[n, p]
+
+        solver = FrameStewartSolver()
+        for p in (4, 5, 6):
+            for n in range(60):
+                self.assertEqual(solver.move_count(n, p), brute(n, p))
+
+    def test_moves_are_legal(self):
+        """Ходы допустимы и переносят всю башню на последний стержень."""
+        for pegs in (3, 4, 5):
+            labels = "PQRST"[:pegs]
+            state = {peg: [] for peg in labels}
+            state["P"] = list(range(9, 0, -1))
+            count = 0
+            for disk, src, dst in hanoi_multi_peg_moves(9, pegs, labels):
+                self.assertEqual(state[src].pop(), disk)
+                self.assertTrue(not state[dst] or state[dst][-1] > disk)
+                state[dst].append(disk)
+                count += 1
+            self.assertEqual(count, hanoi_multi_peg_count(9, pegs))
+            self.assertEqual(state[labels[-1]], list(range(9, 0, -1)))
+        self.assertEqual(list(hanoi_multi_peg_moves(5, 3)),
+                         list(hanoi_moves(5)))
+
+    def test_thousands_of_discs(self):
+        """Число ходов для тысяч дисков без построения ходов."""
+        solver = FrameStewartSolver()
+        count = solver.move_count(5000, 4)
+        self.assertGreater(count, 0)
+        self.assertLess(solver.move_count(4999, 4), count)
+        with self.assertRaises(ValueError):
+            solver.move_count(5, 2)
+
+
+class _Node:
+    """Минимальный узел дерева для проверки tree_height."""
+
+    def __init__(self, left=None, right=None):
+        """Инициализация узла."""
+        self.left = left
+        self.right = right
+
+
+class TestTrampoline(unittest.TestCase):
+    """Тесты выполнения рекурсии на явном стеке."""
+
+    def test_deep_recursion(self):
+        """Глубина далеко за пределом рекурсии."""
+        self.assertEqual(factorial_deep(5000), math.factorial(5000))
+        self.assertEqual(fibonacci_deep(20000) % 1000007,
+                         fibonacci_fast(20000) % 1000007)
+        root = None
+        for _ in range(100000):
+            root = _Node(root)
+        self.assertEqual(tree_height(root), 100000)
+        self.assertEqual(tree_height(_Node(_Node(), _Node(None, _Node()))),
+                         3)
+
+    def test_binary_search(self):
+        """Результат совпадает с обычным бинарным поиском."""
+        arr = list(range(0, 200, 2))
+        for target in range(-1, 201):
+            expected = target // 2 if target % 2 == 0 and \
+                0 <= target < 200 else -1
+            self.assertEqual(binary_search_deep(arr, target), expected)
+
+    def test_exceptions_propagate(self):
+        """Исключения передаются кадрам-родителям."""
+        @trampoline
+        def descend(n):
+            if n == 0:
+                raise KeyError("дно")
+            try:
+                return (yield descend.frame(n - 1))
+            except KeyError:
+                if n == 3000:
+                    return "перехвачено"
+                raise
+
+        self.assertEqual(descend(5000), "перехвачено")
+        with self.assertRaises(KeyError):
+            descend(10)
+        with self.assertRaises(ValueError):
+            factorial_deep(-1)
+
+    def test_call_from_helper_returns_value(self):
+        """Обычный вызов во время выполнения возвращает значение."""
+        def helper(n):
+            return factorial_deep(n) + 1
+
+        @trampoline
+        def total(n):
+            if n == 0:
+                return helper(4)
+            return factorial_deep(3) + (yield total.frame(n - 1))
+
+        self.assertEqual(total(2000), 2000 * 6 + 25)
+
+    def test_non_generator_yield(self):
+        """Выдача не-генератора - TypeError внутри кадра."""
+        @trampoline
+        def bad():
+            yield 42
+
+        with self.assertRaises(TypeError):
+            bad()
+
+
+class TestCallProfiler(unittest.TestCase):
+    """Тесты профилировщика дерева вызовов."""
+
+    def test_counts_and_depth(self):
+        """Число вызовов по аргументам и глубина для наивной рекурсии."""
+        @profile_calls
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        fib(15)
+        stats = fib.stats
+        self.assertEqual(stats.calls, 1973)
+        self.assertEqual(stats.arg_counts[1], 610)
+        self.assertEqual(stats.max_depth, 15)
+        self.assertEqual(stats.redundant_calls, 1973 - 16)
+        self.assertGreaterEqual(stats.inclusive_time, 0)
+        self.assertLessEqual(stats.exclusive_time,
+                             stats.inclusive_time + 1)
+
+    def test_memo_hit_ratio_from_cache(self):
+        """Доля попаданий берется из cache_info мемоизированной функции."""
+        profiler = CallProfiler()
+
+        @profiler.profile
+        @memoize_lru(maxsize=None)
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        fib(50)
+        info = fib.stats.to_dict()
+        self.assertEqual(info["calls"], 99)
+        self.assertAlmostEqual(info["memo_hit_ratio"], 48 / 99)
+
+    def test_folded_and_json(self):
+        """Выгрузка folded stacks и JSON для взаимной рекурсии."""
+        profiler = CallProfiler()
+
+        @profiler.profile
+        def is_even(n):
+            return True if n == 0 else is_odd(n - 1)
+
+        @profiler.profile
+        def is_odd(n):
+            return False if n == 0 else is_even(n - 1)
+
+        self.assertTrue(is_even(4))
+        folded = profiler.folded("calls").splitlines()
+        self.assertEqual(folded[0], f"{is_even.stats.name} 1")
+        self.assertEqual(len(folded), 5)
+        self.assertEqual(folded[-1].count(";"), 4)
+        self.assertIn('"max_stack_depth": 5', profiler.to_json())
+
+    def test_disabled(self):
+        """Выключенный профилировщик не собирает статистику."""
+        def square(x):
+            return x * x
+
+        self.assertIs(profile_calls(square, enabled=False), square)
+        profiler = CallProfiler(enabled=False)
+        wrapped = profiler.profile(square)
+        self.assertEqual(wrapped(3), 9)
+        self.assertEqual(wrapped.stats.calls, 0)
+        profiler.enable()
+        wrapped(3)
+        self.assertEqual(wrapped.stats.calls, 1)
+
+
+def _merge_divide(items):
+    """Разбиение списка пополам (для проверки DivideAndConquer)."""
+    mid = len(items) // 2
+    return [items[:mid], items[mid:]]
+
+
+def _merge_combine(items, results):
+    """Слияние двух отсортированных списков."""
+    left, right = results
+    merged = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if left[i] <= right[j]:
+            merged.append(left[i])
+            i += 1
+        else:
+            merged.append(right[j])
+            j += 1
+    return merged + left[i:] + right[j:]
+
+
+def _is_short(items):
+    """Список из не более чем одного элемента уже отсортирован."""
+    return len(items) <= 1
+
+
+def _noop_initializer(arr):
+    """Initializer пула без действий."""
+
+
+class TestParallelRecursion(unittest.TestCase):
+    """Тесты параллельного исполнителя «разделяй и властвуй»."""
+
+    def test_fibonacci(self):
+        """Параллельная древовидная рекурсия Фибоначчи."""
+        self.assertEqual(parallel_fibonacci(22, threshold=15,
+                                            max_workers=2),
+                         fibonacci_fast(22))
+        self.assertEqual(parallel_fibonacci(10, threshold=15), 55)
+
+    def test_binary_search(self):
+        """Поиск многих элементов совпадает с поиском по одному."""
+        arr = list(range(0, 3000, 3))
+        targets = list(range(-5, 3005, 7))
+        expected = [x // 3 if x % 3 == 0 and 0 <= x < 3000 else -1
+                    for x in targets]
+        self.assertEqual(parallel_binary_search(arr, targets, threshold=50,
+                                                max_workers=2),
+                         expected)
+        with search_executor(arr, max_workers=2) as pool:
+            for _ in range(2):
+                self.assertEqual(
+                    parallel_binary_search(arr, targets, threshold=30,
+                                           max_workers=2, executor=pool),
+                    expected
+                )
+        self.assertEqual(parallel_binary_search(arr, [6], threshold=0), [2])
+
+    def test_initargs_not_pickled(self):
+        """Задачи не содержат данные initializer: размер не зависит от n."""
+        sizes = []
+        for n in (10, 100_000):
+            runner = DivideAndConquer(_merge_divide, _merge_combine, list,
+                                      _is_short,
+                                      initializer=_noop_initializer,
+                                      initargs=(list(range(n)),))
+            sizes.append(len(pickle.dumps(runner)))
+            self.assertEqual(runner.initargs[0][-1], n - 1)
+        self.assertEqual(sizes[0], sizes[1])
+
+    def test_generic_merge_sort(self):
+        """Сортировка слиянием в форме divide/solve/combine."""
+        data = [(i * 7919) % 1009 for i in range(500)]
+        runner = DivideAndConquer(_merge_divide, _merge_combine, list,
+                                  _is_short, threshold=64, max_workers=2,
+                                  dedupe=False)
+        self.assertEqual(runner(data), sorted(data))
+        self.assertEqual(runner.sequential(data), sorted(data))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,264 @@
+"""
+Модуль для выполнения глубокой рекурсии на явном стеке.
+
+Рекурсивная функция записывается как генератор: рекурсивный вызов
+заменяется на `yield f.frame(...)`, результат вызова возвращается в
+выражение yield. Кадры хранятся в списке в куче, поэтому глубина
+рекурсии ограничена только памятью, а не sys.getrecursionlimit().
+
+Модуль снимает ограничение глубины, но не ускоряет рекурсию: кадр на
+явном стеке заметно дороже обычного вызова, а на большой глубине
+дорожает еще (миллион кадров-генераторов не помещается в кэш
+процессора). Во сколько раз на данной машине - показывает
+benchmark_trampoline, он же отделяет стоимость самих генераторов от
+стоимости цикла. Для неглубокой рекурсии обычные вызовы быстрее.
+
+Пример:
+
+    @trampoline
+    def factorial(n):
+        if n <= 1:
+            return 1
+        return n * (yield factorial.frame(n - 1))
+"""
+
+from functools import wraps
+import sys
+import time
+from types import GeneratorType
+
+
+def run_generator(generator):
+    """
+    Выполнение генераторной рекурсии на явном стеке.
+
+    Каждый генератор - кадр рекурсии. Выданный через yield генератор
+    кладется на стек; по его завершении значение return передается
+    в кадр-родитель через send, исключение - через throw. Поэтому
+    try/except в рекурсивной функции работает как при обычной
+    рекурсии.
+
+    Args:
+        generator: Запущенный вызов генераторной функции.
+
+    Returns:
+        Значение, возвращенное корневым кадром.
+
+    Сложность: O(1) на кадр, память O(глубина рекурсии).
+    """
+    stack = [generator]
+    push = stack.append
+    pop = stack.pop
+    frame = generator
+    value = None
+    error = None
+    while True:
+        try:
+            if error is None:
+                child = frame.send(value)
+            else:
+                thrown, error = error, None
+                child = frame.throw(thrown)
+        except StopIteration as stop:
+            pop()
+            if not stack:
+                return stop.value
+            value = stop.value
+            frame = stack[-1]
+            continue
+        except BaseException as exc:  # noqa: B902 - передается родителю
+            pop()
+            if not stack:
+                raise
+            error = exc
+            frame = stack[-1]
+            continue
+        if child.__class__ is not GeneratorType:
+            error = TypeError(
+                "Рекурсивная функция должна выдавать через yield "
+                "только кадры рекурсивных вызовов: yield f.frame(...)"
+            )
+            continue
+        push(child)
+        frame = child
+        value = None
+
+
+def trampoline(func):
+    """
+    Декоратор для генераторных рекурсивных функций.
+
+    Вызов f(...) всегда запускает цикл run_generator и возвращает
+    значение - из обычного кода, вспомогательной функции и даже из
+    тела другой рекурсивной функции. Рекурсивный вызов записывается
+    явно: yield f.frame(...) - f.frame создает кадр-генератор без
+    запуска цикла. Скрытого режима "внутри цикла" нет, поэтому
+    вложенные и параллельные вызовы независимы.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return run_generator(func(*args, **kwargs))
+
+    wrapper.frame = func
+    return wrapper
+
+
+@trampoline
+def factorial_deep(n):
+    """
+    Факториал рекурсией на явном стеке.
+
+    Временная сложность: O(n) умножений
+    Глубина рекурсии: O(n) кадров в куче, O(1) в стеке вызовов
+    """
+    if n < 0:
+        raise ValueError(
+            "Факториал определен только для неотрицательных чисел"
+        )
+    if n <= 1:
+        return 1
+    return n * (yield factorial_deep.frame(n - 1))
+
+
+@trampoline
+def fibonacci_deep(n, memo=None):
+    """
+    Мемоизированные числа Фибоначчи рекурсией на явном стеке.
+
+    Временная сложность: O(n)
+    Глубина рекурсии: O(n) кадров в куче
+    """
+    if n < 0:
+        raise ValueError(
+            "Номер числа Фибоначчи должен быть неотрицательным"
+        )
+    if n <= 1:
+        return n
+    if memo is None:
+        memo = {}
+    if n in memo:
+        return memo[n]
+    result = ((yield fibonacci_deep.frame(n - 1, memo)) +
+              (yield fibonacci_deep.frame(n - 2, memo)))
+    memo[n] = result
+    return result
+
+
+@trampoline
+def binary_search_deep(arr, target, left=0, right=None):
+    """
+    Рекурсивный бинарный поиск на явном стеке.
+
+    Returns:
+        int: Индекс элемента или -1 если не найден.
+    """
+    if right is None:
+        right = len(arr) - 1
+    if left > right:
+        return -1
+    mid = (left + right) // 2
+    if arr[mid] == target:
+        return mid
+    if arr[mid] < target:
+        return (yield binary_search_deep.frame(arr, target, mid + 1,
+                                               right))
+    return (yield binary_search_deep.frame(arr, target, left, mid - 1))
+
+
+@trampoline
+def tree_height(node):
+    """
+    Высота бинарного дерева (узлы с атрибутами left/right, как
+    TreeNode из ЛР-06). Вырожденное дерево из миллиона узлов
+    обрабатывается без RecursionError.
+
+    Returns:
+        int: Количество узлов на самом длинном пути (0 для None).
+    """
+    if node is None:
+        return 0
+    left = yield tree_height.frame(node.left)
+    right = yield tree_height.frame(node.right)
+    return 1 + max(left, right)
+
+
+def _native_depth(n):
+    """Обычная рекурсия глубины n (для сравнения)."""
+    if n == 0:
+        return 0
+    return 1 + _native_depth(n - 1)
+
+
+@trampoline
+def _trampoline_depth(n):
+    """Рекурсия глубины n на явном стеке (для сравнения)."""
+    if n == 0:
+        return 0
+    return 1 + (yield _trampoline_depth.frame(n - 1))
+
+
+def benchmark_trampoline(depth=900, repeats=200, deep=1_000_000):
+    """
+    Сравнение стоимости кадра: обычная рекурсия и явный стек.
+
+    Явный стек медленнее обычной рекурсии; замер показывает, во
+    сколько раз (на допустимой и на большой глубине), и какая часть
+    разницы приходится на генераторы.
+
+    Args:
+        depth (int): Глубина, допустимая для обычной рекурсии.
+        repeats (int): Количество повторов для усреднения.
+        deep (int): Глубина, недоступная обычной рекурсии.
+
+    Returns:
+        dict: Время на кадр в наносекундах.
+    """
+    results = {}
+    for name, func in (("native", _native_depth),
+                       ("trampoline", _trampoline_depth)):
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter_ns()
+            func(depth)
+            best = min(best, time.perf_counter_ns() - start)
+        results[name] = best / depth
+
+    # Нижняя граница: только создание и завершение генераторов
+    frames = [None] * depth
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        for i in range(depth):
+            frames[i] = _trampoline_depth.frame(0)
+            try:
+                frames[i].send(None)
+            except StopIteration:
+                pass
+        best = min(best, time.perf_counter_ns() - start)
+    results["generator_floor"] = best / depth
+
+    start = time.perf_counter_ns()
+    _trampoline_depth(deep)
+    results["trampoline_deep"] = (time.perf_counter_ns() - start) / deep
+
+    print(f"Глубина {depth}, лучшее из {repeats} повторов:")
+    print(f"  обычная рекурсия: {results['native']:8.1f} нс/кадр")
+    print(f"  явный стек:       {results['trampoline']:8.1f} нс/кадр")
+    print(f"  только генераторы:{results['generator_floor']:8.1f} нс/кадр")
+    print(f"  явный стек медленнее обычной рекурсии в "
+          f"{results['trampoline'] / results['native']:.2f} раза")
+    print(f"  накладные расходы цикла: "
+          f"{results['trampoline'] - results['generator_floor']:.1f} нс/кадр")
+    print(f"Глубина {deep} (предел рекурсии "
+          f"{sys.getrecursionlimit()}):")
+    print(f"  явный стек:       {results['trampoline_deep']:8.1f} нс/кадр"
+          f" (в {results['trampoline_deep'] / results['native']:.2f} "
+          f"раза медленнее обычной рекурсии на глубине {depth})")
+    return results
+
+
+if __name__ == "__main__":
+    print("Длина 10000! в битах:", factorial_deep(10000).bit_length())
+    print("F(100000) mod 10^9:", fibonacci_deep(100000) % 10 ** 9)
+    print("Поиск 777777:", binary_search_deep(list(range(10 ** 6)), 777777))
+    benchmark_trampoline()
@@ -0,0 +1,256 @@
+"""
+Модуль внешней сортировки целых чисел в файлах, не помещающихся в память.
+
+Файл читается частями по размеру доступной памяти, каждая часть
+сортируется в памяти (integer_sort из sorts.py) и записывается во
+временный файл - серию. Затем серии сливаются потоково k-путевым
+слиянием (heapq.merge): не больше fan_in серий за раз, при большем
+количестве серий - в несколько проходов.
+
+Форматы файлов:
+    "binary" - числа подряд в машинном представлении array (по
+        умолчанию int64, код типа "q");
+    "text" - десятичные числа, разделенные пробелами или переводами
+        строк (результат - по одному числу в строке).
+"""
+
+from array import array
+import heapq
+import os
+import random
+import tempfile
+import time
+
+from sorts import integer_sort, is_sorted
+
+# Оценка пиковой памяти сортировки части в размерах части: исходный
+# массив, ключи, индексы перестановки и результат
+_SORT_MEMORY_FACTOR = 6
+# Минимальный лимит памяти в байтах
+_MIN_MEMORY_LIMIT = 4096
+# Доля лимита памяти на блок текстового файла: блок из B символов
+# разбивается на список до B / 2 строк по 50-60 байт
+_TEXT_BLOCK_FACTOR = 64
+_FORMATS = ("binary", "text")
+
+
+def _read_binary_chunks(file, count, typecode):
+    """Чтение двоичного файла частями по count чисел."""
+    while True:
+        chunk = array(typecode)
+        try:
+            chunk.fromfile(file, count)
+        except EOFError:
+            # Последняя неполная часть уже прочитана в chunk
+            pass
+        if not chunk:
+            return
+        yield chunk
+        if len(chunk) < count:
+            return
+
+
+def _read_text_chunks(file, count, typecode, block_size):
+    """
+    Чтение текстового файла частями по count чисел.
+
+    Файл читается блоками по block_size символов, а не строками:
+    числа могут быть разделены только пробелами, и одна строка бывает
+    размером с весь файл. Число, разрезанное границей блока,
+    дописывается следующим блоком.
+    """
+    chunk = array(typecode)
+    tail = ""
+    while True:
+        block = file.read(block_size)
+        tokens = (tail + block).split()
+        tail = ""
+        if block and tokens and not block[-1].isspace():
+            tail = tokens.pop()
+        for token in tokens:
+            chunk.append(int(token))
+            if len(chunk) == count:
+                yield chunk
+                chunk = array(typecode)
+        if not block:
+            break
+    if chunk:
+        yield chunk
+
+
+def _read_run(path, buffer_items, typecode):
+    """Потоковое чтение серии блоками по buffer_items чисел."""
+    with open(path, "rb") as file:
+        yield from _read_binary_chunks(file, buffer_items, typecode)
+
+
+def _iterate_run(path, buffer_items, typecode):
+    """Числа серии по одному (для heapq.merge)."""
+    for block in _read_run(path, buffer_items, typecode):
+        yield from block
+
+
+def _write_values(file, values, typecode, file_format, buffer_items):
+    """
+    Потоковая запись чисел блоками по buffer_items.
+
+    Returns:
+        Количество записанных чисел
+    """
+    written = 0
+    block = array(typecode)
+    for value in values:
+        block.append(value)
+        if len(block) == buffer_items:
+            written += _flush_block(file, block, file_format)
+            block = array(typecode)
+    if block:
+        written += _flush_block(file, block, file_format)
+    return written
+
+
+def _flush_block(file, block, file_format):
+    """Запись одного блока в файл."""
+    if file_format == "binary":
+        block.tofile(file)
+    else:
+        file.write("\n".join(map(str, block)))
+        file.write("\n")
+    return len(block)
+
+
+def _open_output(path, file_format):
+    """Открытие выходного файла в нужном режиме."""
+    if file_format == "binary":
+        return open(path, "wb")
+    return open(path, "w", encoding="utf-8")
+
+
+def _merge_runs(paths, output, typecode, file_format, buffer_items):
+    """Слияние серий в открытый файл output."""
+    streams = [_iterate_run(path, buffer_items, typecode) for path in paths]
+    return _write_values(output, heapq.merge(*streams), typecode,
+                         file_format, buffer_items)
+
+
+def external_sort(input_path, output_path, memory_limit=64 * 2 ** 20,
+                  fan_in=16, file_format="binary", typecode="q",
+                  temp_dir=None, sort_function=integer_sort):
+    """
+    Внешняя сортировка файла целых чисел с ограничением памяти.
+
+    Args:
+        input_path: Исходный файл
+        output_path: Файл результата (в том же формате)
+        memory_limit: Лимит памяти в байтах на буферы и сортировку
+            части (служебные объекты Python не учитываются)
+        fan_in: Количество серий, сливаемых за один проход (не меньше 2)
+        file_format: "binary" или "text"
+        typecode: Код типа array для чисел (по умолчанию int64)
+        temp_dir: Каталог для временных серий (по умолчанию системный)
+        sort_function: Сортировка части в памяти (на месте)
+
+    Returns:
+        Словарь: количество чисел, серий и проходов слияния
+
+    Сложность:
+        Временная: O(n log n) сравнений, O(n log_k(n/M)) чтений и
+            записей, где M - размер части, k - fan_in
+        Пространственная: O(memory_limit) памяти, O(n) на диске
+    """
+    if file_format not in _FORMATS:
+        raise ValueError(f"Неизвестный формат файла: {file_format}")
+    if fan_in < 2:
+        raise ValueError("Количество сливаемых серий должно быть не "
+                         "меньше 2")
+    if memory_limit < _MIN_MEMORY_LIMIT:
+        raise ValueError(
+            f"Лимит памяти должен быть не меньше {_MIN_MEMORY_LIMIT} байт"
+        )
+    itemsize = array(typecode).itemsize
+    if file_format == "binary" and os.path.getsize(input_path) % itemsize:
+        raise ValueError(
+            f"Размер файла не кратен размеру числа ({itemsize} байт)"
+        )
+    chunk_items = max(1, memory_limit // (itemsize * _SORT_MEMORY_FACTOR))
+    # При слиянии память делится между fan_in входами и выходом
+    buffer_items = max(1, memory_limit // (itemsize * (fan_in + 1)))
+    stats = {"count": 0, "runs": 0, "passes": 0}
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as work_dir:
+        runs = []
+        if file_format == "binary":
+            source = open(input_path, "rb")
+            chunks = _read_binary_chunks(source, chunk_items, typecode)
+        else:
+            source = open(input_path, "r", encoding="utf-8")
+            chunks = _read_text_chunks(
+                source, chunk_items, typecode,
+                max(1, memory_limit // _TEXT_BLOCK_FACTOR)
+            )
+        with source:
+            for chunk in chunks:
+                sort_function(chunk)
+                path = os.path.join(work_dir, f"run-{len(runs)}.bin")
+                with open(path, "wb") as run:
+                    chunk.tofile(run)
+                runs.append(path)
+                stats["count"] += len(chunk)
+                del chunk
+        stats["runs"] = len(runs)
+
+        generation = 0
+        while len(runs) > fan_in:
+            generation += 1
+            merged = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                path = os.path.join(work_dir,
+                                    f"merge-{generation}-{len(merged)}.bin")
+                with open(path, "wb") as output:
+                    _merge_runs(group, output, typecode, "binary",
+                                buffer_items)
+                for old in group:
+                    os.remove(old)
+                merged.append(path)
+            runs = merged
+            stats["passes"] += 1
+
+        with _open_output(output_path, file_format) as output:
+            _merge_runs(runs, output, typecode, file_format, buffer_items)
+        if runs:
+            stats["passes"] += 1
+    return stats
+
+
+def read_sorted_file(path, file_format="binary", typecode="q"):
+    """Чтение файла чисел целиком в array (для проверки результата)."""
+    values = array(typecode)
+    if file_format == "binary":
+        with open(path, "rb") as file:
+            values.frombytes(file.read())
+    else:
+        with open(path, "r", encoding="utf-8") as file:
+            values.extend(int(token) for token in file.read().split())
+    return values
+
+
+if __name__ == "__main__":
+    size = 2_000_000
+    with tempfile.TemporaryDirectory() as demo_dir:
+        source_path = os.path.join(demo_dir, "input.bin")
+        result_path = os.path.join(demo_dir, "output.bin")
+        data = array("q", (random.randint(-10 ** 12, 10 ** 12)
+                           for _ in range(size)))
+        with open(source_path, "wb") as source_file:
+            data.tofile(source_file)
+        for limit, fan in ((8 * 2 ** 20, 16), (2 * 2 ** 20, 4)):
+            start_time = time.perf_counter()
+            result = external_sort(source_path, result_path,
+                                   memory_limit=limit, fan_in=fan)
+            elapsed = time.perf_counter() - start_time
+            sorted_ok = is_sorted(read_sorted_file(result_path))
+            status = "OK" if sorted_ok else "ERR"
+            print(f"Лимит {limit // 2 ** 20} МБ, fan_in {fan}: "
+                  f"{result['runs']} серий, {result['passes']} проходов, "
+                  f"{elapsed:.2f} сек {status}")
@@ -0,0 +1,318 @@
+"""
+Модуль сортировок на NumPy и пакетной сортировки многих массивов.
+
+Сортировка, argsort и lexsort выполняются в NumPy за один вызов без
+поэлементной работы интерпретатора. Пакетный API сортирует тысячи
+коротких массивов сразу: строки двумерного массива (sort_rows) или
+отрезки "рваного" массива, заданные границами offsets
+(sort_segments): отрезок i - values[offsets[i]:offsets[i + 1]].
+Вызов merge_sort в цикле для каждой короткой записи заменяется одним
+вызовом sort_many.
+
+Все элементы и записи должны быть одного типа: NumPy молча привел бы
+их к общему (целые вместе со строками - к строкам, вместе с
+вещественными - к float64), поэтому разнотипные данные вызывают
+TypeError.
+"""
+
+from array import array
+import time
+
+import numpy as np
+
+from generate_data import generate_random_array
+from sorts import merge_sort, store_result
+
+# Рваный массив дополняется до прямоугольного, если это увеличивает
+# его не больше чем в _PAD_FACTOR раз; иначе - сортировка по ключам
+_PAD_FACTOR = 4
+
+
+def _as_array(values):
+    """
+    Преобразование в numpy.ndarray без приведения разнотипных
+    элементов списка к общему типу.
+    """
+    if not hasattr(values, "dtype") and not isinstance(values, array):
+        classes = {value.__class__ for value in values}
+        if len(classes) > 1:
+            names = ", ".join(sorted(cls.__name__ for cls in classes))
+            raise TypeError(f"Элементы должны быть одного типа: {names}")
+    return np.asarray(values)
+
+
+def numpy_sort(arr, kind="quicksort"):
+    """
+    Сортировка массива средствами NumPy.
+
+    Args:
+        arr: Одномерный список, array.array или numpy.ndarray
+            однотипных элементов (строки двумерного массива сортирует
+            sort_rows)
+        kind: Алгоритм numpy.sort ("quicksort" - интросорт, на x86 с
+            SIMD; "stable" - поразрядная для целых до 16 бит, иначе
+            timsort). Для сортировки значений устойчивость не нужна:
+            равные элементы неразличимы
+
+    Returns:
+        Отсортированный массив (тот же объект)
+
+    Сложность:
+        Временная: O(n log n)
+        Пространственная: O(n)
+    """
+    if hasattr(arr, "shape"):
+        if arr.ndim != 1:
+            raise ValueError(
+                "Ожидается одномерный массив (строки - sort_rows)"
+            )
+        arr.sort(kind=kind)
+        return arr
+    if len(arr) < 2:
+        return arr
+    return store_result(arr, np.sort(_as_array(arr), kind=kind))
+
+
+def argsort(values, kind="stable"):
+    """
+    Индексы, упорядочивающие массив.
+
+    Returns:
+        numpy.ndarray индексов: values[result] отсортирован; при
+        kind="stable" равные элементы сохраняют исходный порядок
+    """
+    return np.argsort(np.asarray(values), kind=kind)
+
+
+def lexsort(keys):
+    """
+    Индексы для сортировки записей по нескольким ключам.
+
+    В отличие от numpy.lexsort, ключи перечисляются по убыванию
+    важности: keys[0] - главный ключ, следующие различают записи с
+    равными предыдущими ключами. Сортировка устойчивая.
+
+    Args:
+        keys: Последовательность столбцов-ключей одинаковой длины
+
+    Returns:
+        numpy.ndarray индексов записей
+    """
+    if len(keys) == 0:
+        raise ValueError("Нужен хотя бы один ключ сортировки")
+    return np.lexsort([np.asarray(key) for key in reversed(keys)])
+
+
+def _as_matrix(matrix):
+    """Проверка, что пакет задан двумерным массивом."""
+    matrix = np.asarray(matrix)
+    if matrix.ndim != 2:
+        raise ValueError("Ожидается двумерный массив (строка - запись)")
+    return matrix
+
+
+def sort_rows(matrix, kind="quicksort"):
+    """
+    Пакетная сортировка: каждая строка двумерного массива отдельно.
+
+    Returns:
+        Новый numpy.ndarray с отсортированными строками
+
+    Сложность: O(k * m log m) для k строк длины m за один вызов NumPy
+    """
+    return np.sort(_as_matrix(matrix), axis=1, kind=kind)
+
+
+def argsort_rows(matrix, kind="stable"):
+    """Индексы, упорядочивающие каждую строку (внутри строки)."""
+    return np.argsort(_as_matrix(matrix), axis=1, kind=kind)
+
+
+def _check_offsets(values, offsets):
+    """Проверка границ отрезков рваного массива."""
+    values = np.asarray(values)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if values.ndim != 1 or offsets.ndim != 1 or len(offsets) == 0:
+        raise ValueError("Ожидаются одномерные values и offsets")
+    if (offsets[0] != 0 or offsets[-1] != len(values)
+            or np.any(np.diff(offsets) < 0)):
+        raise ValueError(
+            "Границы отрезков должны возрастать от 0 до len(values)"
+        )
+    return values, offsets
+
+
+def _fill_value(dtype):
+    """
+    Значение для дополнения строк, не меньшее любого элемента
+    (None, если для типа его нет).
+    """
+    if dtype.kind == "f":
+        # NaN numpy.sort ставит в конец
+        return np.nan
+    if dtype.kind in "iu":
+        return np.iinfo(dtype).max
+    if dtype.kind == "b":
+        return True
+    return None
+
+
+def _pad_segments(values, offsets):
+    """
+    Дополнение отрезков до строк прямоугольного массива значением,
+    не меньшим любого элемента.
+
+    Returns:
+        Пара (двумерный массив, маска настоящих элементов) или None,
+        если подходящего значения нет или отрезки сильно различаются
+        по длине
+    """
+    lengths = np.diff(offsets)
+    width = int(lengths.max(initial=0))
+    fill = _fill_value(values.dtype)
+    if fill is None or len(lengths) * width > _PAD_FACTOR * len(values):
+        return None
+    padded = np.full((len(lengths), width), fill, dtype=values.dtype)
+    mask = np.arange(width) < lengths[:, None]
+    padded[mask] = values
+    return padded, mask
+
+
+def _segment_order(values, offsets, kind):
+    """
+    Индексы, упорядочивающие каждый отрезок (в нумерации values).
+
+    Отрезки близкой длины сортируются как строки дополненного
+    массива; иначе выполняется устойчивая сортировка по паре (номер
+    отрезка, значение).
+    """
+    padding = _pad_segments(values, offsets)
+    if padding is not None:
+        padded, mask = padding
+        # Дополнение стоит в конце строки и при устойчивой сортировке
+        # остается после равных ему настоящих элементов
+        order = np.argsort(padded, axis=1, kind="stable")
+        return (order + offsets[:-1, None])[mask]
+    segment = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    order = np.argsort(values, kind=kind)
+    return order[np.argsort(segment[order], kind="stable")]
+
+
+def sort_segments(values, offsets, kind="quicksort"):
+    """
+    Пакетная сортировка отрезков рваного массива.
+
+    Args:
+        values: Одномерный массив всех элементов подряд
+        offsets: Границы отрезков длины k + 1: от 0 до len(values)
+        kind: Алгоритм numpy.sort
+
+    Returns:
+        Новый numpy.ndarray, в котором каждый отрезок отсортирован
+
+    Сложность: O(k * m log m), где m - длина самого длинного отрезка
+    """
+    values, offsets = _check_offsets(values, offsets)
+    padding = _pad_segments(values, offsets)
+    if padding is None:
+        return values[_segment_order(values, offsets, kind)]
+    padded, mask = padding
+    padded.sort(axis=1, kind=kind)
+    return padded[mask]
+
+
+def argsort_segments(values, offsets, kind="stable"):
+    """
+    Индексы, упорядочивающие каждый отрезок рваного массива.
+
+    Returns:
+        numpy.ndarray индексов в нумерации values: values[result] -
+        результат sort_segments, индексы отрезка i остаются в
+        пределах offsets[i]:offsets[i + 1]
+    """
+    values, offsets = _check_offsets(values, offsets)
+    return _segment_order(values, offsets, kind)
+
+
+def sort_many(records, kind="quicksort"):
+    """
+    Сортировка многих коротких массивов одним вызовом NumPy.
+
+    Записи одинаковой длины сортируются как строки двумерного
+    массива, разной длины - как отрезки рваного массива. Основное
+    время уходит на преобразование списков в ndarray и обратно: если
+    записи можно хранить сразу в NumPy, быстрее sort_rows и
+    sort_segments.
+
+    Args:
+        records: Последовательность списков (или других массивов)
+            элементов одного типа
+        kind: Алгоритм numpy.sort
+
+    Returns:
+        Список отсортированных списков в порядке записей
+
+    Сложность: O(n log m) для n элементов и записей длины до m,
+        без вызовов функций интерпретатора на каждую запись
+    """
+    if len(records) == 0:
+        return []
+    arrays = [_as_array(record) for record in records]
+    # Пустые записи не задают тип (numpy.asarray([]) - float64)
+    filled = [values for values in arrays if len(values)]
+    kinds = {values.dtype.kind for values in filled}
+    if len(kinds) > 1:
+        raise TypeError(
+            f"Записи должны быть одного типа: {', '.join(sorted(kinds))}"
+        )
+    lengths = [len(values) for values in arrays]
+    if min(lengths) == max(lengths):
+        return sort_rows(np.array(arrays), kind).tolist()
+    offsets = np.zeros(len(records) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    values = np.concatenate(filled)
+    flat = sort_segments(values, offsets, kind).tolist()
+    bounds = offsets.tolist()
+    return [flat[bounds[i]:bounds[i + 1]] for i in range(len(records))]
+
+
+def compare_batched_sort(count=10_000, size=100):
+    """
+    Сравнение цикла merge_sort по записям с пакетной сортировкой.
+
+    Returns:
+        dict: Время в секундах для каждого способа
+    """
+    records = [generate_random_array(size) for _ in range(count)]
+    ragged = [record[:size // 2 + i % (size // 2 + 1)]
+              for i, record in enumerate(records)]
+    matrix = np.array(records)
+    expected = [sorted(record) for record in records]
+    methods = {
+        "merge_sort в цикле": lambda: [merge_sort(record.copy())
+                                        for record in records],
+        "sorted в цикле": lambda: [sorted(record) for record in records],
+        "sort_many": lambda: sort_many(records),
+        "sort_many (рваные)": lambda: sort_many(ragged),
+        "sort_rows (ndarray)": lambda: sort_rows(matrix),
+    }
+    results = {}
+    print(f"{count} записей по {size} элементов")
+    for name, method in methods.items():
+        start_time = time.perf_counter()
+        result = method()
+        elapsed = time.perf_counter() - start_time
+        results[name] = elapsed
+        if name.startswith("sort_rows"):
+            result = result.tolist()
+        if "рваные" in name:
+            ok = result == [sorted(record) for record in ragged]
+        else:
+            ok = result == expected
+        status = "OK" if ok else "ERR"
+        print(f"  {name:20}: {elapsed:.3f} сек {status}")
+    return results
+
+
+if __name__ == "__main__":
+    compare_batched_sort()
@@ -6,15 +6,23 @@
 
 import time
 import csv
-from generate_data import generate_test_datasets
+import os
+from generate_data import generate_random_array, generate_test_datasets
 from sorts import (
     bubble_sort,
     selection_sort,
     insertion_sort,
     merge_sort,
     quick_sort,
+    intro_sort,
+    natural_merge_sort,
+    counting_sort,
+    radix_sort,
+    parallel_sort,
+    sort,
     is_sorted
 )
+from numpy_sorts import numpy_sort
 
 # Список тестируемых алгоритмов
 SORT_FUNCTIONS = {
@@ -23,6 +31,12 @@ SORT_FUNCTIONS = {
     "insertion_sort": insertion_sort,
     "merge_sort": merge_sort,
     "quick_sort": quick_sort,
+    "intro_sort": intro_sort,
+    "natural_merge_sort": natural_merge_sort,
+    "counting_sort": counting_sort,
+    "radix_sort": radix_sort,
+    "adaptive_sort": sort,
+    "numpy_sort": numpy_sort,
 }
 
 
@@ -127,6 +141,55 @@ def print_summary_statistics(results):
         print(f"Лучший алгоритм в среднем: {best_algo} ({best_time:.2f} ms)")
 
 
+def run_parallel_speedup(size=2_000_000, worker_counts=None):
+    """
+    Ускорение parallel_sort в зависимости от числа процессов.
+
+    Args:
+        size: Размер случайного массива
+        worker_counts: Проверяемые количества процессов (по умолчанию
+            1, 2, 4, ... до числа ядер)
+
+    Returns:
+        Список словарей с временем и ускорением относительно одного
+        процесса
+    """
+    cores = os.cpu_count() or 1
+    if worker_counts is None:
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= cores:
+            worker_counts.append(worker_counts[-1] * 2)
+        if worker_counts[-1] != cores:
+            worker_counts.append(cores)
+    data = generate_random_array(size)
+
+    print("=" * 50)
+    print(f"ПАРАЛЛЕЛЬНАЯ СОРТИРОВКА: {size} элементов, ядер: {cores}")
+    print("=" * 50)
+    results = []
+    base_time = None
+    for workers in worker_counts:
+        chunk_size = -(-size // workers)
+        data_copy = data.copy()
+        start = time.perf_counter()
+        parallel_sort(data_copy, workers=workers, chunk_size=chunk_size)
+        elapsed = (time.perf_counter() - start) * 1000
+        if base_time is None:
+            base_time = elapsed
+        speedup = base_time / elapsed
+        status = "OK" if is_sorted(data_copy) else "ERR"
+        print(f"Процессов {workers:3} | {elapsed:9.2f} ms | "
+              f"ускорение {speedup:5.2f}x "
+              f"(эффективность {speedup / workers:4.0%}) {status}")
+        results.append({
+            "workers": workers,
+            "size": size,
+            "time_ms": elapsed,
+            "speedup": speedup
+        })
+    return results
+
+
 if __name__ == "__main__":
     print("Запуск тестов производительности алгоритмов сортировки...")
     results = run_performance_tests()
@@ -144,5 +207,6 @@ if __name__ == "__main__":
 
     analyze_results(results)
     print_summary_statistics(results)
+    run_parallel_speedup()
 
     print("Тестирование завершено! Результаты сохранены в results.csv")
@@ -2,6 +2,13 @@
 Модуль с реализацией алгоритмов сортировки.
 """
 
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+from multiprocessing import shared_memory
+import os
+import random
 from typing import List, Any
 
 
@@ -161,6 +168,868 @@ def quick_sort(arr: List[Any]) -> List[Any]:
     return quick_sort(left) + middle + quick_sort(right)
 
 
+# Подмассивы не длиннее порога досортировываются вставками
+_INSERTION_CUTOFF = 16
+# С этой длины опорный элемент выбирается медианой девяти (ninther)
+_NINTHER_CUTOFF = 128
+
+
+def _insertion_sort_range(arr: List[Any], lo: int, hi: int) -> None:
+    """Сортировка вставками отрезка arr[lo..hi] на месте."""
+    for i in range(lo + 1, hi + 1):
+        key = arr[i]
+        j = i - 1
+        while j >= lo and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
+def _sift_down(arr: List[Any], lo: int, root: int, end: int) -> None:
+    """Просеивание вниз в куче, занимающей arr[lo..lo + end - 1]."""
+    item = arr[lo + root]
+    child = 2 * root + 1
+    while child < end:
+        if child + 1 < end and arr[lo + child] < arr[lo + child + 1]:
+            child += 1
+        if not item < arr[lo + child]:
+            break
+        arr[lo + root] = arr[lo + child]
+        root = child
+        child = 2 * root + 1
+    arr[lo + root] = item
+
+
+def _heap_sort_range(arr: List[Any], lo: int, hi: int) -> None:
+    """Пирамидальная сортировка отрезка arr[lo..hi] на месте."""
+    size = hi - lo + 1
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(arr, lo, root, size)
+    for end in range(size - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down(arr, lo, 0, end)
+
+
+def _median_of_three(arr: List[Any], i: int, j: int, k: int) -> int:
+    """Индекс медианы из arr[i], arr[j], arr[k]."""
+    a, b, c = arr[i], arr[j], arr[k]
+    if a < b:
+        if b < c:
+            return j
+        return k if a < c else i
+    if a < c:
+        return i
+    return k if b < c else j
+
+
+def _choose_pivot(arr: List[Any], lo: int, hi: int) -> Any:
+    """Опорный элемент: медиана трех или медиана девяти (ninther)."""
+    mid = (lo + hi) // 2
+    if hi - lo + 1 < _NINTHER_CUTOFF:
+        return arr[_median_of_three(arr, lo, mid, hi)]
+    step = (hi - lo + 1) // 8
+    first = _median_of_three(arr, lo, lo + step, lo + 2 * step)
+    second = _median_of_three(arr, mid - step, mid, mid + step)
+    third = _median_of_three(arr, hi - 2 * step, hi - step, hi)
+    return arr[_median_of_three(arr, first, second, third)]
+
+
+def _partition_three_way(arr: List[Any], lo: int, hi: int,
+                         pivot: Any) -> tuple:
+    """
+    Разбиение Дейкстры на три части: < pivot, == pivot, > pivot.
+
+    Returns:
+        Границы (lt, gt) отрезка равных элементов arr[lt..gt]
+    """
+    lt, i, gt = lo, lo, hi
+    while i <= gt:
+        item = arr[i]
+        if item < pivot:
+            arr[lt], arr[i] = item, arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < item:
+            arr[i], arr[gt] = arr[gt], item
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def intro_sort(arr: List[Any], max_depth: int = None) -> List[Any]:
+    """
+    Интроспективная сортировка на месте.
+
+    Быстрая сортировка с опорным элементом по медиане трех (медиане
+    девяти для больших отрезков) и трехчастным разбиением, поэтому
+    повторяющиеся ключи не замедляют ее. Отрезки короче порога
+    досортировываются вставками. Если глубина рекурсии превышает
+    2·log₂ n (неудачные опорные элементы), отрезок сортируется
+    пирамидальной сортировкой. Рекурсия идет в меньшую часть, большая
+    обрабатывается в цикле.
+
+    Args:
+        arr: Исходный массив
+        max_depth: Глубина, после которой отрезок сортируется
+            пирамидальной сортировкой (по умолчанию 2·log₂ n; при 0 -
+            сразу пирамидальная сортировка)
+
+    Returns:
+        Отсортированный массив (тот же объект)
+
+    Сложность:
+        Временная:
+            - Худший случай: O(n log n)
+            - Средний случай: O(n log n)
+            - Лучший случай: O(n) (все элементы равны)
+        Пространственная: O(log n)
+    """
+    if max_depth is None:
+        max_depth = 2 * len(arr).bit_length()
+    if max_depth < 0:
+        raise ValueError("Глубина не может быть отрицательной")
+    if len(arr) > 1:
+        _intro_sort(arr, 0, len(arr) - 1, max_depth)
+    return arr
+
+
+def _intro_sort(arr: List[Any], lo: int, hi: int, depth: int) -> None:
+    """Рекурсивный шаг интроспективной сортировки отрезка arr[lo..hi]."""
+    while hi - lo + 1 > _INSERTION_CUTOFF:
+        if depth == 0:
+            _heap_sort_range(arr, lo, hi)
+            return
+        depth -= 1
+        pivot = _choose_pivot(arr, lo, hi)
+        lt, gt = _partition_three_way(arr, lo, hi, pivot)
+        if lt - lo < hi - gt:
+            _intro_sort(arr, lo, lt - 1, depth)
+            lo = gt + 1
+        else:
+            _intro_sort(arr, gt + 1, hi, depth)
+            hi = lt - 1
+    _insertion_sort_range(arr, lo, hi)
+
+
+# Количество побед одной серии подряд до перехода в режим галопа
+_MIN_GALLOP = 7
+
+
+def _min_run(n: int) -> int:
+    """
+    Минимальная длина серии (как в Timsort): от 32 до 64, чтобы
+    число серий было степенью двойки или немного меньше.
+    """
+    extra = 0
+    while n >= 64:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+
+def _count_run(arr: List[Any], lo: int, hi: int) -> int:
+    """
+    Длина готовой серии, начинающейся с arr[lo].
+
+    Строго убывающая серия разворачивается на месте (строгость
+    сохраняет устойчивость).
+
+    Returns:
+        Индекс конца серии (не включая)
+    """
+    end = lo + 1
+    if end == hi:
+        return end
+    if arr[end] < arr[lo]:
+        while end < hi and arr[end] < arr[end - 1]:
+            end += 1
+        arr[lo:end] = arr[lo:end][::-1]
+    else:
+        while end < hi and not arr[end] < arr[end - 1]:
+            end += 1
+    return end
+
+
+def _binary_insertion(arr: List[Any], lo: int, start: int,
+                      hi: int) -> None:
+    """Досортировка arr[start:hi] вставками в готовый arr[lo:start]."""
+    for i in range(start, hi):
+        item = arr[i]
+        pos = bisect_right(arr, item, lo, i)
+        if pos < i:
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = item
+
+
+def _gallop_left(arr: List[Any], key: Any, lo: int, hi: int) -> int:
+    """
+    Первый индекс в arr[lo:hi] с элементом не меньше key.
+
+    Экспоненциальный поиск от lo (шаги 1, 3, 7, ...), затем бинарный
+    внутри найденного интервала: O(log d), где d - ответ минус lo.
+    """
+    if lo >= hi or not arr[lo] < key:
+        return lo
+    last, offset = lo, 1
+    while lo + offset < hi and arr[lo + offset] < key:
+        last = lo + offset
+        offset = 2 * offset + 1
+    return bisect_left(arr, key, last + 1, min(lo + offset, hi))
+
+
+def _gallop_right(arr: List[Any], key: Any, lo: int, hi: int) -> int:
+    """Первый индекс в arr[lo:hi] с элементом больше key (галопом)."""
+    if lo >= hi or key < arr[lo]:
+        return lo
+    last, offset = lo, 1
+    while lo + offset < hi and not key < arr[lo + offset]:
+        last = lo + offset
+        offset = 2 * offset + 1
+    return bisect_right(arr, key, last + 1, min(lo + offset, hi))
+
+
+def _merge_runs(src: List[Any], dst: List[Any], lo: int, mid: int,
+                hi: int) -> None:
+    """
+    Устойчивое слияние серий src[lo:mid] и src[mid:hi] в dst[lo:hi].
+
+    После _MIN_GALLOP побед одной серии подряд остаток ее выигрышного
+    участка находится галопом и копируется одним срезом.
+    """
+    if not src[mid] < src[mid - 1]:
+        # Серии уже упорядочены друг относительно друга
+        dst[lo:hi] = src[lo:hi]
+        return
+    i, j, k = lo, mid, lo
+    wins_left = wins_right = 0
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+            k += 1
+            wins_right += 1
+            wins_left = 0
+            if wins_right >= _MIN_GALLOP:
+                end = _gallop_left(src, src[i], j, hi)
+                dst[k:k + end - j] = src[j:end]
+                k += end - j
+                j = end
+                wins_right = 0
+        else:
+            dst[k] = src[i]
+            i += 1
+            k += 1
+            wins_left += 1
+            wins_right = 0
+            if wins_left >= _MIN_GALLOP and j < hi:
+                end = _gallop_right(src, src[j], i, mid)
+                dst[k:k + end - i] = src[i:end]
+                k += end - i
+                i = end
+                wins_left = 0
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    elif j < hi:
+        dst[k:hi] = src[j:hi]
+
+
+def natural_merge_sort(arr: List[Any]) -> List[Any]:
+    """
+    Естественная сортировка слиянием снизу вверх (в духе Timsort).
+
+    Массив делится на готовые серии: неубывающие берутся как есть,
+    строго убывающие разворачиваются, короткие дополняются бинарными
+    вставками до minrun. Затем соседние серии попарно сливаются
+    проходами снизу вверх, поочередно из массива в единственный
+    вспомогательный буфер и обратно. При слиянии используется
+    галоп, если одна серия долго выигрывает. Сортировка устойчива.
+
+    Args:
+        arr: Исходный массив
+
+    Returns:
+        Отсортированный массив (тот же объект)
+
+    Сложность:
+        Временная:
+            - Худший случай: O(n log n)
+            - Средний случай: O(n log n)
+            - Лучший случай: O(n) (готовые или обратные серии)
+        Пространственная: O(n)
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    min_run = _min_run(n)
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        end = _count_run(arr, lo, n)
+        if end - lo < min_run:
+            forced = min(lo + min_run, n)
+            _binary_insertion(arr, lo, end, forced)
+            end = forced
+        bounds.append(end)
+        lo = end
+    if len(bounds) == 2:
+        return arr
+
+    src, dst = arr, [None] * n
+    while len(bounds) > 2:
+        merged = [0]
+        for p in range(0, len(bounds) - 1, 2):
+            lo = bounds[p]
+            if p + 2 < len(bounds):
+                mid, hi = bounds[p + 1], bounds[p + 2]
+                _merge_runs(src, dst, lo, mid, hi)
+            else:
+                hi = bounds[p + 1]
+                dst[lo:hi] = src[lo:hi]
+            merged.append(hi)
+        bounds = merged
+        src, dst = dst, src
+    if src is not arr:
+        arr[:] = src
+    return arr
+
+
+# Допустимый диапазон значений для NumPy-реализаций (int64)
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+# Сортировка подсчетом выбирается, если диапазон ключей не больше
+# _COUNTING_RANGE_FACTOR * n
+_COUNTING_RANGE_FACTOR = 2
+# counting_sort переходит на поразрядную сортировку, если массив
+# счетчиков длиннее _COUNTING_MAX_FACTOR * n и _COUNTING_MIN_RANGE
+_COUNTING_MAX_FACTOR = 64
+_COUNTING_MIN_RANGE = 1 << 16
+
+
+def _integer_values(arr):
+    """
+    Подготовка целочисленного массива для линейных сортировок.
+
+    Returns:
+        Пара (numpy.ndarray int64 или None, границы (min, max)).
+        ndarray возвращается, если NumPy установлен и значения
+        помещаются в int64; иначе - None (сортировка на Python).
+    """
+    if hasattr(arr, "shape"):
+        if arr.dtype.kind not in "iu":
+            raise ValueError("Ожидается массив целых чисел")
+        return arr, (int(arr.min()), int(arr.max()))
+    if isinstance(arr, array):
+        if arr.typecode in "fdu":
+            raise ValueError("Ожидается массив целых чисел")
+    elif any(value.__class__ is not int for value in arr):
+        raise ValueError("Ожидается массив целых чисел")
+    bounds = (min(arr), max(arr))
+    if _INT64_MIN <= bounds[0] and bounds[1] <= _INT64_MAX:
+        try:
+            import numpy as np
+        except ImportError:
+            return None, bounds
+        return np.asarray(arr, dtype=np.int64), bounds
+    return None, bounds
+
+
+def store_result(arr, result):
+    """
+    Запись отсортированного результата в исходный массив.
+
+    Args:
+        arr: Исходный список, array.array или numpy.ndarray
+        result: Значения в том же количестве (список или ndarray)
+
+    Returns:
+        arr с записанными значениями
+    """
+    if isinstance(arr, array):
+        if hasattr(result, "shape"):
+            # Из ndarray - прямо в буфер array, без поэлементного обхода
+            import numpy as np
+
+            np.frombuffer(arr, dtype=arr.typecode)[:] = result
+        else:
+            arr[:] = array(arr.typecode, result)
+    elif isinstance(arr, list) and hasattr(result, "tolist"):
+        arr[:] = result.tolist()
+    else:
+        arr[:] = result
+    return arr
+
+
+def counting_sort(arr: List[int]) -> List[int]:
+    """
+    Сортировка подсчетом для целых чисел (в том числе отрицательных).
+
+    Считается количество каждого значения в диапазоне [min, max],
+    затем массив заполняется значениями по порядку. С NumPy подсчет
+    выполняет numpy.bincount, без него - список счетчиков. Подходит,
+    когда диапазон k = max - min + 1 сравним с n. Для редких ключей
+    (k больше _COUNTING_MAX_FACTOR * n и _COUNTING_MIN_RANGE)
+    счетчики не выделяются: массив сортируется поразрядно.
+
+    Args:
+        arr: Список, array.array или numpy.ndarray целых чисел
+
+    Returns:
+        Отсортированный массив (тот же объект)
+
+    Сложность:
+        Временная: O(n + k) во всех случаях
+        Пространственная: O(n + k)
+    """
+    if len(arr) < 2:
+        return arr
+    values, (low, high) = _integer_values(arr)
+    if high - low >= max(_COUNTING_MAX_FACTOR * len(arr),
+                         _COUNTING_MIN_RANGE):
+        return _radix_sort(arr, values, low, high)
+    return _counting_sort(arr, values, low, high)
+
+
+def _counting_sort(arr, values, low, high):
+    """Сортировка подсчетом проверенного массива (см. _integer_values)."""
+    if values is not None:
+        import numpy as np
+
+        # Разность вычисляется в int64 (для uint64 - в беззнаковом
+        # типе): в исходном типе, например int8, она переполняется
+        if values.dtype.kind == "u":
+            keys = (values - values.dtype.type(low)).astype(np.int64)
+        else:
+            keys = values.astype(np.int64) - low
+        counts = np.bincount(keys)
+        return store_result(arr, np.repeat(
+            np.arange(low, high + 1, dtype=values.dtype), counts
+        ))
+    counts = [0] * (high - low + 1)
+    for value in arr:
+        counts[value - low] += 1
+    position = 0
+    for value, count in enumerate(counts, low):
+        if count:
+            arr[position:position + count] = [value] * count
+            position += count
+    return arr
+
+
+def _radix_sort_numpy(values, low, digit_bits):
+    """
+    LSD-сортировка на NumPy: каждый проход - устойчивая сортировка
+    разрядов uint8/uint16 (NumPy выполняет ее поразрядно за O(n)).
+    """
+    import numpy as np
+
+    # Сдвиг на минимум в беззнаковой арифметике: отрицательные числа
+    # становятся неотрицательными ключами без переполнения
+    offset = np.uint64(low % (1 << 64))
+    if values.dtype.itemsize == 8:
+        keys = values.view(np.uint64) - offset
+    else:
+        keys = values.astype(np.int64).view(np.uint64) - offset
+    # Буферы выделяются один раз: разряды, ключи для перестановки
+    spare = np.empty_like(keys)
+    digits = np.empty(len(keys), dtype=np.uint8 if digit_bits <= 8
+                      else np.uint16)
+    mask = np.uint64((1 << digit_bits) - 1)
+    for shift in range(0, int(keys.max()).bit_length(), digit_bits):
+        np.right_shift(keys, np.uint64(shift), out=spare)
+        np.bitwise_and(spare, mask, out=spare)
+        np.copyto(digits, spare, casting="unsafe")
+        np.take(keys, np.argsort(digits, kind="stable"), out=spare)
+        keys, spare = spare, keys
+    del spare, digits
+    keys += offset
+    if values.dtype.itemsize == 8:
+        return keys.view(values.dtype)
+    return keys.view(np.int64).astype(values.dtype)
+
+
+def _radix_sort_python(arr, low, high, digit_bits):
+    """LSD-сортировка на Python: раскладка по корзинам-спискам."""
+    keys = [value - low for value in arr] if low else list(arr)
+    mask = (1 << digit_bits) - 1
+    for shift in range(0, (high - low).bit_length(), digit_bits):
+        buckets = [[] for _ in range(mask + 1)]
+        append = [bucket.append for bucket in buckets]
+        for key in keys:
+            append[(key >> shift) & mask](key)
+        keys = [key for bucket in buckets for key in bucket]
+    return [key + low for key in keys] if low else keys
+
+
+def radix_sort(arr: List[int], digit_bits: int = 8) -> List[int]:
+    """
+    Поразрядная сортировка LSD для целых чисел (в том числе
+    отрицательных).
+
+    Из всех чисел вычитается минимум, затем ключи устойчиво
+    сортируются по разрядам из digit_bits бит, начиная с младшего.
+    Количество проходов - число разрядов в max - min. Значения,
+    помещающиеся в int64, сортируются на NumPy (если он установлен),
+    длинные целые - на Python.
+
+    Args:
+        arr: Список, array.array или numpy.ndarray целых чисел
+        digit_bits: Размер разряда в битах (8 - байт, 11, до 16)
+
+    Returns:
+        Отсортированный массив (тот же объект)
+
+    Сложность:
+        Временная: O(d·(n + 2^b)) во всех случаях, d - число разрядов
+        Пространственная: O(n + 2^b)
+    """
+    if not 1 <= digit_bits <= 16:
+        raise ValueError("Размер разряда должен быть от 1 до 16 бит")
+    if len(arr) < 2:
+        return arr
+    values, (low, high) = _integer_values(arr)
+    return _radix_sort(arr, values, low, high, digit_bits)
+
+
+def _radix_sort(arr, values, low, high, digit_bits=8):
+    """Поразрядная сортировка проверенного массива (см. _integer_values)."""
+    if values is not None:
+        return store_result(arr, _radix_sort_numpy(values, low, digit_bits))
+    return store_result(arr, _radix_sort_python(arr, low, high, digit_bits))
+
+
+def integer_sort(arr: List[int]) -> List[int]:
+    """
+    Линейная сортировка целых чисел с выбором алгоритма.
+
+    Если диапазон ключей не больше _COUNTING_RANGE_FACTOR * n,
+    используется сортировка подсчетом, иначе - поразрядная.
+
+    Args:
+        arr: Список, array.array или numpy.ndarray целых чисел
+
+    Returns:
+        Отсортированный массив (тот же объект)
+    """
+    if len(arr) < 2:
+        return arr
+    values, (low, high) = _integer_values(arr)
+    if high - low < _COUNTING_RANGE_FACTOR * len(arr):
+        return _counting_sort(arr, values, low, high)
+    return _radix_sort(arr, values, low, high)
+
+
+# Минимальный размер части для параллельной сортировки по умолчанию:
+# меньшие части не окупают передачу задач в процессы
+_MIN_PARALLEL_CHUNK = 50_000
+
+
+def _shared_view(memory, typecode, size):
+    """Массив поверх общей памяти: ndarray (с NumPy) или memoryview."""
+    try:
+        import numpy as np
+    except ImportError:
+        return memory.buf.cast(typecode)
+    return np.ndarray(size, dtype=typecode, buffer=memory.buf)
+
+
+def _release(view):
+    """Освобождение memoryview (ndarray освобождается сборщиком)."""
+    if isinstance(view, memoryview):
+        view.release()
+
+
+def _sort_shared_chunk(task):
+    """Сортировка части view[lo:hi] общей памяти (в рабочем процессе)."""
+    name, typecode, size, lo, hi = task
+    memory = shared_memory.SharedMemory(name=name)
+    view = _shared_view(memory, typecode, size)
+    try:
+        if isinstance(view, memoryview):
+            view[lo:hi] = array(typecode, sorted(view[lo:hi].tolist()))
+        else:
+            view[lo:hi].sort()
+    finally:
+        _release(view)
+        del view
+        memory.close()
+
+
+def _merge_shared_runs(task):
+    """
+    Слияние соседних отсортированных частей view[lo:mid] и
+    view[mid:hi] на месте (в рабочем процессе, только с NumPy).
+
+    Устойчивая сортировка NumPy для таких типов - Timsort: найдя две
+    готовые серии, она выполняет одно линейное слияние.
+    """
+    name, typecode, size, lo, hi = task
+    memory = shared_memory.SharedMemory(name=name)
+    view = _shared_view(memory, typecode, size)
+    try:
+        view[lo:hi].sort(kind="stable")
+    finally:
+        del view
+        memory.close()
+
+
+def _shared_typecode(arr) -> str:
+    """
+    Код типа элементов для общей памяти: int64 ('q'), uint64 ('Q')
+    или float64 ('d').
+    """
+    if hasattr(arr, "shape"):
+        kind = arr.dtype.kind
+        if kind in "iu" and arr.dtype.itemsize <= 8:
+            return "q" if kind == "i" or arr.dtype.itemsize < 8 else "Q"
+        if kind == "f":
+            return "d"
+    elif isinstance(arr, array):
+        if arr.typecode in "fd":
+            return "d"
+        # Беззнаковые коды: значения uint64 не помещаются в int64
+        if arr.typecode in "BHILQ":
+            return "Q"
+        if arr.typecode in "bhilq":
+            return "q"
+    elif all(value.__class__ is int for value in arr):
+        if _INT64_MIN <= min(arr) and max(arr) <= _INT64_MAX:
+            return "q"
+    elif all(value.__class__ is float for value in arr):
+        return "d"
+    raise ValueError(
+        "Параллельная сортировка поддерживает целые числа int64, "
+        "uint64 и вещественные float64"
+    )
+
+
+def parallel_sort(arr: List[Any], workers: int = None,
+                  chunk_size: int = None, executor=None) -> List[Any]:
+    """
+    Параллельная сортировка чисел в общей памяти процессов.
+
+    Массив копируется в multiprocessing.shared_memory и делится на
+    части по chunk_size элементов; рабочие процессы сортируют части на
+    месте. Затем части сливаются: с NumPy - деревом попарных слияний,
+    уровни которого тоже выполняются параллельно, без NumPy -
+    k-путевым слиянием на куче (heapq.merge) в главном процессе.
+    Сортировка одной части выполняется без пула процессов.
+
+    Args:
+        arr: Список, array.array или numpy.ndarray целых (int64) или
+            вещественных чисел
+        workers: Количество процессов (по умолчанию - число ядер)
+        chunk_size: Размер части (по умолчанию n / workers, но не
+            меньше 50 000)
+        executor: Готовый пул процессов для повторного использования
+
+    Returns:
+        Отсортированный массив (тот же объект)
+
+    Сложность:
+        Временная: O((n/p) log n + n) при p процессах
+        Пространственная: O(n) общей памяти
+    """
+    n = len(arr)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Количество процессов должно быть положительным")
+    if chunk_size is None:
+        chunk_size = max(-(-n // workers), _MIN_PARALLEL_CHUNK)
+    if chunk_size < 1:
+        raise ValueError("Размер части должен быть положительным")
+    if n < 2:
+        return arr
+    typecode = _shared_typecode(arr)
+    if n <= chunk_size or (workers == 1 and executor is None):
+        # Одна часть: та же сортировка, что в рабочих процессах
+        if hasattr(arr, "shape"):
+            arr.sort()
+            return arr
+        try:
+            import numpy as np
+        except ImportError:
+            return store_result(arr, sorted(arr))
+        return store_result(arr, np.sort(np.asarray(arr, dtype=typecode)))
+
+    itemsize = array(typecode).itemsize
+    memory = shared_memory.SharedMemory(create=True, size=n * itemsize)
+    view = _shared_view(memory, typecode, n)
+    try:
+        if isinstance(view, memoryview):
+            view[:] = array(typecode, arr)
+        else:
+            view[:] = arr
+        bounds = list(range(0, n, chunk_size)) + [n]
+        tasks = [(memory.name, typecode, n, bounds[i], bounds[i + 1])
+                 for i in range(len(bounds) - 1)]
+        pool = executor or ProcessPoolExecutor(max_workers=workers)
+        try:
+            list(pool.map(_sort_shared_chunk, tasks))
+            if isinstance(view, memoryview):
+                result = list(heapq.merge(
+                    *(view[lo:hi] for _, _, _, lo, hi in tasks)
+                ))
+            else:
+                while len(bounds) > 2:
+                    merged = bounds[::2]
+                    if merged[-1] != n:
+                        merged.append(n)
+                    list(pool.map(_merge_shared_runs, [
+                        (memory.name, typecode, n, merged[i],
+                         merged[i + 1])
+                        for i in range(len(merged) - 1)
+                        if merged[i + 1] - merged[i] > chunk_size
+                    ]))
+                    bounds = merged
+                    chunk_size *= 2
+                result = view
+        finally:
+            if executor is None:
+                pool.shutdown()
+        store_result(arr, result)
+    finally:
+        _release(view)
+        del view
+        result = None
+        memory.close()
+        memory.unlink()
+    return arr
+
+
+# Массивы не длиннее порога сортируются вставками
+_SMALL_SORT_SIZE = 32
+# Количество проб для оценки формы данных
+_SAMPLE_SIZE = 128
+# Доля инверсий, при которой массив считается почти упорядоченным
+# (или почти обратным, если доля больше 1 - порога)
+_NEARLY_SORTED_INVERSIONS = 0.1
+# Доля различных значений в выборке, при которой целые с повторами
+# сортируются подсчетом
+_DUPLICATE_DISTINCT = 0.5
+# Начальное значение генератора выборки по умолчанию
+_SAMPLE_SEED = 2024
+
+
+def describe_input(arr: List[Any], sample_size: int = _SAMPLE_SIZE,
+                   rng: random.Random = None) -> dict:
+    """
+    Дешевая оценка формы массива по случайной выборке.
+
+    Args:
+        arr: Исходный массив
+        sample_size: Количество проб
+        rng: Генератор случайных чисел (по умолчанию - собственный
+            random.Random, состояние модуля random не меняется)
+
+    Returns:
+        Словарь:
+            descents - доля соседних пар arr[i] > arr[i + 1]
+                (оценка числа серий: около descents * n);
+            inversions - доля инверсий среди случайных пар i < j
+                (0 - отсортирован, 0.5 - случайный, 1 - обратный);
+            distinct - доля различных значений в выборке;
+            integers - все значения выборки целые;
+            key_range - max - min выборки для целых (оценка снизу),
+                иначе None.
+
+    Сложность: O(sample_size)
+    """
+    n = len(arr)
+    rng = rng or random.Random(_SAMPLE_SEED)
+    stats = {"descents": 0.0, "inversions": 0.0, "distinct": 1.0,
+             "integers": False, "key_range": None}
+    if n < 2:
+        return stats
+    # На коротких массивах выборка пропорциональна длине
+    count = max(1, min(sample_size, n // 8))
+    randrange = rng.randrange
+    positions = [randrange(n - 1) for _ in range(count)]
+    stats["descents"] = sum(
+        arr[i + 1] < arr[i] for i in positions
+    ) / count
+    inversions = pairs = 0
+    for i in positions:
+        j = randrange(n)
+        if i != j:
+            if j < i:
+                i, j = j, i
+            inversions += arr[j] < arr[i]
+            pairs += 1
+    stats["inversions"] = inversions / pairs if pairs else 0.0
+    sample = [arr[i] for i in positions]
+    stats["distinct"] = len(set(sample)) / count
+    stats["integers"] = all(value.__class__ is int for value in sample)
+    if stats["integers"]:
+        stats["key_range"] = max(sample) - min(sample)
+    return stats
+
+
+def _choose_sort(n: int, stats: dict):
+    """Выбор алгоритма по оценке формы массива."""
+    if n <= _SMALL_SORT_SIZE:
+        return insertion_sort
+    if stats["descents"] in (0.0, 1.0):
+        # В выборке нет смены направления: несколько длинных серий
+        return natural_merge_sort
+    if stats["integers"]:
+        # Диапазон выборки - оценка снизу: при редких ключах
+        # counting_sort сам переходит на поразрядную сортировку
+        if (stats["key_range"] < _COUNTING_RANGE_FACTOR * n
+                or stats["distinct"] <= _DUPLICATE_DISTINCT):
+            return counting_sort
+        return radix_sort
+    inversions = stats["inversions"]
+    if (inversions < _NEARLY_SORTED_INVERSIONS
+            or inversions > 1 - _NEARLY_SORTED_INVERSIONS):
+        return natural_merge_sort
+    return intro_sort
+
+
+def sort(arr: List[Any]) -> List[Any]:
+    """
+    Адаптивная сортировка: выбор алгоритма по форме данных.
+
+    По выборке из _SAMPLE_SIZE проб оцениваются серии, доля
+    инверсий, повторы и диапазон ключей (describe_input), затем:
+        - короткий массив - вставками;
+        - длинные готовые серии (отсортированный, обратный) -
+          естественное слияние, O(n);
+        - целые числа - линейная сортировка: подсчетом при малом
+          диапазоне или многих повторах, иначе поразрядная;
+        - почти упорядоченные значения - естественное слияние;
+        - остальное, в том числе с повторами - интроспективная
+          сортировка с трехчастным разбиением.
+
+    Args:
+        arr: Исходный массив (список, array.array или numpy.ndarray)
+
+    Returns:
+        Отсортированный массив (тот же объект)
+
+    Сложность:
+        Временная: O(n log n) в худшем случае, O(n) для готовых
+            серий и целых чисел
+        Пространственная: O(n)
+    """
+    if hasattr(arr, "shape"):
+        if arr.dtype.kind in "iu":
+            return integer_sort(arr)
+        arr.sort()
+        return arr
+    algorithm = _choose_sort(len(arr), describe_input(arr))
+    if algorithm is counting_sort or algorithm is radix_sort:
+        try:
+            return algorithm(arr)
+        except ValueError:
+            # Выборка состояла из целых, а весь массив - нет
+            return intro_sort(arr)
+    if isinstance(arr, array) and algorithm is not insertion_sort:
+        # Сортировки на месте со срезами работают со списком
+        return store_result(arr, algorithm(arr.tolist()))
+    return algorithm(arr)
+
+
 def is_sorted(arr: List[Any]) -> bool:
     """
     Проверка отсортированности массива.
@@ -196,6 +1065,11 @@ def test_sorting_correctness():
         ("Вставками", insertion_sort),
         ("Слиянием", merge_sort),
         ("Быстрая", quick_sort),
+        ("Интросорт", intro_sort),
+        ("Естественная", natural_merge_sort),
+        ("Подсчетом", counting_sort),
+        ("Поразрядная", radix_sort),
+        ("Адаптивная", sort),
     ]
 
     results = {}
@@ -0,0 +1,463 @@
+"""
+Unit-тесты для проверки корректности алгоритмов сортировки.
+"""
+
+from array import array
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from external_sort import external_sort, read_sorted_file
+from numpy_sorts import (
+    argsort_rows,
+    argsort_segments,
+    lexsort,
+    numpy_sort,
+    sort_many,
+    sort_rows,
+    sort_segments,
+)
+from sorts import (
+    counting_sort,
+    describe_input,
+    integer_sort,
+    intro_sort,
+    natural_merge_sort,
+    parallel_sort,
+    radix_sort,
+    sort,
+)
+
+
+def _datasets():
+    """Наборы данных разной формы, включая повторы и пустой массив."""
+    rng = random.Random(7)
+    return [
+        [],
+        [1],
+        [2, 1],
+        [rng.randint(0, 1000) for _ in range(500)],
+        [rng.randint(0, 3) for _ in range(500)],
+        list(range(300)),
+        list(range(300, 0, -1)),
+        list(range(150)) + list(range(150, 0, -1)),
+        [rng.random() for _ in range(200)],
+    ]
+
+
+class TestIntroSort(unittest.TestCase):
+    """Тесты интроспективной сортировки."""
+
+    def test_datasets(self):
+        """Совпадение с sorted на данных разной формы."""
+        for data in _datasets():
+            arr = data.copy()
+            self.assertIs(intro_sort(arr), arr)
+            self.assertEqual(arr, sorted(data))
+
+    def test_heap_fallback(self):
+        """При исчерпании глубины отрезок сортируется пирамидой."""
+        rng = random.Random(13)
+        data = [rng.randint(-50, 50) for _ in range(400)]
+        arr = data.copy()
+        self.assertIs(intro_sort(arr, max_depth=0), arr)
+        self.assertEqual(arr, sorted(data))
+        with self.assertRaises(ValueError):
+            intro_sort([2, 1], max_depth=-1)
+
+
+class _Keyed:
+    """Элемент, сравниваемый только по ключу (для проверки устойчивости)."""
+
+    def __init__(self, key, order):
+        """Ключ и исходная позиция."""
+        self.key = key
+        self.order = order
+
+    def __lt__(self, other):
+        """Сравнение по ключу."""
+        return self.key < other.key
+
+
+class TestNaturalMergeSort(unittest.TestCase):
+    """Тесты естественной сортировки слиянием."""
+
+    def test_datasets(self):
+        """Совпадение с sorted на данных разной формы."""
+        for data in _datasets():
+            arr = data.copy()
+            self.assertIs(natural_merge_sort(arr), arr)
+            self.assertEqual(arr, sorted(data))
+
+    def test_stable(self):
+        """Равные ключи сохраняют исходный порядок."""
+        rng = random.Random(3)
+        keys = [rng.randint(0, 10) for _ in range(1000)]
+        keys[200:400] = sorted(keys[200:400], reverse=True)
+        items = [_Keyed(key, order) for order, key in enumerate(keys)]
+        result = [(item.key, item.order)
+                  for item in natural_merge_sort(items)]
+        self.assertEqual(result, sorted(zip(keys, range(len(keys)))))
+
+    def test_runs(self):
+        """Готовые серии и галоп: длинная серия и вставки в нее."""
+        data = list(range(0, 3000, 3)) + list(range(1000, 0, -1))
+        self.assertEqual(natural_merge_sort(data.copy()), sorted(data))
+
+
+class TestIntegerSorts(unittest.TestCase):
+    """Тесты сортировки подсчетом и поразрядной сортировки."""
+
+    def setUp(self):
+        """Целые числа со знаком, в том числе за пределами int64."""
+        rng = random.Random(11)
+        self.small = [rng.randint(-40, 40) for _ in range(300)]
+        self.wide = [rng.randint(-10 ** 15, 10 ** 15) for _ in range(300)]
+        self.extreme = [-2 ** 63, 2 ** 63 - 1, 0, -1, 1, -2 ** 63]
+        self.huge = [rng.randint(-2 ** 70, 2 ** 70) for _ in range(100)]
+
+    def test_counting_sort(self):
+        """Сортировка подсчетом списка и array.array."""
+        arr = self.small.copy()
+        self.assertIs(counting_sort(arr), arr)
+        self.assertEqual(arr, sorted(self.small))
+        packed = array("i", self.small)
+        counting_sort(packed)
+        self.assertEqual(packed.tolist(), sorted(self.small))
+
+    def test_counting_sort_small_dtype(self):
+        """Ключи не переполняют исходный тип ndarray."""
+        for dtype in (np.int8, np.uint8, np.uint64):
+            info = np.iinfo(dtype)
+            data = np.array([info.max, info.min, 0, info.max - 1],
+                            dtype=dtype)
+            counting_sort(data)
+            self.assertEqual(data.tolist(),
+                             sorted([info.max, info.min, 0, info.max - 1]))
+
+    def test_counting_sort_sparse(self):
+        """Редкие ключи сортируются без массива счетчиков на диапазон."""
+        data = [10 ** 9, 0, 5, -10 ** 12]
+        for arr in (data.copy(), np.array(data)):
+            counting_sort(arr)
+            self.assertEqual(list(arr), sorted(data))
+        with mock.patch.dict(sys.modules, {"numpy": None}):
+            self.assertEqual(counting_sort(data.copy()), sorted(data))
+
+    def test_radix_sort(self):
+        """Поразрядная сортировка с разными размерами разряда."""
+        for data in (self.small, self.wide, self.extreme, self.huge):
+            for bits in (8, 11, 16):
+                arr = data.copy()
+                self.assertIs(radix_sort(arr, bits), arr)
+                self.assertEqual(arr, sorted(data))
+        with self.assertRaises(ValueError):
+            radix_sort([1, 2], 17)
+        with self.assertRaises(ValueError):
+            radix_sort([1.5, 2])
+
+    def test_python_backend(self):
+        """Реализация без NumPy."""
+        with mock.patch.dict(sys.modules, {"numpy": None}):
+            for data in (self.small, self.wide):
+                self.assertEqual(radix_sort(data.copy(), 11), sorted(data))
+                self.assertEqual(counting_sort(data.copy()), sorted(data))
+
+    def test_integer_sort(self):
+        """Выбор алгоритма по диапазону ключей."""
+        for data in (self.small, self.wide, []):
+            self.assertEqual(integer_sort(data.copy()), sorted(data))
+
+
+class TestParallelSort(unittest.TestCase):
+    """Тесты параллельной сортировки в общей памяти."""
+
+    def test_chunks(self):
+        """Неравные части, нечетное число частей и разные типы."""
+        rng = random.Random(5)
+        ints = [rng.randint(-10 ** 12, 10 ** 12) for _ in range(1001)]
+        floats = [rng.random() for _ in range(300)]
+        packed = array("i", [rng.randint(-99, 99) for _ in range(257)])
+        for chunk_size in (1, 64, 100, 5000):
+            arr = ints.copy()
+            self.assertIs(parallel_sort(arr, 3, chunk_size), arr)
+            self.assertEqual(arr, sorted(ints))
+        self.assertEqual(parallel_sort(floats.copy(), 2, 70), sorted(floats))
+        result = parallel_sort(array("i", packed), 2, 50)
+        self.assertEqual(result.typecode, "i")
+        self.assertEqual(result.tolist(), sorted(packed))
+
+    def test_unsigned(self):
+        """Беззнаковые значения больше int64 не меняют порядок."""
+        data = [2 ** 64 - 1, 0, 5, 2 ** 63]
+        for chunk_size in (1, 10):
+            result = parallel_sort(array("Q", data), 2, chunk_size)
+            self.assertEqual(result.typecode, "Q")
+            self.assertEqual(result.tolist(), sorted(data))
+        packed = array("B", [255, 0, 128, 7])
+        self.assertEqual(parallel_sort(packed, 2, 1).tolist(),
+                         [0, 7, 128, 255])
+
+    def test_invalid(self):
+        """Смешанные типы и неверные параметры."""
+        with self.assertRaises(ValueError):
+            parallel_sort([1, 2.5], 2, 1)
+        with self.assertRaises(ValueError):
+            parallel_sort([1, 2], 0)
+        with self.assertRaises(ValueError):
+            parallel_sort(array("u", "ba"), 2, 1)
+
+
+class TestExternalSort(unittest.TestCase):
+    """Тесты внешней сортировки файлов."""
+
+    def setUp(self):
+        """Временный каталог и случайные данные."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        rng = random.Random(9)
+        self.data = [rng.randint(-10 ** 12, 10 ** 12) for _ in range(3000)]
+
+    def _path(self, name):
+        """Путь во временном каталоге."""
+        return os.path.join(self.directory.name, name)
+
+    def test_binary_multipass(self):
+        """Двоичный файл, малый лимит памяти и несколько проходов."""
+        source, result = self._path("in.bin"), self._path("out.bin")
+        with open(source, "wb") as file:
+            array("q", self.data).tofile(file)
+        stats = external_sort(source, result, memory_limit=4096, fan_in=3)
+        self.assertEqual(stats["count"], len(self.data))
+        self.assertGreater(stats["runs"], 3)
+        self.assertGreater(stats["passes"], 1)
+        self.assertEqual(read_sorted_file(result).tolist(), sorted(self.data))
+
+    def test_text_and_empty(self):
+        """Текстовый формат и пустой файл."""
+        source, result = self._path("in.txt"), self._path("out.txt")
+        with open(source, "w", encoding="utf-8") as file:
+            file.write(" ".join(map(str, self.data[:1500])) + "\n")
+            file.write("\n".join(map(str, self.data[1500:])))
+        external_sort(source, result, memory_limit=8192, fan_in=2,
+                      file_format="text")
+        self.assertEqual(read_sorted_file(result, "text").tolist(),
+                         sorted(self.data))
+        empty = self._path("empty.bin")
+        open(empty, "wb").close()
+        stats = external_sort(empty, result)
+        self.assertEqual(stats["count"], 0)
+        self.assertEqual(os.path.getsize(result), 0)
+
+    def test_text_single_line(self):
+        """Одна строка на весь файл читается блоками в пределах лимита."""
+        source, result = self._path("line.txt"), self._path("out.txt")
+        data = self.data * 20
+        with open(source, "w", encoding="utf-8") as file:
+            file.write(" ".join(map(str, data)))
+        limit = 64 * 1024
+        tracemalloc.start()
+        try:
+            external_sort(source, result, memory_limit=limit,
+                          file_format="text")
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        # Сама строка файла - больше 10 лимитов
+        self.assertGreater(os.path.getsize(source), 10 * limit)
+        self.assertLess(peak, 8 * limit)
+        self.assertEqual(read_sorted_file(result, "text").tolist(),
+                         sorted(data))
+
+    def test_invalid(self):
+        """Неверные параметры и поврежденный файл."""
+        source = self._path("bad.bin")
+        with open(source, "wb") as file:
+            file.write(b"12345")
+        with self.assertRaises(ValueError):
+            external_sort(source, self._path("out.bin"))
+        with self.assertRaises(ValueError):
+            external_sort(source, self._path("out.bin"), fan_in=1)
+        with self.assertRaises(ValueError):
+            external_sort(source, self._path("out.bin"), file_format="csv")
+
+
+class TestAdaptiveSort(unittest.TestCase):
+    """Тесты адаптивной сортировки."""
+
+    def test_datasets(self):
+        """Совпадение с sorted на данных разной формы."""
+        rng = random.Random(17)
+        words = [str(rng.randint(0, 500)) for _ in range(400)]
+        for data in _datasets() + [words]:
+            arr = data.copy()
+            self.assertIs(sort(arr), arr)
+            self.assertEqual(arr, sorted(data))
+
+    def test_mixed_and_packed(self):
+        """Целые с единичным float и массивы array.array."""
+        data = list(range(2000, 0, -3)) + list(range(500))
+        data[700] = 0.5
+        self.assertEqual(sort(data.copy()), sorted(data))
+        rng = random.Random(19)
+        for typecode in ("i", "d"):
+            packed = array(typecode, [rng.randint(-99, 99)
+                                      for _ in range(300)])
+            result = sort(array(typecode, packed))
+            self.assertEqual(result.typecode, typecode)
+            self.assertEqual(result.tolist(), sorted(packed))
+
+    def test_describe_input(self):
+        """Оценка формы отсортированного, обратного и случайного."""
+        rng = random.Random(1)
+        ascending = describe_input(list(range(1000)), rng=rng)
+        self.assertEqual(ascending["descents"], 0.0)
+        self.assertEqual(ascending["inversions"], 0.0)
+        self.assertTrue(ascending["integers"])
+        descending = describe_input(list(range(1000, 0, -1)), rng=rng)
+        self.assertEqual(descending["descents"], 1.0)
+        self.assertEqual(descending["inversions"], 1.0)
+        floats = describe_input([rng.random() for _ in range(1000)],
+                                rng=rng)
+        self.assertFalse(floats["integers"])
+        self.assertIsNone(floats["key_range"])
+        self.assertTrue(0.2 < floats["inversions"] < 0.8)
+
+    def test_global_random_state(self):
+        """Выборка не меняет состояние модуля random."""
+        data = [random.Random(4).random() for _ in range(1000)]
+        random.seed(1)
+        expected = random.random()
+        random.seed(1)
+        describe_input(data)
+        sort(data)
+        self.assertEqual(random.random(), expected)
+
+    def test_integer_choice(self):
+        """Целые: подсчетом при малом диапазоне или повторах."""
+        rng = random.Random(23)
+        cases = [
+            ([rng.randint(0, 1000) for _ in range(2000)], "counting_sort"),
+            ([rng.choice((0, 10 ** 6, 10 ** 12)) for _ in range(2000)],
+             "counting_sort"),
+            ([rng.randint(-10 ** 12, 10 ** 12) for _ in range(2000)],
+             "radix_sort"),
+        ]
+        for data, expected in cases:
+            with mock.patch("sorts.counting_sort",
+                            wraps=counting_sort) as counting, \
+                    mock.patch("sorts.radix_sort",
+                               wraps=radix_sort) as radix:
+                self.assertEqual(sort(data.copy()), sorted(data))
+            chosen = counting if expected == "counting_sort" else radix
+            other = radix if chosen is counting else counting
+            self.assertTrue(chosen.called)
+            self.assertFalse(other.called)
+
+
+class TestNumpySorts(unittest.TestCase):
+    """Тесты сортировок на NumPy и пакетной сортировки."""
+
+    def test_numpy_sort(self):
+        """Список, array.array и ndarray сортируются на месте."""
+        for data in _datasets():
+            arr = data.copy()
+            self.assertIs(numpy_sort(arr), arr)
+            self.assertEqual(arr, sorted(data))
+        packed = array("i", [5, -1, 3])
+        self.assertEqual(numpy_sort(packed).tolist(), [-1, 3, 5])
+        matrix = np.array([3.5, 1.0, 2.0])
+        self.assertIs(numpy_sort(matrix), matrix)
+        self.assertEqual(matrix.tolist(), [1.0, 2.0, 3.5])
+
+    def test_numpy_sort_invalid(self):
+        """Разнотипные элементы и двумерный массив."""
+        data = [3, 1.5, 2]
+        with self.assertRaises(TypeError):
+            numpy_sort(data)
+        self.assertEqual(data, [3, 1.5, 2])
+        with self.assertRaises(ValueError):
+            numpy_sort(np.array([[2, 1], [4, 3]]))
+
+    def test_lexsort(self):
+        """Главный ключ первый, равные записи - в исходном порядке."""
+        groups = [2, 1, 2, 1, 1]
+        names = ["b", "c", "a", "a", "a"]
+        self.assertEqual(lexsort([groups, names]).tolist(),
+                         [3, 4, 1, 2, 0])
+        with self.assertRaises(ValueError):
+            lexsort([])
+
+    def test_rows(self):
+        """Строки двумерного массива сортируются независимо."""
+        rng = np.random.default_rng(2)
+        matrix = rng.integers(-50, 50, size=(300, 40))
+        result = sort_rows(matrix)
+        order = argsort_rows(matrix)
+        for row, sorted_row, row_order in zip(matrix, result, order):
+            self.assertEqual(sorted_row.tolist(), sorted(row.tolist()))
+            self.assertEqual(row[row_order].tolist(), sorted_row.tolist())
+        with self.assertRaises(ValueError):
+            sort_rows([1, 2, 3])
+
+    def test_segments(self):
+        """Отрезки близкой и сильно разной длины, NaN и строки."""
+        rng = random.Random(4)
+        cases = [
+            [[rng.randint(0, 9) for _ in range(rng.randint(0, 30))]
+             for _ in range(200)],
+            [[rng.random() for _ in range(400)], [0.5], [], [0.1, 0.2]],
+            [[float("nan"), 1.0, -1.0], [2.0, float("nan")]],
+            [["b", "a"], ["c"], ["z", "y", "x"]],
+        ]
+        for records in cases:
+            lengths = [len(record) for record in records]
+            offsets = np.concatenate(([0], np.cumsum(lengths)))
+            values = np.array([value for record in records
+                               for value in record])
+            result = sort_segments(values, offsets)
+            order = argsort_segments(values, offsets)
+            np.testing.assert_array_equal(values[order], result)
+            for i in range(len(records)):
+                lo, hi = offsets[i], offsets[i + 1]
+                np.testing.assert_array_equal(result[lo:hi],
+                                              np.sort(values[lo:hi]))
+                self.assertTrue(np.all((order[lo:hi] >= lo)
+                                       & (order[lo:hi] < hi)))
+        with self.assertRaises(ValueError):
+            sort_segments([1, 2, 3], [0, 2])
+        with self.assertRaises(ValueError):
+            sort_segments([1, 2, 3], [0, 2, 1, 3])
+
+    def test_sort_many(self):
+        """Записи одинаковой и разной длины."""
+        rng = random.Random(6)
+        equal = [[rng.randint(0, 99) for _ in range(20)]
+                 for _ in range(50)]
+        ragged = [record[:i % 21] for i, record in enumerate(equal)]
+        for records in (equal, ragged, []):
+            self.assertEqual(sort_many(records),
+                             [sorted(record) for record in records])
+        result = sort_many([[3, 1], [], [2]])
+        self.assertEqual(result, [[1, 3], [], [2]])
+        self.assertIs(result[0][0].__class__, int)
+
+    def test_sort_many_mixed(self):
+        """Записи разных типов не приводятся к общему."""
+        for records in ([["b", "a"], [3, 1]], [["b", "a"], [3]],
+                        [[3, 1], [1.5, 2.5]], [[3, 1.5]],
+                        [np.array([3, 1]), ["b", "a"]]):
+            with self.assertRaises(TypeError):
+                sort_many(records)
+        self.assertEqual(sort_many([np.array([3, 1]), [5, 4]]),
+                         [[1, 3], [4, 5]])
+
+
+if __name__ == '__main__':
+    unittest.main()